@@ -0,0 +1,370 @@
+"""Benchmark BinarySequence operations across sequence lengths.
+
+Run a sweep and store a JSON baseline:
+
+    python benchmarks/bench.py run --output benchmarks/baselines/main.json
+
+Compare two runs and flag regressions (exit code 1 if any):
+
+    python benchmarks/bench.py compare baseline.json new.json --threshold 0.15
+
+For every operation and length the sweep records the best time per call,
+throughput (bits/s), the tracemalloc peak while running one call, and the
+net number of allocated memory blocks still alive afterwards (including the
+result). Everything runs locally; NumPy backed operations are skipped if
+NumPy is not installed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import math
+import platform
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import UTC, datetime
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from bseqgen import prbs, random_sequence
+from bseqgen.base import BinarySequence
+from bseqgen.stream import chunked, count_ones, xor_streams
+
+Runner = Callable[[], object]
+
+
+class Benchmark(NamedTuple):
+    name: str
+    setup: Callable[[int], Runner]
+    max_n: int = 10**8
+    needs_numpy: bool = False
+    min_n: int = 1
+
+
+def _seq(n: int, seed: int = 1) -> BinarySequence:
+    return random_sequence(n, seed=seed)
+
+
+def _fresh(seq: BinarySequence) -> Callable[[], BinarySequence]:
+    """New instance per call, so cached properties are really computed."""
+    return lambda: BinarySequence._from_packed(seq._value, seq.length)
+
+
+def _construct_str(n: int) -> Runner:
+    text = _seq(n).bit_string
+    return lambda: BinarySequence(text)
+
+
+def _construct_list(n: int) -> Runner:
+    bits = list(_seq(n).bits)
+    return lambda: BinarySequence(bits)
+
+
+def _from_int(n: int) -> Runner:
+    value = _seq(n)._value
+    return lambda: BinarySequence.from_int(value, n)
+
+
+def _binary_op(op: str) -> Callable[[int], Runner]:
+    def setup(n: int) -> Runner:
+        a, b = _seq(n), _seq(n, seed=2)
+        method = getattr(a, op)
+        return lambda: method(b)
+
+    return setup
+
+
+def _unary(run: Callable[[BinarySequence], object]) -> Callable[[int], Runner]:
+    def setup(n: int) -> Runner:
+        seq = _seq(n)
+        return lambda: run(seq)
+
+    return setup
+
+
+def _cached_property(name: str) -> Callable[[int], Runner]:
+    def setup(n: int) -> Runner:
+        fresh = _fresh(_seq(n))
+        return lambda: getattr(fresh(), name)
+
+    return setup
+
+
+def _from_numpy(n: int) -> Runner:
+    array = _seq(n).to_numpy()
+    return lambda: BinarySequence.from_numpy(array)
+
+
+def _stream_xor_ones(n: int) -> Runner:
+    a, b = _seq(n), _seq(n, seed=2)
+    return lambda: count_ones(xor_streams(chunked(a), chunked(b)))
+
+
+def _linear_complexity(n: int) -> Runner:
+    from bseqgen.complexity import linear_complexity
+
+    seq = _seq(n)
+    return lambda: linear_complexity(seq)
+
+
+def _ber(n: int) -> Runner:
+    from bseqgen.ber import BERTester
+
+    received = prbs(31, n=n) ^ BinarySequence._from_packed(1 << (n // 2), n)
+
+    def run() -> None:
+        BERTester((31, 28)).update_stream(chunked(received))
+
+    return run
+
+
+def _scramble(n: int) -> Runner:
+    from bseqgen.scrambler import Scrambler
+
+    data = _seq(n)
+    return lambda: Scrambler((58, 39), "multiplicative").process(data)
+
+
+def _randomness(n: int) -> Runner:
+    from bseqgen.randomness import run_all
+
+    seq = _seq(n)
+    return lambda: run_all(seq)
+
+
+BENCHMARKS = (
+    Benchmark("construct_str", _construct_str),
+    Benchmark("construct_list", _construct_list, max_n=10**7),
+    Benchmark("from_int", _from_int),
+    Benchmark("shift", _unary(lambda s: s.shift(s.length // 3))),
+    Benchmark("slice", _unary(lambda s: s[s.length // 4 : 3 * s.length // 4])),
+    Benchmark("to_length", _unary(lambda s: s.to_length(2 * s.length + 1))),
+    Benchmark("xor", _binary_op("xor")),
+    Benchmark("bitwise_and", _binary_op("bitwise_and")),
+    Benchmark("bitwise_or", _binary_op("bitwise_or")),
+    Benchmark("hamming_distance", _binary_op("hamming_distance")),
+    Benchmark("inverted", _unary(lambda s: s.inverted())),
+    Benchmark("ones", _cached_property("ones")),
+    Benchmark("entropy", _cached_property("entropy")),
+    Benchmark("bits", _cached_property("bits"), max_n=10**7),
+    Benchmark("bit_string", _cached_property("bit_string")),
+    Benchmark("as_bytes", _cached_property("as_bytes")),
+    Benchmark("packed_bytes", _unary(lambda s: s.packed_bytes)),
+    Benchmark("hex_string", _unary(lambda s: s.hex_string)),
+    Benchmark("run_lengths", _cached_property("run_lengths"), max_n=10**7),
+    Benchmark("to_numpy", _unary(lambda s: s.to_numpy()), needs_numpy=True),
+    Benchmark("from_numpy", _from_numpy, needs_numpy=True),
+    Benchmark(
+        "autocorr", _unary(lambda s: s.autocorr()), max_n=10**6, needs_numpy=True
+    ),
+    Benchmark("random_sequence", lambda n: lambda: random_sequence(n, seed=1)),
+    Benchmark("prbs31", lambda n: lambda: prbs(31, n=n)),
+    Benchmark("stream_xor_ones", _stream_xor_ones),
+    Benchmark("linear_complexity", _linear_complexity, max_n=10**5),
+    Benchmark("ber", _ber, min_n=10**3),
+    Benchmark("scramble_58_39", _scramble),
+    Benchmark(
+        "randomness_run_all", _randomness, max_n=10**7, needs_numpy=True, min_n=10**3
+    ),
+)
+
+
+def _has_numpy() -> bool:
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _time(run: Runner, min_time: float, max_repeats: int) -> tuple[float, int]:
+    """Best seconds per call and the number of timed calls."""
+    best = math.inf
+    total = 0.0
+    repeats = 0
+    while repeats < max_repeats and (repeats == 0 or total < min_time):
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        total += elapsed
+        repeats += 1
+    return best, repeats
+
+
+def _memory(run: Runner) -> tuple[int, int]:
+    """(peak traced bytes, net allocated blocks) for one call."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        base_bytes = tracemalloc.get_traced_memory()[0]
+        base_blocks = sys.getallocatedblocks()
+        result = run()
+        blocks = sys.getallocatedblocks() - base_blocks
+        peak = tracemalloc.get_traced_memory()[1] - base_bytes
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak, blocks
+
+
+def run_benchmarks(
+    sizes: list[int],
+    names: set[str] | None,
+    min_time: float,
+    max_repeats: int,
+) -> list[dict[str, Any]]:
+    numpy_available = _has_numpy()
+    results = []
+    for bench in BENCHMARKS:
+        if names is not None and bench.name not in names:
+            continue
+        if bench.needs_numpy and not numpy_available:
+            print(f"skip {bench.name}: NumPy not installed", file=sys.stderr)
+            continue
+        for n in sizes:
+            if not bench.min_n <= n <= bench.max_n:
+                continue
+            run = bench.setup(n)
+            run()  # warm up imports and caches outside the measurements
+            seconds, repeats = _time(run, min_time, max_repeats)
+            peak, blocks = _memory(run)
+            row = {
+                "op": bench.name,
+                "n": n,
+                "seconds": seconds,
+                "bits_per_second": n / seconds if seconds else math.inf,
+                "peak_bytes": peak,
+                "allocated_blocks": blocks,
+                "repeats": repeats,
+            }
+            results.append(row)
+            print(
+                f"{bench.name:>20} n=1e{round(math.log10(n))}  "
+                f"{seconds * 1e3:10.3f} ms  {row['bits_per_second']:10.3g} bit/s  "
+                f"peak {peak / 1e6:9.3f} MB  blocks {blocks:+d}",
+                file=sys.stderr,
+            )
+            del run
+    return results
+
+
+def _metadata() -> dict[str, Any]:
+    try:
+        package_version = version("bseqgen")
+    except PackageNotFoundError:
+        package_version = "unknown"
+    try:
+        import numpy
+
+        numpy_version: str | None = numpy.__version__
+    except ImportError:
+        numpy_version = None
+    return {
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        "bseqgen": package_version,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "numpy": numpy_version,
+    }
+
+
+def compare(
+    baseline: dict[str, Any], current: dict[str, Any], threshold: float
+) -> list[str]:
+    """Print a comparison table; return the regressions found."""
+    base_rows = {(r["op"], r["n"]): r for r in baseline["results"]}
+    regressions = []
+    print(f"{'op':>20} {'n':>6} {'time':>8} {'peak mem':>9}")
+    for row in current["results"]:
+        key = (row["op"], row["n"])
+        base = base_rows.get(key)
+        if base is None:
+            continue
+        time_ratio = row["seconds"] / base["seconds"] if base["seconds"] else 1.0
+        memory_ratio = (
+            row["peak_bytes"] / base["peak_bytes"] if base["peak_bytes"] else 1.0
+        )
+        flags = []
+        if time_ratio > 1 + threshold:
+            flags.append("SLOWER")
+        # ignore small absolute memory changes (allocator noise)
+        if (
+            memory_ratio > 1 + threshold
+            and row["peak_bytes"] - base["peak_bytes"] > 4096
+        ):
+            flags.append("MORE MEMORY")
+        exponent = round(math.log10(row["n"]))
+        line = (
+            f"{row['op']:>20} {'1e' + str(exponent):>6} "
+            f"{time_ratio:7.2f}x {memory_ratio:8.2f}x  {' '.join(flags)}"
+        )
+        print(line)
+        if flags:
+            regressions.append(line.strip())
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmark sweep")
+    run_parser.add_argument("--min-exp", type=int, default=2, help="smallest 10^k")
+    run_parser.add_argument("--max-exp", type=int, default=8, help="largest 10^k")
+    run_parser.add_argument("--ops", help="comma separated operations (default: all)")
+    run_parser.add_argument(
+        "--min-time", type=float, default=0.2, help="seconds to time each case"
+    )
+    run_parser.add_argument("--max-repeats", type=int, default=1000)
+    run_parser.add_argument("--output", type=Path, help="write results as JSON")
+    run_parser.add_argument("--list", action="store_true", help="list operations")
+
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.15,
+        help="relative slow down / memory growth treated as a regression",
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        baseline = json.loads(args.baseline.read_text())
+        current = json.loads(args.current.read_text())
+        regressions = compare(baseline, current, args.threshold)
+        print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}")
+        return 1 if regressions else 0
+
+    if args.list:
+        print("\n".join(bench.name for bench in BENCHMARKS))
+        return 0
+
+    names = set(args.ops.split(",")) if args.ops else None
+    unknown = (names or set()) - {bench.name for bench in BENCHMARKS}
+    if unknown:
+        parser.error(f"unknown operations: {', '.join(sorted(unknown))}")
+
+    sizes = [10**k for k in range(args.min_exp, args.max_exp + 1)]
+    results = run_benchmarks(sizes, names, args.min_time, args.max_repeats)
+    report = {"metadata": _metadata(), "results": results}
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+    else:
+        print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,4 @@
-from .random_seq import random_sequence
+from .lfsr import LFSR, m_sequence, prbs
+from .random_seq import random_sequence, random_stream
 
-__all__ = ("random_sequence",)
+__all__ = ("random_sequence", "random_stream", "LFSR", "m_sequence", "prbs")
@@ -0,0 +1,82 @@
+"""Correlation kernels shared by `correlation` and `acquisition`."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, TypeAlias
+
+from .base import BinarySequence
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+    NpNDArrayFloat: TypeAlias = NDArray[np.floating[Any]]
+
+
+# below this length the packed-word direct method beats the FFT round trip
+FFT_MIN_LENGTH = 256
+
+
+def has_numpy() -> bool:
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def direct_correlate(a: BinarySequence, b: BinarySequence, periodic: bool) -> list[int]:
+    """Correlate with one XOR and popcount of packed values per lag.
+
+    Agreements minus disagreements over an overlap of m bits is
+    m - 2 * popcount(x ^ y).
+    """
+    n = a.length
+    a_value, b_value = a._value, b._value
+
+    if periodic:
+        mask = (1 << n) - 1
+        out = [n - 2 * (a_value ^ b_value).bit_count()]
+        for k in range(1, n):
+            rotated = ((b_value << k) | (b_value >> (n - k))) & mask
+            out.append(n - 2 * (a_value ^ rotated).bit_count())
+        return out
+
+    # aperiodic: lag -k pairs a[k:] with b[:n-k], lag +k pairs a[:n-k] with b[k:]
+    negative = [
+        (n - k) - 2 * ((a_value & ((1 << (n - k)) - 1)) ^ (b_value >> k)).bit_count()
+        for k in range(n - 1, 0, -1)
+    ]
+    positive = [
+        (n - k) - 2 * ((a_value >> k) ^ (b_value & ((1 << (n - k)) - 1))).bit_count()
+        for k in range(n)
+    ]
+    return negative + positive
+
+
+def signed_array(seq: BinarySequence) -> NpNDArrayFloat:
+    import numpy as np
+
+    return seq.to_numpy().astype(np.float64) * 2.0 - 1.0
+
+
+def fft_correlate(a: BinarySequence, b: BinarySequence, periodic: bool) -> list[int]:
+    """Correlate with real FFTs in O(n log n)."""
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError("NumPy is required for FFT correlation.") from e
+
+    n = a.length
+    size = n if periodic else 1 << (2 * n - 2).bit_length()
+
+    spectrum = np.conj(np.fft.rfft(signed_array(a), size)) * np.fft.rfft(
+        signed_array(b), size
+    )
+    values = np.rint(np.fft.irfft(spectrum, size)).astype(np.int64)
+
+    if not periodic:
+        values = np.concatenate((values[size - n + 1 :], values[:n]))
+
+    out: list[int] = values.tolist()
+    return out
@@ -0,0 +1,271 @@
+"""Code-phase acquisition: best circular shifts of a reference code"""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Iterator, Sequence
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, TypeAlias
+
+from ._correlate import FFT_MIN_LENGTH, direct_correlate, has_numpy
+from .base import BinarySequence
+from .batch import BinarySequenceBatch
+from .correlation import CorrelationMethod
+
+__all__ = ("AcquisitionResult", "CodeAcquirer")
+
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+    NpNDArrayFloat: TypeAlias = NDArray[np.floating[Any]]
+    NpNDArrayComplex: TypeAlias = NDArray[np.complexfloating[Any, Any]]
+
+Received: TypeAlias = "BinarySequence | Sequence[float] | NpNDArrayFloat"
+ReceivedMany: TypeAlias = (
+    "BinarySequenceBatch | Sequence[BinarySequence] | NpNDArrayFloat"
+)
+
+# received buffers correlated per FFT call in search_many, to bound memory
+_BLOCK_ROWS = 1024
+
+
+class AcquisitionResult(NamedTuple):
+    lag: int
+    peak: float
+
+
+class CodeAcquirer:
+    """Finds the circular shifts of a reference code that best match received data.
+
+    A lag k means the received buffer lines up with `reference.shift(k)`.
+    The reference spectrum is computed once, so each received buffer costs
+    one forward and one inverse real FFT (O(n log n)) instead of n shifts.
+
+    Received data is hard or soft:
+
+    - hard: a BinarySequence (or a BinarySequenceBatch / list of them for
+      many buffers), compared in the signed form (1 -> +1, 0 -> -1).
+    - soft: float samples (a list, or a 1D/2D NumPy array with one buffer
+      per row) where positive values mean bit 1, e.g. demodulator output.
+    """
+
+    def __init__(
+        self,
+        reference: BinarySequence,
+        method: CorrelationMethod | Literal["auto", "fft", "direct"] = "auto",
+    ) -> None:
+        """
+        Args:
+            reference (BinarySequence): Reference code.
+            method (CorrelationMethod | Literal['auto', 'fft', 'direct'], optional):
+                'fft' needs NumPy, 'direct' uses packed-word popcounts and only
+                accepts hard input, 'auto' picks FFT for long codes when NumPy
+                is installed. Defaults to 'auto'.
+        """
+        if not isinstance(reference, BinarySequence):
+            raise TypeError("CodeAcquirer requires a BinarySequence reference.")
+
+        method = CorrelationMethod(method)
+        if method == CorrelationMethod.AUTO:
+            method = (
+                CorrelationMethod.FFT
+                if reference.length >= FFT_MIN_LENGTH and has_numpy()
+                else CorrelationMethod.DIRECT
+            )
+        elif method == CorrelationMethod.FFT and not has_numpy():
+            raise ImportError("NumPy is required for FFT acquisition.")
+
+        self._reference = reference
+        self._method = method
+        self._spectrum: NpNDArrayComplex | None = None
+
+    @property
+    def reference(self) -> BinarySequence:
+        return self._reference
+
+    @property
+    def length(self) -> int:
+        return self._reference.length
+
+    @property
+    def method(self) -> CorrelationMethod:
+        return self._method
+
+    def correlate(self, received: Received, normalized: bool = False) -> list[float]:
+        """Periodic correlation of received with every shift of the reference.
+
+        Args:
+            received (Received): One received buffer (hard or soft).
+            normalized (bool, optional): Divide values by the code length.
+                Defaults to False.
+
+        Returns:
+            list[float]: Correlation at lag k at index k (ints for hard input
+                unless normalized).
+        """
+        values = self._correlate_one(received)
+        if normalized:
+            return [value / self.length for value in values]
+        return values
+
+    def search(
+        self,
+        received: Received,
+        top_k: int = 1,
+        magnitude: bool = False,
+        normalized: bool = False,
+    ) -> list[AcquisitionResult]:
+        """Best lags for one received buffer.
+
+        Args:
+            received (Received): One received buffer (hard or soft).
+            top_k (int, optional): Number of lags to return. Defaults to 1.
+            magnitude (bool, optional): Rank by absolute correlation, so an
+                inverted code (e.g. a flipped data bit) is also found.
+                Defaults to False.
+            normalized (bool, optional): Divide peaks by the code length.
+                Defaults to False.
+
+        Returns:
+            list[AcquisitionResult]: (lag, peak) pairs, strongest first.
+        """
+        self._check_top_k(top_k)
+        values = self.correlate(received, normalized)
+        if magnitude:
+            best = heapq.nlargest(
+                top_k, range(self.length), key=lambda k: abs(values[k])
+            )
+        else:
+            best = heapq.nlargest(top_k, range(self.length), key=values.__getitem__)
+        return [AcquisitionResult(lag, values[lag]) for lag in best]
+
+    def search_many(
+        self,
+        received: ReceivedMany,
+        top_k: int = 1,
+        magnitude: bool = False,
+        normalized: bool = False,
+    ) -> list[list[AcquisitionResult]]:
+        """Best lags for many received buffers against the cached reference.
+
+        Buffers are correlated in blocks with one 2D FFT per block (NumPy
+        required).
+
+        Args:
+            received (ReceivedMany): A BinarySequenceBatch, a list of
+                BinarySequence, or a 2D float array with one buffer per row.
+            top_k (int, optional): Number of lags per buffer. Defaults to 1.
+            magnitude (bool, optional): Rank by absolute correlation.
+                Defaults to False.
+            normalized (bool, optional): Divide peaks by the code length.
+                Defaults to False.
+
+        Returns:
+            list[list[AcquisitionResult]]: Results per buffer, in input order.
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ImportError("NumPy is required for search_many().") from e
+
+        self._check_top_k(top_k)
+        top_k = min(top_k, self.length)
+        hard = not isinstance(received, np.ndarray)
+
+        results: list[list[AcquisitionResult]] = []
+        for rows in self._signed_blocks(received):
+            values = self._fft_rows(rows)
+            if hard:
+                values = np.rint(values)
+            if normalized:
+                values /= self.length
+
+            score = np.abs(values) if magnitude else values
+            lags = np.argpartition(-score, top_k - 1, axis=1)[:, :top_k]
+            lag_scores = np.take_along_axis(score, lags, axis=1)
+            # strongest first, lower lag first on ties
+            order = np.lexsort((lags, -lag_scores), axis=1)
+            lags = np.take_along_axis(lags, order, axis=1)
+            peaks = np.take_along_axis(values, lags, axis=1)
+
+            for row_lags, row_peaks in zip(lags.tolist(), peaks.tolist(), strict=True):
+                if hard and not normalized:
+                    row_peaks = [int(peak) for peak in row_peaks]
+                results.append(
+                    [
+                        AcquisitionResult(lag, peak)
+                        for lag, peak in zip(row_lags, row_peaks, strict=True)
+                    ]
+                )
+        return results
+
+    def _check_top_k(self, top_k: int) -> None:
+        if not isinstance(top_k, int) or top_k <= 0:
+            raise ValueError("top_k must be a positive integer")
+
+    def _correlate_one(self, received: Received) -> list[float]:
+        if isinstance(received, BinarySequence):
+            if received.length != self.length:
+                raise ValueError(
+                    "Received data must be the same length as the reference."
+                )
+            if self._method == CorrelationMethod.DIRECT:
+                return list(direct_correlate(received, self._reference, periodic=True))
+
+        if self._method == CorrelationMethod.DIRECT:
+            raise ValueError("The direct method only accepts hard (bit) input.")
+
+        import numpy as np
+
+        if isinstance(received, BinarySequence):
+            rows = received.to_numpy().astype(np.float64)[np.newaxis] * 2.0 - 1.0
+            out: list[float] = np.rint(self._fft_rows(rows))[0].astype(int).tolist()
+            return out
+
+        samples = np.asarray(received, dtype=np.float64)
+        if samples.ndim != 1:
+            raise ValueError("Received samples must be 1D; use search_many().")
+        if samples.shape[0] != self.length:
+            raise ValueError("Received data must be the same length as the reference.")
+        soft: list[float] = self._fft_rows(samples[np.newaxis])[0].tolist()
+        return soft
+
+    def _signed_blocks(self, received: ReceivedMany) -> Iterator[NpNDArrayFloat]:
+        """2D float blocks of signed received buffers."""
+        import numpy as np
+
+        if isinstance(received, np.ndarray):
+            if received.ndim != 2:
+                raise ValueError("Received samples must be a 2D array.")
+            if received.shape[1] != self.length:
+                raise ValueError(
+                    "Received data must be the same length as the reference."
+                )
+            for start in range(0, received.shape[0], _BLOCK_ROWS):
+                yield received[start : start + _BLOCK_ROWS].astype(np.float64)
+            return
+
+        if not isinstance(received, BinarySequenceBatch):
+            received = BinarySequenceBatch.from_sequences(received)
+        if received.length != self.length:
+            raise ValueError("Received data must be the same length as the reference.")
+        packed = received.to_numpy(packed=True)
+        for start in range(0, packed.shape[0], _BLOCK_ROWS):
+            bits = np.unpackbits(
+                packed[start : start + _BLOCK_ROWS], axis=1, count=self.length
+            )
+            yield bits.astype(np.float64) * 2.0 - 1.0
+
+    def _fft_rows(self, rows: NpNDArrayFloat) -> NpNDArrayFloat:
+        """Periodic correlation of each row with the reference, via the cached
+        reference spectrum: R[k] = sum(r[i] * ref[i + k])."""
+        import numpy as np
+
+        n = self.length
+        if self._spectrum is None:
+            signed = self._reference.to_numpy().astype(np.float64) * 2.0 - 1.0
+            self._spectrum = np.fft.rfft(signed)
+        spectrum = np.conj(np.fft.rfft(rows, axis=1)) * self._spectrum
+        out: NpNDArrayFloat = np.fft.irfft(spectrum, n, axis=1)
+        return out
@@ -0,0 +1,354 @@
+"""Correlation analysis of whole code families.
+
+Cross-correlation of every pair of a K code family at every lag is
+O(K^2 n log n) work. `iter_pair_blocks` splits the pairs into blocks of rows
+and hands them to a process pool: the packed family is placed in shared
+memory once, each worker attaches to it, and block results stream back as
+soon as they are ready. `analyze_family` reduces the blocks to the family
+maximum and adds the peak autocorrelation sidelobe of every code.
+
+Correlation values follow `bseqgen.correlation`: signed (+1/-1) forms,
+periodic, value at lag k is sum(a[i] * b[i + k]).
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import sys
+from collections.abc import Iterable, Iterator
+from multiprocessing import get_context, shared_memory
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeAlias
+
+from .base import BinarySequence
+from .batch import BinarySequenceBatch
+from .correlation import correlate
+
+__all__ = (
+    "PairBlock",
+    "PairPeak",
+    "FamilyAnalysis",
+    "iter_pair_blocks",
+    "max_crosscorrelation",
+    "peak_sidelobes",
+    "analyze_family",
+    "is_preferred_pair",
+)
+
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+    NpNDArrayInt: TypeAlias = NDArray[np.integer[Any]]
+    NpNDArrayInt64: TypeAlias = NDArray[np.int64]
+    NpNDArrayComplex: TypeAlias = NDArray[np.complexfloating[Any, Any]]
+
+Family: TypeAlias = "BinarySequenceBatch | Iterable[BinarySequence] | NpNDArrayInt"
+
+# elements of one (rows, length) float block of correlations (~32 MB)
+_BLOCK_ELEMENTS = 1 << 22
+# up to this length single precision FFTs round to the exact integer values
+_FLOAT32_MAX_LENGTH = 1 << 16
+
+
+class PairBlock(NamedTuple):
+    """Cross-correlation maxima for every pair (i, j), i in rows, j in cols.
+
+    `peaks[a, b]` is the largest |R| over all lags for the pair
+    (rows[a], cols[b]) and `lags[a, b]` the first lag reaching it. Blocks on
+    the diagonal only cover pairs with i < j; other entries are -1.
+    """
+
+    rows: range
+    cols: range
+    peaks: NpNDArrayInt64
+    lags: NpNDArrayInt64
+
+
+class PairPeak(NamedTuple):
+    """Pair (first < second), lag and |R| of a cross-correlation peak."""
+
+    first: int
+    second: int
+    lag: int
+    value: int
+
+
+class FamilyAnalysis(NamedTuple):
+    max_crosscorrelation: PairPeak
+    peak_sidelobes: NpNDArrayInt64
+    max_sidelobe: int
+
+
+def _numpy() -> Any:
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError("NumPy is required for family analysis.") from e
+    return np
+
+
+def iter_pair_blocks(
+    family: Family,
+    length: int | None = None,
+    packed: bool = False,
+    processes: int | None = None,
+    block_rows: int | None = None,
+) -> Iterator[PairBlock]:
+    """Stream cross-correlation maxima over all pairs, block by block.
+
+    Blocks are yielded in completion order. With more than one process the
+    packed family is shared with the workers through shared memory, which
+    is released when the iterator is exhausted or closed.
+
+    Args:
+        family (Family): BinarySequenceBatch, iterable of equal length
+            BinarySequence objects, or 2D NumPy array (one code per row).
+        length (int | None, optional): Bits per row for packed arrays.
+            Defaults to None (8 bits per byte).
+        packed (bool, optional): Array rows are in `np.packbits` layout.
+            Defaults to False.
+        processes (int | None, optional): Worker processes; 1 computes in
+            the calling process. Defaults to None (os.cpu_count()).
+        block_rows (int | None, optional): Codes per block side. Defaults to
+            None (chosen from the code length and number of workers).
+
+    Yields:
+        PairBlock: Maxima for one block of pairs.
+    """
+    batch = _as_batch(family, length, packed)
+    count, n = len(batch), batch.length
+    if count < 2:
+        raise ValueError("Family analysis needs at least two sequences.")
+
+    workers = (os.cpu_count() or 1) if processes is None else processes
+    if workers < 1:
+        raise ValueError("processes must be at least 1.")
+    if block_rows is None:
+        block_rows = _default_block_rows(count, n, workers)
+    if block_rows < 1:
+        raise ValueError("block_rows must be at least 1.")
+
+    starts = range(0, count, block_rows)
+    tasks = [
+        (i, min(i + block_rows, count), j, min(j + block_rows, count))
+        for i in starts
+        for j in starts
+        if j >= i
+    ]
+    rows = batch.to_numpy(packed=True)
+
+    if workers == 1 or len(tasks) == 1:
+        cache: dict[tuple[int, int], Any] = {}
+        for task in tasks:
+            yield _pair_block(task, rows, n, cache)
+        return
+
+    shm = shared_memory.SharedMemory(create=True, size=rows.nbytes)
+    try:
+        np = _numpy()
+        np.ndarray(rows.shape, dtype=np.uint8, buffer=shm.buf)[:] = rows
+        with get_context().Pool(
+            min(workers, len(tasks)),
+            initializer=_init_worker,
+            initargs=(shm.name, rows.shape, n),
+        ) as pool:
+            yield from pool.imap_unordered(_worker_pair_block, tasks)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def max_crosscorrelation(
+    family: Family,
+    length: int | None = None,
+    packed: bool = False,
+    processes: int | None = None,
+    block_rows: int | None = None,
+) -> PairPeak:
+    """Largest periodic cross-correlation magnitude over all pairs and lags.
+
+    Args are as for `iter_pair_blocks`.
+
+    Returns:
+        PairPeak: The maximum; ties go to the smallest pair index.
+    """
+    np = _numpy()
+    best = PairPeak(-1, -1, -1, -1)
+    for block in iter_pair_blocks(family, length, packed, processes, block_rows):
+        a, b = np.unravel_index(int(np.argmax(block.peaks)), block.peaks.shape)
+        candidate = PairPeak(
+            block.rows[a], block.cols[b], int(block.lags[a, b]), int(block.peaks[a, b])
+        )
+        if (candidate.value, -candidate.first, -candidate.second) > (
+            best.value,
+            -best.first,
+            -best.second,
+        ):
+            best = candidate
+    return best
+
+
+def peak_sidelobes(
+    family: Family, length: int | None = None, packed: bool = False
+) -> NpNDArrayInt64:
+    """Largest |autocorrelation| at a non-zero lag, for every code.
+
+    Computed in the calling process; it is O(K n log n), negligible next to
+    the pairwise cross-correlation.
+
+    Returns:
+        NpNDArrayInt64: One peak sidelobe per code (0 for 1 bit codes).
+    """
+    np = _numpy()
+    batch = _as_batch(family, length, packed)
+    n = batch.length
+    out: NpNDArrayInt64 = np.zeros(len(batch), dtype=np.int64)
+    if n == 1:
+        return out
+
+    step = max(1, _BLOCK_ELEMENTS // n)
+    rows = batch.to_numpy(packed=True)
+    for start in range(0, len(batch), step):
+        spectra = _spectra(rows[start : start + step], n)
+        auto = np.fft.irfft(spectra.real**2 + spectra.imag**2, n, axis=1)
+        out[start : start + step] = np.rint(np.abs(auto[:, 1:]).max(axis=1))
+    return out
+
+
+def analyze_family(
+    family: Family,
+    length: int | None = None,
+    packed: bool = False,
+    processes: int | None = None,
+    block_rows: int | None = None,
+) -> FamilyAnalysis:
+    """Maximum cross-correlation and autocorrelation sidelobes of a family.
+
+    Args are as for `iter_pair_blocks`.
+
+    Returns:
+        FamilyAnalysis: Cross-correlation maximum, per code peak sidelobes
+            and their maximum.
+    """
+    batch = _as_batch(family, length, packed)
+    sidelobes = peak_sidelobes(batch)
+    return FamilyAnalysis(
+        max_crosscorrelation(batch, processes=processes, block_rows=block_rows),
+        sidelobes,
+        int(sidelobes.max()),
+    )
+
+
+def is_preferred_pair(a: BinarySequence, b: BinarySequence) -> bool:
+    """Check whether two m-sequences form a preferred pair.
+
+    A preferred pair of period 2^n - 1 has the three-valued periodic
+    cross-correlation {-1, -t(n), t(n) - 2} with t(n) = 2^((n + 2) // 2) + 1,
+    the property that bounds the cross-correlation of the Gold family built
+    from it.
+
+    Args:
+        a (BinarySequence): First m-sequence.
+        b (BinarySequence): Second m-sequence of the same length.
+
+    Returns:
+        bool: True for a preferred pair.
+    """
+    if a.length != b.length:
+        raise ValueError("is_preferred_pair requires sequences of the same length.")
+    degree = (a.length + 1).bit_length() - 1
+    if a.length != (1 << degree) - 1 or degree < 3 or degree % 4 == 0:
+        return False
+
+    t = (1 << ((degree + 2) // 2)) + 1
+    values = set(correlate(a, b))
+    return values <= {-1, -t, t - 2}
+
+
+# per process state of the pool workers
+_worker: dict[str, Any] = {}
+
+
+def _init_worker(name: str, shape: tuple[int, int], length: int) -> None:
+    """Attach a pool worker to the shared packed family."""
+    np = _numpy()
+    if sys.version_info >= (3, 13):
+        shm = shared_memory.SharedMemory(name=name, track=False)
+    else:
+        # the creating process owns (and unlinks) the segment
+        from multiprocessing import resource_tracker
+
+        shm = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+    _worker["shm"] = shm
+    _worker["rows"] = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+    _worker["length"] = length
+    _worker["cache"] = {}
+
+
+def _worker_pair_block(task: tuple[int, int, int, int]) -> PairBlock:
+    """`_pair_block` on the family attached by `_init_worker`."""
+    return _pair_block(task, _worker["rows"], _worker["length"], _worker["cache"])
+
+
+def _pair_block(
+    task: tuple[int, int, int, int],
+    rows: Any,
+    n: int,
+    cache: dict[tuple[int, int], Any],
+) -> PairBlock:
+    """Cross-correlation maxima of one block of pairs of the packed rows.
+
+    Consecutive tasks share their row block, so `cache` keeps the conjugate
+    spectra of the last one.
+    """
+    np = _numpy()
+    i0, i1, j0, j1 = task
+
+    row_spectra = cache.get((i0, i1))
+    if row_spectra is None:
+        cache.clear()
+        row_spectra = cache[i0, i1] = np.conj(_spectra(rows[i0:i1], n))
+    col_spectra = _spectra(rows[j0:j1], n)
+
+    peaks = np.full((i1 - i0, j1 - j0), -1, dtype=np.int64)
+    lags = np.full((i1 - i0, j1 - j0), -1, dtype=np.int64)
+    for a in range(i1 - i0):
+        first = max(j0, i0 + a + 1) - j0  # only pairs with i < j
+        if first >= j1 - j0:
+            continue
+        values = np.fft.irfft(row_spectra[a] * col_spectra[first:], n, axis=1)
+        magnitudes = np.abs(np.rint(values, out=values), out=values)
+        lags[a, first:] = magnitudes.argmax(axis=1)
+        peaks[a, first:] = magnitudes.max(axis=1)
+    return PairBlock(range(i0, i1), range(j0, j1), peaks, lags)
+
+
+def _spectra(rows: Any, length: int) -> NpNDArrayComplex:
+    """Real FFT of the signed (+1/-1) form of packed rows."""
+    np = _numpy()
+    dtype = np.float32 if length <= _FLOAT32_MAX_LENGTH else np.float64
+    signed = np.unpackbits(rows, axis=1, count=length).astype(dtype) * 2 - 1
+    out: NpNDArrayComplex = np.fft.rfft(signed, axis=1)
+    return out
+
+
+def _default_block_rows(count: int, length: int, workers: int) -> int:
+    """Block side keeping one block's correlations in memory, with enough
+    blocks (at least ~8 per worker) to balance the pool."""
+    by_memory = max(1, _BLOCK_ELEMENTS // length)
+    if workers == 1:
+        return min(count, by_memory)
+    sides = math.isqrt(16 * workers) + 1
+    return max(1, min(by_memory, math.ceil(count / sides)))
+
+
+def _as_batch(family: Family, length: int | None, packed: bool) -> BinarySequenceBatch:
+    if isinstance(family, BinarySequenceBatch):
+        return family
+    np = _numpy()
+    if isinstance(family, np.ndarray):
+        return BinarySequenceBatch.from_numpy(family, length, packed)
+    return BinarySequenceBatch.from_sequences(family)
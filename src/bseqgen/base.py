@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 import math
+import string
 from collections.abc import Iterator, Sequence
 from enum import StrEnum
-from itertools import groupby
-from typing import TYPE_CHECKING, Any, Literal, Self, TypeAlias
+from typing import TYPE_CHECKING, Any, Literal, Self, TypeAlias, TypeVar
 
 __all__ = ("Direction", "BinarySequence")
 
@@ -18,33 +18,168 @@ if TYPE_CHECKING:
     NpNDArrayInt: TypeAlias = NDArray[np.integer[Any]]
     NpDTypeInt: TypeAlias = np.dtype[np.integer[Any]]
 
+    from .correlation import CorrelationMode
+    from .views import SourceView
+
 
 class Direction(StrEnum):
     LEFT = "left"
     RIGHT = "right"
 
 
+_BYTES_TO_ASCII = bytes.maketrans(b"\x00\x01", b"01")
+_DROP_BIT_CHARS = str.maketrans("", "", "01")
+_ASCII_TO_BYTES = bytes.maketrans(b"01", b"\x00\x01")
+
+_T = TypeVar("_T")
+_set_attr = object.__setattr__
+
+
 class BinarySequence:
+    """Binary sequence stored as a packed integer.
+
+    Bit 0 of the sequence is the most significant bit of the packed value, so
+    the binary representation of the value (zero padded to length) reads the
+    same as `bit_string`.
+
+    Sequences are immutable and hashable. Derived values (bits, bit_string,
+    as_bytes, ones, entropy, run_lengths, ...) are computed on first access and
+    cached on the instance.
+    """
+
+    __slots__ = (
+        "_value",
+        "_length",
+        "_hash",
+        "_bits",
+        "_bit_string",
+        "_as_bytes",
+        "_ones",
+        "_entropy",
+        "_run_lengths",
+        "__weakref__",
+    )
+
+    _value: int
+    _length: int
+    _hash: int
+    _bits: tuple[int, ...]
+    _bit_string: str
+    _as_bytes: bytes
+    _ones: int
+    _entropy: float
+    _run_lengths: tuple[tuple[int, int], ...]
+
     def __init__(self, bits: Sequence[int | str] | str) -> None:
-        self.bits: tuple[int, ...] = self._validate_bits(bits)
+        value, length = self._validate_bits(bits)
+        self._init_packed(value, length)
+
+    @classmethod
+    def from_int(cls, value: int, length: int) -> Self:
+        """Create a BinarySequence from the binary digits of an int.
+
+        E.g. from_int(6, 4) >> 0110
+
+        Args:
+            value (int): Non-negative integer below 2**length.
+            length (int): Number of bits.
+
+        Returns:
+            BinarySequence: Binary Sequence.
+        """
+        if not isinstance(length, int) or length <= 0:
+            raise ValueError("length must be a positive integer")
+        if not isinstance(value, int) or not 0 <= value < (1 << length):
+            raise ValueError(f"value must be a non-negative int below 2**{length}")
+        return cls._from_packed(value, length)
+
+    @classmethod
+    def from_bytes(cls, data: bytes | bytearray, length: int | None = None) -> Self:
+        """Create a BinarySequence from bytes (inverse of `as_bytes`).
+
+        Args:
+            data (bytes | bytearray): Big endian bytes.
+            length (int | None, optional): Number of bits, taken from the end
+                of the data like the left padding of `as_bytes`.
+                Defaults to None (8 bits per byte).
+
+        Returns:
+            BinarySequence: Binary Sequence.
+        """
+        if not data:
+            raise ValueError("Input bits cannot be None or empty.")
+        return cls.from_int(
+            int.from_bytes(data, "big"), len(data) * 8 if length is None else length
+        )
+
+    @classmethod
+    def from_hex(cls, hex_str: str, length: int | None = None) -> Self:
+        """Create a BinarySequence from a hex string (inverse of `hex_string`).
+
+        Args:
+            hex_str (str): Hex digits, optionally prefixed with 0x.
+            length (int | None, optional): Number of bits, taken from the end
+                of the digits. Defaults to None (4 bits per digit).
+
+        Returns:
+            BinarySequence: Binary Sequence.
+        """
+        digits = hex_str.removeprefix("0x").removeprefix("0X")
+        if not digits or digits.strip(string.hexdigits):
+            raise ValueError("hex_str must contain only hex digits.")
+        return cls.from_int(
+            int(digits, 16), len(digits) * 4 if length is None else length
+        )
+
+    @classmethod
+    def _from_packed(cls, value: int, length: int) -> Self:
+        """Build a sequence from an already valid packed value (no validation).
+
+        Internal operations whose result is valid by construction use this to
+        skip `_validate_bits`.
+        """
+        seq = cls.__new__(cls)
+        seq._init_packed(value, length)
+        return seq
+
+    def _init_packed(self, value: int, length: int) -> None:
+        _set_attr(self, "_value", value)
+        _set_attr(self, "_length", length)
+        _set_attr(self, "_hash", hash((length, value)))
+
+    def _cache(self, name: str, value: _T) -> _T:
+        """Store a derived value on the (otherwise immutable) instance."""
+        _set_attr(self, name, value)
+        return value
 
     @staticmethod
-    def _validate_bits(input_bits: Sequence[int | str] | str) -> tuple[int, ...]:
-        """Validate input bit sequences."""
+    def _validate_bits(input_bits: Sequence[int | str] | str) -> tuple[int, int]:
+        """Validate input bit sequences.
+
+        Returns:
+            tuple[int, int]: Packed value and length.
+        """
         if (input_bits is None) or (not input_bits):
             raise ValueError("Input bits cannot be None or empty.")
 
+        # strings and bytes of 0/1 symbols are checked and packed in C
+        if isinstance(input_bits, str) and not input_bits.translate(_DROP_BIT_CHARS):
+            return int(input_bits, 2), len(input_bits)
         try:
-            bits_list: tuple[int, ...] = tuple(int(bit) for bit in input_bits)
+            bits_list: tuple[int, ...] = tuple(map(int, input_bits))
         except (TypeError, ValueError) as e:
             raise TypeError("Bits must be an iterable of 0 and 1 values.") from e
 
-        if any(bit not in (0, 1) for bit in bits_list):
+        try:
+            bits_bytes = bytes(bits_list)
+        except ValueError:
+            bits_bytes = b"\xff"
+        if bits_bytes.translate(None, b"\x00\x01"):
             raise ValueError("Bit sequence must only contain 0 or 1.")
 
-        return bits_list
+        return int(bits_bytes.translate(_BYTES_TO_ASCII), 2), len(bits_bytes)
 
-    def _compatible_bits(self, other: object, op: str) -> tuple[int, ...]:
+    def _compatible_bits(self, other: object, op: str) -> int:
         """Validate that other is a BinarySequence of the same length.
 
         Args:
@@ -52,13 +187,18 @@ class BinarySequence:
             op (str): Operation name used for error messages.
 
         Returns:
-            tuple[int, ...]: Other sequences bits as tuple of ints.
+            int: Other sequences packed value.
         """
         if not isinstance(other, BinarySequence):
             raise TypeError(f"{op} requires a BinarySequence.")
         if self.length != other.length:
             raise ValueError(f"{op} requires both sequences to be the same length.")
-        return other.bits
+        return other._value
+
+    @property
+    def _mask(self) -> int:
+        """All ones packed value for this sequence length."""
+        return (1 << self._length) - 1
 
     def __str__(self) -> str:
         return self.bit_string
@@ -66,10 +206,26 @@ class BinarySequence:
     def __repr__(self) -> str:
         return f"{type(self).__name__}(length={self.length}, preview='{str(self)}')"
 
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self) -> tuple[Any, tuple[int, int]]:
+        return (type(self).from_int, (self._value, self._length))
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, BinarySequence):
             return NotImplemented
-        return self.bits == other.bits
+        return (
+            self._hash == other._hash
+            and self._length == other._length
+            and self._value == other._value
+        )
+
+    def __hash__(self) -> int:
+        return self._hash
 
     def __len__(self) -> int:
         return self.length
@@ -79,8 +235,23 @@ class BinarySequence:
 
     def __getitem__(self, key: int | slice) -> int | BinarySequence:
         if isinstance(key, slice):
-            return BinarySequence(self.bits[key])
-        return self.bits[key]
+            start, stop, step = key.indices(self._length)
+            if step != 1:
+                return BinarySequence(self.bit_string[key])
+            if stop <= start:
+                raise ValueError("Input bits cannot be None or empty.")
+            length = stop - start
+            value = (self._value >> (self._length - stop)) & ((1 << length) - 1)
+            return BinarySequence._from_packed(value, length)
+        if key < 0:
+            key += self._length
+        if not 0 <= key < self._length:
+            raise IndexError("BinarySequence index out of range")
+        return (self._value >> (self._length - 1 - key)) & 1
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """Read-only buffer over `packed_bytes` (memoryview(seq), Python 3.12+)."""
+        return memoryview(self.packed_bytes)
 
     def __invert__(self) -> BinarySequence:
         """Return bitwise inversion of this BinarySequence (~seq).
@@ -112,28 +283,46 @@ class BinarySequence:
             return NotImplemented
         return self.bitwise_or(other)
 
+    @property
+    def bits(self) -> tuple[int, ...]:
+        """Bits as a tuple of ints (built on first access)."""
+        try:
+            return self._bits
+        except AttributeError:
+            bits = tuple(self.bit_string.encode().translate(_ASCII_TO_BYTES))
+            return self._cache("_bits", bits)
+
     @property
     def length(self) -> int:
         """Number of bits in sequence."""
-        return len(self.bits)
+        return self._length
 
     @property
     def bit_string(self) -> str:
         """Bit sequence as a string of '0's and '1's. No padding."""
-        bit_str: str = "".join("1" if bit else "0" for bit in self.bits)
-        return bit_str
+        try:
+            return self._bit_string
+        except AttributeError:
+            bit_str = format(self._value, f"0{self._length}b")
+            return self._cache("_bit_string", bit_str)
 
     @property
     def as_bytes(self) -> bytes:
         """Byte representation of bit sequence (left zero padded)"""
-        bit_str: str = self.bit_string
-        zero_padding_len: int = (-len(bit_str)) % 8
-        bit_str_padded: str = ("0" * zero_padding_len) + bit_str
-        byte_conversion: bytes = int(bit_str_padded, 2).to_bytes(
-            len(bit_str_padded) // 8, "big"
-        )
+        try:
+            return self._as_bytes
+        except AttributeError:
+            byte_conversion = self._value.to_bytes((self._length + 7) // 8, "big")
+            return self._cache("_as_bytes", byte_conversion)
+
+    @property
+    def packed_bytes(self) -> bytes:
+        """Bytes with the first bit as the most significant bit of byte 0.
 
-        return byte_conversion
+        Zero padded at the end, the same layout as `numpy.packbits`.
+        """
+        pad = -self._length % 8
+        return (self._value << pad).to_bytes((self._length + pad) // 8, "big")
 
     @property
     def hex_string(self) -> str:
@@ -148,7 +337,10 @@ class BinarySequence:
     @property
     def ones(self) -> int:
         """Return number of 1's in Binary Sequence"""
-        return sum(self.bits)
+        try:
+            return self._ones
+        except AttributeError:
+            return self._cache("_ones", self._value.bit_count())
 
     @property
     def zeros(self) -> int:
@@ -169,8 +361,10 @@ class BinarySequence:
             0.0 → fully deterministic (all 0s or all 1s)
             1.0 → maximally random (balanced 0/1)
         """
-        if self.length == 0:
-            return 0.0
+        try:
+            return self._entropy
+        except AttributeError:
+            pass
 
         p1 = self.ones / self.length
         p0 = 1.0 - p1
@@ -180,7 +374,7 @@ class BinarySequence:
         for p in (p1, p0):
             if p > 0:
                 entropy -= p * math.log2(p)
-        return round(entropy, 5)
+        return self._cache("_entropy", round(entropy, 5))
 
     @property
     def run_lengths(self) -> list[tuple[int, int]]:
@@ -188,11 +382,23 @@ class BinarySequence:
 
         E.g. 111001 >> [(1, 3), (0, 2), (1, 1)]
         """
-        return [(bit, sum(1 for _ in group)) for bit, group in groupby(self.bits)]
+        try:
+            return list(self._run_lengths)
+        except AttributeError:
+            from .runs import run_lengths
+
+            return list(self._cache("_run_lengths", tuple(run_lengths(self))))
+
+    def lazy(self) -> SourceView:
+        """Lazy view of the sequence for chained `to_length`, `shift`, slicing
+        and bitwise ops without intermediate copies (see `bseqgen.views`)."""
+        from .views import SourceView
+
+        return SourceView(self)
 
     def copy_bits(self) -> BinarySequence:
         """Return a copy of the BinarySequence."""
-        return BinarySequence(self.bits)
+        return BinarySequence._from_packed(self._value, self._length)
 
     def to_length(self, n: int) -> BinarySequence:
         """Repeat or truncate sequence to length n.
@@ -202,9 +408,11 @@ class BinarySequence:
         """
         if n <= 0:
             raise ValueError("Target length must be positive and not zero.")
-        repeats: int = (n + self.length - 1) // self.length
-        bits: tuple[int, ...] = (self.bits * repeats)[:n]
-        return BinarySequence(bits)
+        value, length = self._value, self._length
+        while length < n:
+            value = (value << length) | value
+            length *= 2
+        return BinarySequence._from_packed(value >> (length - n), n)
 
     def shift(
         self,
@@ -236,19 +444,71 @@ class BinarySequence:
 
         match direction:
             case Direction.LEFT:
-                return BinarySequence(self.bits[n:] + self.bits[:n])
+                return self._rotated_left(n)
             case Direction.RIGHT:
-                return BinarySequence(self.bits[-n:] + self.bits[:-n])
+                return self._rotated_left(self.length - n)
 
         raise ValueError(f"{direction} not a valid direction; 'left', 'right'")
 
-    def autocorr(self) -> Any:
-        raise NotImplementedError("Auto-correlation coming soon.")
+    def _rotated_left(self, n: int) -> BinarySequence:
+        """Circular left rotation of the packed value by 0 <= n <= length."""
+        value = self._value
+        rotated = ((value << n) | (value >> (self.length - n))) & self._mask
+        return BinarySequence._from_packed(rotated, self.length)
+
+    def autocorr(
+        self,
+        mode: CorrelationMode | Literal["periodic", "aperiodic"] = "periodic",
+        normalized: bool = False,
+    ) -> tuple[float, ...]:
+        """Auto-correlation of the signed (+1/-1) sequence over all lags.
+
+        Uses an FFT when NumPy is installed and the sequence is long, otherwise
+        packed-word popcounts. See `bseqgen.correlation.correlate`.
+
+        Args:
+            mode (CorrelationMode | Literal['periodic', 'aperiodic'], optional):
+                Periodic gives lags 0 .. n-1, aperiodic (zero padded) gives lags
+                -(n-1) .. n-1. Defaults to 'periodic'.
+            normalized (bool, optional): Divide by sequence length.
+                Defaults to False.
+
+        Returns:
+            tuple[float, ...]: Correlation per lag (ints unless normalized).
+        """
+        from .correlation import correlate
+
+        return correlate(self, self, mode=mode, normalized=normalized)
 
-    def crosscorr(self) -> Any:
-        raise NotImplementedError("Cross-correlation coming soon.")
+    def crosscorr(
+        self,
+        other: BinarySequence,
+        mode: CorrelationMode | Literal["periodic", "aperiodic"] = "periodic",
+        normalized: bool = False,
+    ) -> tuple[float, ...]:
+        """Cross-correlation with another BinarySequence of the same length.
+
+        The value at lag k is sum(self.signed[i] * other.signed[i + k]).
+
+        Args:
+            other (BinarySequence): Binary Sequence.
+            mode (CorrelationMode | Literal['periodic', 'aperiodic'], optional):
+                Periodic gives lags 0 .. n-1, aperiodic (zero padded) gives lags
+                -(n-1) .. n-1. Defaults to 'periodic'.
+            normalized (bool, optional): Divide by sequence length.
+                Defaults to False.
+
+        Returns:
+            tuple[float, ...]: Correlation per lag (ints unless normalized).
+        """
+        from .correlation import correlate
+
+        self._compatible_bits(other, "crosscorr")
+        return correlate(self, other, mode=mode, normalized=normalized)
 
-    def to_numpy(self, dtype: NpDTypeInt | None = None) -> NpNDArrayInt:
+    def to_numpy(
+        self, dtype: NpDTypeInt | None = None, packed: bool = False
+    ) -> NpNDArrayInt:
         """Convert BinarySequence to 1D NumPy array.
 
         NumPy is an optional dependency, only required when calling the to_numpy
@@ -256,29 +516,46 @@ class BinarySequence:
 
         Args:
             dtype (NpDTypeInt | None, optional): Optional NumPy integer dtype to use.
-                Defaults to None (which then uses np.uint8)
+                Defaults to None (which then uses np.uint8). Ignored when packed.
+            packed (bool, optional): Return the packed bytes as a read-only uint8
+                array in `np.packbits` layout (8 bits per element, zero padded at
+                the end) instead of one element per bit. Defaults to False.
 
         Returns:
-            NpNDArrayInt: 1D NumPy array of 0 and 1 values.
+            NpNDArrayInt: 1D NumPy array of 0 and 1 values, or packed bytes.
         """
         try:
             import numpy as np
         except ImportError as e:
             raise ImportError("NumPy is required for to_numpy().") from e
 
+        packed_array = np.frombuffer(self.packed_bytes, dtype=np.uint8)
+        if packed:
+            return packed_array
+
         out_dtype = dtype or np.uint8
         if not np.issubdtype(out_dtype, np.integer):
             raise TypeError(
                 "dtype must be an integer NumPy dtype (e.g., np.uint8, np.int8)."
             )
-        return np.array(self.bits, dtype=out_dtype)
+        bits = np.unpackbits(packed_array, count=self.length)
+        return bits if out_dtype == np.uint8 else bits.astype(out_dtype)
 
     @classmethod
-    def from_numpy(cls, np_array: NpNDArrayInt) -> Self:
+    def from_numpy(
+        cls, np_array: NpNDArrayInt, length: int | None = None, packed: bool = False
+    ) -> Self:
         """Convert 1D NumPy array to BinarySequence.
 
+        Boolean and packed input is converted without checking each bit. Other
+        integer arrays are range checked with one vectorized pass.
+
         Args:
             np_array (NpNDArrayInt): 1D NumPy Array of integers.
+            length (int | None, optional): Number of bits to read from packed
+                input. Defaults to None (8 bits per element).
+            packed (bool, optional): Input is uint8 in `np.packbits` layout.
+                Defaults to False.
 
         Returns:
             BinarySequence: Binary Sequence
@@ -297,20 +574,38 @@ class BinarySequence:
         if np_array.ndim != 1:
             raise ValueError("NumPy array must be 1D.")
 
+        if packed:
+            if np_array.dtype != np.uint8:
+                raise TypeError("Packed array dtype must be uint8.")
+            available = np_array.size * 8
+            length = available if length is None else length
+            if not 0 < length <= available:
+                raise ValueError(f"length must be between 1 and {available}.")
+            value = int.from_bytes(np_array.tobytes(), "big") >> (available - length)
+            return cls._from_packed(value, length)
+
         # integer or bool dtype
         if not np.issubdtype(np_array.dtype, np.integer) and np_array.dtype != np.bool_:
             raise TypeError("Array dtype must be integer or boolean.")
 
-        bits = tuple(int(bit) for bit in np_array.tolist())
+        if np_array.size == 0:
+            raise ValueError("Input bits cannot be None or empty.")
+
+        if np_array.dtype != np.bool_ and (np_array.min() < 0 or np_array.max() > 1):
+            raise ValueError("Bit sequence must only contain 0 or 1.")
 
-        return cls(bits)
+        return cls.from_numpy(
+            np.packbits(np_array.astype(np.bool_, copy=False)),
+            length=np_array.size,
+            packed=True,
+        )
 
     def inverted(self) -> BinarySequence:
         """Return inverted BinarySequence.
 
         E.g. 0 -> 1, 1 -> 0.
         """
-        return BinarySequence(tuple(1 - bit for bit in self.bits))
+        return BinarySequence._from_packed(self._value ^ self._mask, self.length)
 
     def xor(self, other: BinarySequence) -> BinarySequence:
         """XOR current BinarySequence with another of the same length.
@@ -321,10 +616,8 @@ class BinarySequence:
         Returns:
             BinarySequence: XOR result.
         """
-        other_sequence = self._compatible_bits(other, "xor")
-        return BinarySequence(
-            tuple(a ^ b for a, b in zip(self.bits, other_sequence, strict=True))
-        )
+        other_value = self._compatible_bits(other, "xor")
+        return BinarySequence._from_packed(self._value ^ other_value, self.length)
 
     def bitwise_and(self, other: BinarySequence) -> BinarySequence:
         """Bitwise AND with another BinarySequence of the same length.
@@ -335,10 +628,8 @@ class BinarySequence:
         Returns:
             BinarySequence: AND result.
         """
-        other_sequence = self._compatible_bits(other, "and")
-        return BinarySequence(
-            tuple(a & b for a, b in zip(self.bits, other_sequence, strict=True))
-        )
+        other_value = self._compatible_bits(other, "and")
+        return BinarySequence._from_packed(self._value & other_value, self.length)
 
     def bitwise_or(self, other: BinarySequence) -> BinarySequence:
         """Bitwise OR with another BinarySequence of the same length.
@@ -349,10 +640,17 @@ class BinarySequence:
         Returns:
             BinarySequence: OR result.
         """
-        other_sequence = self._compatible_bits(other, "or")
-        return BinarySequence(
-            tuple(a | b for a, b in zip(self.bits, other_sequence, strict=True))
-        )
+        other_value = self._compatible_bits(other, "or")
+        return BinarySequence._from_packed(self._value | other_value, self.length)
+
+    def hamming_distance(self, other: BinarySequence) -> int:
+        """Number of positions where this sequence and other differ.
+
+        Args:
+            other (BinarySequence): Binary Sequence of the same length.
 
-    def hamming_distance(self) -> Any:
-        raise NotImplementedError("Hamming distance coming soon")
+        Returns:
+            int: Hamming distance.
+        """
+        other_value = self._compatible_bits(other, "hamming_distance")
+        return (self._value ^ other_value).bit_count()
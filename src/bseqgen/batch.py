@@ -0,0 +1,339 @@
+"""Batches of equal length binary sequences backed by one packed 2D array"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any, Literal, Self, TypeAlias, overload
+
+from .base import BinarySequence, Direction
+
+__all__ = ("BinarySequenceBatch",)
+
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+    NpNDArrayInt: TypeAlias = NDArray[np.integer[Any]]
+    NpNDArrayUInt8: TypeAlias = NDArray[np.uint8]
+    NpNDArrayInt64: TypeAlias = NDArray[np.int64]
+    NpNDArrayFloat: TypeAlias = NDArray[np.float64]
+
+
+def _numpy() -> Any:
+    """NumPy module; batches cannot be built without it."""
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError("NumPy is required for BinarySequenceBatch.") from e
+    return np
+
+
+class BinarySequenceBatch:
+    """Many equal length binary sequences stored as packed rows.
+
+    Rows use the `numpy.packbits` layout (first bit in the most significant
+    bit of byte 0, zero padded at the end). Operations run on the whole 2D
+    array at once and accept either another batch with the same shape or a
+    single BinarySequence, which is broadcast against every row.
+
+    Batches are read-only; operations return new batches.
+    """
+
+    __slots__ = ("_packed", "_length")
+
+    def __init__(self, packed: NpNDArrayUInt8, length: int) -> None:
+        """
+        Args:
+            packed (NpNDArrayUInt8): 2D uint8 array of packed rows.
+            length (int): Bits per row.
+        """
+        np = _numpy()
+        if not isinstance(packed, np.ndarray):
+            raise TypeError("Input must be a NumPy array.")
+        if packed.ndim != 2 or packed.dtype != np.uint8:
+            raise ValueError("Packed rows must be a 2D uint8 array.")
+        if not isinstance(length, int) or length <= 0:
+            raise ValueError("length must be a positive integer")
+        if packed.shape[1] != (length + 7) // 8:
+            raise ValueError(f"Packed rows must have {(length + 7) // 8} bytes.")
+
+        packed = packed & _tail_mask(length)
+        packed.flags.writeable = False
+        self._packed: NpNDArrayUInt8 = packed
+        self._length: int = length
+
+    @classmethod
+    def _from_packed(cls, packed: NpNDArrayUInt8, length: int) -> Self:
+        """Wrap rows that already have clear padding bits (no copy or checks)."""
+        batch = cls.__new__(cls)
+        packed.flags.writeable = False
+        batch._packed = packed
+        batch._length = length
+        return batch
+
+    @classmethod
+    def from_sequences(cls, sequences: Iterable[BinarySequence]) -> Self:
+        """Stack equal length BinarySequence objects into a batch."""
+        np = _numpy()
+        sequences = list(sequences)
+        if not sequences:
+            raise ValueError("Batch needs at least one sequence.")
+        length = sequences[0].length
+        if any(seq.length != length for seq in sequences):
+            raise ValueError("Batch requires sequences of the same length.")
+        data = b"".join(seq.packed_bytes for seq in sequences)
+        rows = np.frombuffer(data, dtype=np.uint8).reshape(len(sequences), -1)
+        return cls._from_packed(rows, length)
+
+    @classmethod
+    def from_numpy(
+        cls, np_array: NpNDArrayInt, length: int | None = None, packed: bool = False
+    ) -> Self:
+        """Create a batch from a 2D NumPy array, one sequence per row.
+
+        Args:
+            np_array (NpNDArrayInt): 2D array of 0/1 values (integer or bool),
+                or packed uint8 rows when packed is set.
+            length (int | None, optional): Bits per row for packed input.
+                Defaults to None (8 bits per byte).
+            packed (bool, optional): Input rows are in `np.packbits` layout.
+                Defaults to False.
+
+        Returns:
+            BinarySequenceBatch: Batch.
+        """
+        np = _numpy()
+        if not isinstance(np_array, np.ndarray):
+            raise TypeError("Input must be a NumPy array.")
+        if np_array.ndim != 2:
+            raise ValueError("NumPy array must be 2D.")
+
+        if packed:
+            if np_array.dtype != np.uint8:
+                raise TypeError("Packed array dtype must be uint8.")
+            available = np_array.shape[1] * 8
+            length = available if length is None else length
+            if not 0 < length <= available:
+                raise ValueError(f"length must be between 1 and {available}.")
+            return cls(np_array[:, : (length + 7) // 8], length)
+
+        if not np.issubdtype(np_array.dtype, np.integer) and np_array.dtype != np.bool_:
+            raise TypeError("Array dtype must be integer or boolean.")
+        if np_array.size == 0:
+            raise ValueError("Input bits cannot be None or empty.")
+        if np_array.dtype != np.bool_ and (np_array.min() < 0 or np_array.max() > 1):
+            raise ValueError("Bit sequence must only contain 0 or 1.")
+
+        rows = np.packbits(np_array.astype(np.bool_, copy=False), axis=1)
+        return cls._from_packed(rows, np_array.shape[1])
+
+    def to_numpy(self, packed: bool = False) -> NpNDArrayUInt8:
+        """2D uint8 array with one row per sequence.
+
+        Args:
+            packed (bool, optional): Return the read-only packed rows instead of
+                one element per bit. Defaults to False.
+
+        Returns:
+            NpNDArrayUInt8: Unpacked bits or packed rows.
+        """
+        if packed:
+            return self._packed
+        out: NpNDArrayUInt8 = _numpy().unpackbits(
+            self._packed, axis=1, count=self._length
+        )
+        return out
+
+    def to_sequences(self) -> list[BinarySequence]:
+        """Convert every row to a BinarySequence."""
+        return list(self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(rows={len(self)}, length={self._length})"
+
+    def __len__(self) -> int:
+        return int(self._packed.shape[0])
+
+    def __iter__(self) -> Iterator[BinarySequence]:
+        for row in range(len(self)):
+            yield self._row(row)
+
+    @overload
+    def __getitem__(self, key: int) -> BinarySequence: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> BinarySequenceBatch: ...
+
+    def __getitem__(self, key: int | slice) -> BinarySequence | BinarySequenceBatch:
+        if isinstance(key, slice):
+            rows = self._packed[key]
+            if rows.shape[0] == 0:
+                raise ValueError("Batch needs at least one sequence.")
+            return BinarySequenceBatch._from_packed(rows, self._length)
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("BinarySequenceBatch index out of range")
+        return self._row(key)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BinarySequenceBatch):
+            return NotImplemented
+        return self._length == other._length and bool(
+            _numpy().array_equal(self._packed, other._packed)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __invert__(self) -> BinarySequenceBatch:
+        return self.inverted()
+
+    def __xor__(self, other: object) -> BinarySequenceBatch:
+        if not isinstance(other, BinarySequence | BinarySequenceBatch):
+            return NotImplemented
+        return self.xor(other)
+
+    def __and__(self, other: object) -> BinarySequenceBatch:
+        if not isinstance(other, BinarySequence | BinarySequenceBatch):
+            return NotImplemented
+        return self.bitwise_and(other)
+
+    def __or__(self, other: object) -> BinarySequenceBatch:
+        if not isinstance(other, BinarySequence | BinarySequenceBatch):
+            return NotImplemented
+        return self.bitwise_or(other)
+
+    @property
+    def length(self) -> int:
+        """Number of bits in each sequence."""
+        return self._length
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """(number of sequences, bits per sequence)."""
+        return len(self), self._length
+
+    @property
+    def ones(self) -> NpNDArrayInt64:
+        """Number of 1's in each sequence."""
+        np = _numpy()
+        out: NpNDArrayInt64 = np.bitwise_count(self._packed).sum(axis=1, dtype=np.int64)
+        return out
+
+    @property
+    def zeros(self) -> NpNDArrayInt64:
+        """Number of 0's in each sequence."""
+        return self._length - self.ones
+
+    @property
+    def balance(self) -> NpNDArrayFloat:
+        """Fraction of 1's in each sequence (0-1), rounded like BinarySequence."""
+        out: NpNDArrayFloat = _numpy().round(self.ones / self._length, 3)
+        return out
+
+    @property
+    def entropy(self) -> NpNDArrayFloat:
+        """Shannon entropy (bits per symbol) of each sequence's 0/1 balance."""
+        np = _numpy()
+        p1 = self.ones / self._length
+        p0 = 1.0 - p1
+        with np.errstate(divide="ignore", invalid="ignore"):
+            terms = np.nan_to_num(p1 * np.log2(p1)) + np.nan_to_num(p0 * np.log2(p0))
+        out: NpNDArrayFloat = np.round(-terms, 5) + 0.0
+        return out
+
+    @property
+    def run_lengths(self) -> list[list[tuple[int, int]]]:
+        """Run lengths [(digit, run count)] of each sequence."""
+        np = _numpy()
+        bits = self.to_numpy()
+        boundaries = bits[:, 1:] != bits[:, :-1]
+        out = []
+        for row_bits, row_boundaries in zip(bits, boundaries, strict=True):
+            starts = np.concatenate(([0], np.flatnonzero(row_boundaries) + 1))
+            counts = np.diff(np.append(starts, self._length))
+            out.append(
+                list(zip(row_bits[starts].tolist(), counts.tolist(), strict=True))
+            )
+        return out
+
+    def inverted(self) -> BinarySequenceBatch:
+        """Invert every sequence."""
+        return self._from_packed(~self._packed & _tail_mask(self._length), self._length)
+
+    def xor(self, other: BinarySequence | BinarySequenceBatch) -> BinarySequenceBatch:
+        """Row-wise XOR with a batch of the same shape, or with one sequence."""
+        return self._from_packed(
+            self._packed ^ self._operand(other, "xor"), self._length
+        )
+
+    def bitwise_and(
+        self, other: BinarySequence | BinarySequenceBatch
+    ) -> BinarySequenceBatch:
+        """Row-wise AND with a batch of the same shape, or with one sequence."""
+        return self._from_packed(
+            self._packed & self._operand(other, "and"), self._length
+        )
+
+    def bitwise_or(
+        self, other: BinarySequence | BinarySequenceBatch
+    ) -> BinarySequenceBatch:
+        """Row-wise OR with a batch of the same shape, or with one sequence."""
+        return self._from_packed(
+            self._packed | self._operand(other, "or"), self._length
+        )
+
+    def hamming_distance(
+        self, other: BinarySequence | BinarySequenceBatch
+    ) -> NpNDArrayInt64:
+        """Hamming distance of each row to other (row-wise or broadcast)."""
+        np = _numpy()
+        diff = self._packed ^ self._operand(other, "hamming_distance")
+        out: NpNDArrayInt64 = np.bitwise_count(diff).sum(axis=1, dtype=np.int64)
+        return out
+
+    def shift(
+        self,
+        n: int,
+        direction: Direction | Literal["left", "right"] = Direction.LEFT,
+    ) -> BinarySequenceBatch:
+        """Circularly shift every sequence by n bits (see BinarySequence.shift)."""
+        np = _numpy()
+        direction = Direction(direction)
+        n %= self._length
+        if direction == Direction.RIGHT:
+            n = (self._length - n) % self._length
+        if n == 0:
+            return self
+        rolled = np.roll(self.to_numpy(), -n, axis=1)
+        return self._from_packed(np.packbits(rolled, axis=1), self._length)
+
+    def _row(self, index: int) -> BinarySequence:
+        row = self._packed[index]
+        pad = row.size * 8 - self._length
+        value = int.from_bytes(row.tobytes(), "big") >> pad
+        return BinarySequence._from_packed(value, self._length)
+
+    def _operand(self, other: object, op: str) -> NpNDArrayUInt8:
+        """Packed operand for a binary op, broadcastable against the rows."""
+        if isinstance(other, BinarySequence):
+            if other.length != self._length:
+                raise ValueError(f"{op} requires sequences of the same length.")
+            np = _numpy()
+            row: NpNDArrayUInt8 = np.frombuffer(other.packed_bytes, dtype=np.uint8)
+            return row
+        if isinstance(other, BinarySequenceBatch):
+            if other.shape != self.shape:
+                raise ValueError(f"{op} requires batches of the same shape.")
+            return other._packed
+        raise TypeError(f"{op} requires a BinarySequence or BinarySequenceBatch.")
+
+
+def _tail_mask(length: int) -> NpNDArrayUInt8:
+    """Byte mask clearing the padding bits after length bits."""
+    np = _numpy()
+    mask = np.full((length + 7) // 8, 0xFF, dtype=np.uint8)
+    mask[-1] = (0xFF << (-length % 8)) & 0xFF
+    out: NpNDArrayUInt8 = mask
+    return out
@@ -0,0 +1,497 @@
+"""Bit error rate testing of a received stream against a known pattern.
+
+`BERTester` takes the received bits as a stream of BinarySequence chunks of
+any size. While unlocked it hunts for the phase of the reference pattern;
+once locked, each chunk is compared in one go: the expected bits are
+generated for the whole chunk (an LFSR block step, or the periodic
+extension of a reference sequence), XORed with the received bits and
+counted with a popcount.
+
+Hunting an LFSR pattern is word level too: XORing the packed bits with
+themselves shifted by every tap gives the recurrence syndrome of every
+position, and the first `sync_bits` long stretch without a syndrome bit is
+an error free window at some phase of the pattern. A reference sequence is
+hunted by looking up received words in an index of its windows.
+
+The compared bits are split into blocks of `loss_bits` counted from the
+lock, across chunk boundaries. Once a block has more than
+`loss_threshold * loss_bits` errors it is taken as a slip: hunting restarts
+at the error that went over the threshold and counting resumes at the new
+phase, wherever the chunk boundaries fall.
+
+Errors are also reported per window of `window_bits` compared bits, and
+error runs (from `bseqgen.runs`) closer than `burst_gap` correct bits are
+grouped into bursts.
+"""
+
+from __future__ import annotations
+
+import math
+import struct
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import compress
+from operator import itemgetter
+from typing import NamedTuple
+
+from .base import BinarySequence
+from .lfsr import LFSR
+from .polynomials import degree, poly_from_taps, poly_to_taps
+from .runs import _first_bit, _run_bounds
+
+__all__ = ("ErrorBurst", "BERResult", "BERTester")
+
+
+class ErrorBurst(NamedTuple):
+    """Errors less than `burst_gap` correct bits apart.
+
+    `start` is the position of the first error in the received stream and
+    `length` the number of bits up to and including the last error.
+    """
+
+    start: int
+    length: int
+    errors: int
+
+
+class BERResult(NamedTuple):
+    """Totals of a `BERTester`.
+
+    `bits` counts compared bits (received while locked), `unsynced_bits`
+    the bits skipped while hunting for the pattern phase.
+    """
+
+    bits: int
+    errors: int
+    ber: float
+    sync_losses: int
+    unsynced_bits: int
+    bursts: tuple[ErrorBurst, ...]
+    window_ber: tuple[float, ...]
+
+
+class _Pattern(ABC):
+    """Expected bit source that can lock onto received bits."""
+
+    min_sync_bits = 1
+
+    @abstractmethod
+    def hunt(self, value: int, length: int, sync_bits: int) -> int | None:
+        """Lock at the first error free sync window of the packed bits and
+        return its offset (None if there is none)."""
+
+    @abstractmethod
+    def expected(self, n: int) -> int:
+        """Packed next n bits of the pattern at the locked phase."""
+
+
+class _LFSRPattern(_Pattern):
+    def __init__(self, poly: int) -> None:
+        self._poly = poly
+        self._degree = degree(poly)
+        self._taps = poly_to_taps(poly)
+        self._lfsr: LFSR | None = None
+        # every seed bit is checked by the recurrence within the window
+        self.min_sync_bits = 2 * self._degree
+
+    def hunt(self, value: int, length: int, sync_bits: int) -> int | None:
+        n = self._degree
+        if length < sync_bits:
+            return None
+        # bit j (position length - 1 - j) is set where s[t] = XOR s[t - e]
+        syndrome = value
+        for tap in self._taps:
+            syndrome ^= value >> tap
+        valid = ~syndrome & ((1 << (length - n)) - 1)
+        # recurrence holds for the sync_bits - n positions after the seed,
+        # and the window is not all zeros
+        starts = _run_starts(valid, sync_bits - n) << n
+        starts &= ~_run_starts(~value & ((1 << length) - 1), sync_bits)
+        if not starts:
+            return None
+        top = starts.bit_length() - 1
+        offset = length - 1 - top
+        seed = (value >> (top + 1 - n)) & ((1 << n) - 1)
+        self._lfsr = LFSR(self._poly, seed=seed)
+        return offset
+
+    def expected(self, n: int) -> int:
+        if self._lfsr is None:
+            raise RuntimeError("The pattern is not locked.")
+        return self._lfsr.next_bits(n)._value
+
+
+class _PeriodicPattern(_Pattern):
+    """Repeating reference sequence, hunted through an index of its windows.
+
+    Every `key`-bit window of the reference maps to its phase, with `key` at
+    most half of `sync_bits`: an error free sync window then contains one of
+    the received key windows at multiples of `key`, so only those are looked
+    up.
+    """
+
+    def __init__(self, reference: BinarySequence) -> None:
+        self._reference = reference
+        self._phase = 0
+        self._key = 0
+        # first phase of every key window, and all phases of repeated ones
+        self._phases: dict[int, int] = {}
+        self._repeats: dict[int, list[int]] = {}
+
+    def _index(self, sync_bits: int) -> int:
+        """Index the reference windows for sync_bits; returns the key bits."""
+        period = self._reference.length
+        key = min(period, (sync_bits + 1) // 2, 64)
+        if key >= 8:
+            # whole bytes, unpacked in bulk by _words
+            key = 1 << (key.bit_length() - 1)
+        if key != self._key:
+            text = self._reference.bit_string
+            text += text[: key - 1]
+            phases: dict[int, int] = {}
+            repeats: dict[int, list[int]] = {}
+            for phase in range(period):
+                window = int(text[phase : phase + key], 2)
+                first = phases.setdefault(window, phase)
+                if first != phase:
+                    repeats.setdefault(window, [first]).append(phase)
+            self._key, self._phases, self._repeats = key, phases, repeats
+        return key
+
+    def hunt(self, value: int, length: int, sync_bits: int) -> int | None:
+        if length < sync_bits:
+            return None
+        period = self._reference.length
+        key = self._index(sync_bits)
+        last = length - sync_bits
+        starts = range(0, length - key + 1, key)
+        hits = map(self._phases.__contains__, _words(value, length, key))
+
+        for at in compress(starts, hits):
+            # sync windows from lo to hi contain the key window at `at`
+            lo, hi = max(0, at + key - sync_bits), min(at, last)
+            size = hi - lo + sync_bits
+            received = (value >> (length - lo - size)) & ((1 << size) - 1)
+            word = (value >> (length - at - key)) & ((1 << key) - 1)
+            best = None
+            for phase in self._repeats.get(word, [self._phases[word]]):
+                start = (phase - at + lo) % period
+                match = ~(received ^ self._window(start, size)) & ((1 << size) - 1)
+                found = _run_starts(match, sync_bits)
+                if found and (best is None or found.bit_length() > best[0]):
+                    best = (found.bit_length(), start)
+            if best is not None:
+                offset = lo + size - best[0]
+                self._phase = (best[1] + offset - lo) % period
+                return offset
+        return None
+
+    def expected(self, n: int) -> int:
+        value = self._window(self._phase, n)
+        self._phase = (self._phase + n) % self._reference.length
+        return value
+
+    def _window(self, phase: int, n: int) -> int:
+        """Packed n bits of the periodic reference from phase."""
+        return self._reference._rotated_left(phase).to_length(n)._value
+
+
+_WORD_FORMATS = {8: "B", 16: ">H", 32: ">I", 64: ">Q"}
+
+
+def _words(value: int, length: int, key: int) -> Iterator[int]:
+    """Packed key-bit windows at offsets 0, key, 2 key, ... of the bits."""
+    count = length // key
+    value >>= length - count * key
+    fmt = _WORD_FORMATS.get(key)
+    if fmt is None:
+        text = format(value, f"0{count * key}b")
+        return (int(text[at : at + key], 2) for at in range(0, count * key, key))
+    data = value.to_bytes(count * key // 8, "big")
+    return map(itemgetter(0), struct.iter_unpack(fmt, data))
+
+
+def _run_starts(mask: int, k: int) -> int:
+    """Bits j of mask with bits j, j - 1, ..., j - k + 1 all set."""
+    span = 1
+    while span < k and mask:
+        step = min(span, k - span)
+        mask &= mask << step
+        span += step
+    return mask
+
+
+class BERTester:
+    """Streaming bit error rate tester with automatic pattern lock.
+
+    Feed received chunks with `update` (or `update_stream`) and read the
+    totals with `result`. Bits that do not yet fill a sync window are held
+    over to the next chunk, so chunks may be any size.
+    """
+
+    def __init__(
+        self,
+        reference: BinarySequence | LFSR | int | Sequence[int],
+        sync_bits: int | None = None,
+        window_bits: int = 1 << 16,
+        loss_bits: int = 1024,
+        loss_threshold: float = 0.2,
+        burst_gap: int = 32,
+    ) -> None:
+        """
+        Args:
+            reference (BinarySequence | LFSR | int | Sequence[int]): One period
+                of a repeating pattern, or the LFSR (or feedback polynomial,
+                packed or as taps) generating a PRBS pattern.
+            sync_bits (int | None, optional): Error free bits needed to lock.
+                At least twice the degree for LFSR patterns, and long enough to
+                identify the phase of a reference sequence.
+                Defaults to None (max(64, 2 * degree)).
+            window_bits (int, optional): Compared bits per windowed BER value.
+                Defaults to 1 << 16.
+            loss_bits (int, optional): Block size (a multiple of 8) for loss of
+                lock detection. Defaults to 1024.
+            loss_threshold (float, optional): Error rate of a block above which
+                lock is lost. Defaults to 0.2.
+            burst_gap (int, optional): Minimum number of correct bits between
+                two bursts. Defaults to 32.
+        """
+        self._pattern: _Pattern
+        if isinstance(reference, BinarySequence):
+            self._pattern = _PeriodicPattern(reference)
+        elif isinstance(reference, LFSR):
+            self._pattern = _LFSRPattern(reference.poly)
+        else:
+            self._pattern = _LFSRPattern(poly_from_taps(reference))
+
+        minimum = self._pattern.min_sync_bits
+        if sync_bits is None:
+            sync_bits = max(64, minimum)
+        if not isinstance(sync_bits, int) or sync_bits < minimum:
+            raise ValueError(f"sync_bits must be an integer of at least {minimum}.")
+        for name, size in (("window_bits", window_bits), ("loss_bits", loss_bits)):
+            if not isinstance(size, int) or size <= 0:
+                raise ValueError(f"{name} must be a positive integer.")
+        if loss_bits % 8:
+            raise ValueError("loss_bits must be a multiple of 8.")
+        if not 0 < loss_threshold <= 1:
+            raise ValueError("loss_threshold must be in (0, 1].")
+        if not isinstance(burst_gap, int) or burst_gap <= 0:
+            raise ValueError("burst_gap must be a positive integer.")
+
+        self._sync_bits = sync_bits
+        self._window_bits = window_bits
+        self._loss_bits = loss_bits
+        # most errors a loss block can have without losing lock
+        self._loss_errors = math.floor(loss_threshold * loss_bits)
+        self._burst_gap = burst_gap
+
+        self._locked = False
+        # compared bits and errors of the current loss block
+        self._loss_fill = 0
+        self._loss_count = 0
+        self._pending = 0
+        self._pending_bits = 0
+        self._position = 0
+        self._received = 0
+        self._bits = 0
+        self._errors = 0
+        self._losses = 0
+        self._unsynced = 0
+        self._windows: list[int] = []
+        self._window_fill = 0
+        self._window_errors = 0
+        self._bursts: list[ErrorBurst] = []
+        # open burst: [start, stop, errors]
+        self._burst: list[int] | None = None
+
+    @property
+    def n(self) -> int:
+        """Number of bits received."""
+        return self._received
+
+    @property
+    def locked(self) -> bool:
+        """Whether the tester is locked to the pattern."""
+        return self._locked
+
+    @property
+    def bits(self) -> int:
+        """Number of bits compared."""
+        return self._bits
+
+    @property
+    def errors(self) -> int:
+        """Number of bit errors."""
+        return self._errors
+
+    @property
+    def ber(self) -> float:
+        """Errors per compared bit (0.0 before any comparison)."""
+        return self._errors / self._bits if self._bits else 0.0
+
+    @property
+    def bursts(self) -> list[ErrorBurst]:
+        """Error bursts so far, the last one possibly still growing."""
+        if self._burst is None:
+            return list(self._bursts)
+        start, stop, errors = self._burst
+        return [*self._bursts, ErrorBurst(start, stop - start, errors)]
+
+    @property
+    def window_errors(self) -> list[int]:
+        """Errors in every completed window of `window_bits` compared bits."""
+        return list(self._windows)
+
+    def result(self) -> BERResult:
+        """Snapshot of the totals."""
+        return BERResult(
+            self._bits,
+            self._errors,
+            self.ber,
+            self._losses,
+            self._unsynced,
+            tuple(self.bursts),
+            tuple(errors / self._window_bits for errors in self._windows),
+        )
+
+    def update(self, chunk: BinarySequence) -> None:
+        """Add the next chunk of received bits."""
+        if not isinstance(chunk, BinarySequence):
+            raise TypeError("update requires a BinarySequence.")
+        self._received += chunk.length
+        value = (self._pending << chunk.length) | chunk._value
+        length = self._pending_bits + chunk.length
+        start = self._position
+
+        while length:
+            if not self._locked:
+                offset = self._pattern.hunt(value, length, self._sync_bits)
+                if offset is None:
+                    # a sync window may still start in the last bits
+                    keep = min(length, self._sync_bits - 1)
+                    self._unsynced += length - keep
+                    self._pending = value & ((1 << keep) - 1)
+                    self._pending_bits = keep
+                    self._position = start + length - keep
+                    return
+                self._unsynced += offset
+                self._locked = True
+                start += offset
+                length -= offset
+                value &= (1 << length) - 1
+
+            used = self._compare(value, length, start)
+            start += used
+            length -= used
+            value &= (1 << length) - 1
+
+        self._pending = self._pending_bits = 0
+        self._position = start
+
+    def update_stream(self, chunks: Iterable[BinarySequence]) -> None:
+        """Add every chunk of a stream."""
+        for chunk in chunks:
+            self.update(chunk)
+
+    def _compare(self, value: int, length: int, start: int) -> int:
+        """Count errors of locked bits; returns the number of bits used, which
+        is less than length when lock was lost."""
+        errors = value ^ self._pattern.expected(length)
+        used = length
+        lost = self._find_loss(errors, length)
+        if lost is not None:
+            used = lost
+            errors >>= length - used
+            self._locked = False
+            self._losses += 1
+        if used:
+            self._count(errors, used, start)
+        return used
+
+    def _find_loss(self, errors: int, length: int) -> int | None:
+        """Track the errors of the loss blocks, which are counted from the
+        lock and span chunks; returns the position of the error that takes
+        a block over the loss threshold, if any."""
+        limit = self._loss_errors
+        fill, count = self._loss_fill, self._loss_count
+        total = errors.bit_count()
+        if count + total <= limit:
+            # no block of the chunk can go over the threshold
+            fill += length
+            if fill >= self._loss_bits:
+                fill %= self._loss_bits
+                count = (errors & ((1 << fill) - 1)).bit_count()
+            else:
+                count += total
+            self._loss_fill, self._loss_count = fill, count
+            return None
+
+        # rest of the current block, then whole blocks (byte aligned from
+        # there on, as loss_bits is a multiple of 8)
+        head = min(self._loss_bits - fill, length)
+        blocks = [(0, head, head, errors >> (length - head))]
+        rest = length - head
+        pad = -rest % 8
+        data = ((errors & ((1 << rest) - 1)) << pad).to_bytes((rest + pad) // 8, "big")
+        step = self._loss_bits // 8
+        for lo in range(0, len(data), step):
+            size = min(step, len(data) - lo) * 8
+            block = int.from_bytes(data[lo : lo + step], "big")
+            blocks.append((head + lo * 8, min(size, rest - lo * 8), size, block))
+
+        for position, size, padded, block in blocks:
+            errors_in_block = block.bit_count()
+            if count + errors_in_block > limit:
+                for _ in range(limit - count):
+                    block ^= 1 << (block.bit_length() - 1)
+                self._loss_fill = self._loss_count = 0
+                return position + padded - block.bit_length()
+            count += errors_in_block
+            fill += size
+            if fill == self._loss_bits:
+                fill = count = 0
+        self._loss_fill, self._loss_count = fill, count
+        return None
+
+    def _count(self, errors: int, length: int, start: int) -> None:
+        self._bits += length
+        self._errors += errors.bit_count()
+
+        # windowed error counts
+        if not errors:
+            full, self._window_fill = divmod(
+                self._window_fill + length, self._window_bits
+            )
+            if full:
+                self._windows.append(self._window_errors)
+                self._windows.extend([0] * (full - 1))
+                self._window_errors = 0
+        else:
+            position = 0
+            while position < length:
+                size = min(self._window_bits - self._window_fill, length - position)
+                piece = errors >> (length - position - size)
+                self._window_errors += (piece & ((1 << size) - 1)).bit_count()
+                self._window_fill += size
+                position += size
+                if self._window_fill == self._window_bits:
+                    self._windows.append(self._window_errors)
+                    self._window_errors = self._window_fill = 0
+            self._bursts_from(errors, length, start)
+
+    def _bursts_from(self, errors: int, length: int, start: int) -> None:
+        seq = BinarySequence._from_packed(errors, length)
+        starts, stops = _run_bounds(seq)
+        burst = self._burst
+        # runs alternate between 0 and 1 starting with the first bit
+        for i in range(1 - _first_bit(seq), len(starts), 2):
+            lo, hi = start + starts[i], start + stops[i]
+            if burst is not None and lo - burst[1] < self._burst_gap:
+                burst[1] = hi
+                burst[2] += hi - lo
+                continue
+            if burst is not None:
+                self._bursts.append(ErrorBurst(burst[0], burst[1] - burst[0], burst[2]))
+            burst = [lo, hi, hi - lo]
+        self._burst = burst
@@ -0,0 +1,385 @@
+"""Identify captured codes against an index of known code families.
+
+Every rotation of a sequence has the same canonical form, its least
+rotation (the rotation with the smallest packed value), so an index keyed
+on (length, canonical value) finds a code at any phase with one dict lookup.
+The lookup hashes the canonical value and compares it in full on a hit,
+which is the verification; the phase follows from the two rotation offsets.
+
+    index = CodeIndex.build(max_degree=10)
+    index.classify(captured)
+    # [CodeMatch(family='gold', length=1023, polynomials=((10, 3), ...),
+    #            row=17, phase=402, inverted=False)]
+
+m-sequences outside the index are still recognised: the first 2n bits give
+the feedback polynomial by Berlekamp-Massey, which is checked for
+primitivity and then verified against the whole sequence.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterable
+from enum import StrEnum
+from functools import cache
+from typing import Literal, NamedTuple
+
+from .base import BinarySequence
+from .complexity import berlekamp_massey
+from .correlation import correlate
+from .families import GOLD_PREFERRED_PAIRS, KASAMI_POLYNOMIALS
+from .lfsr import m_sequence
+from .polynomials import is_primitive, poly_to_taps, primitive_polynomials
+from .runs import longest_run
+from .walsh import walsh_code
+
+__all__ = (
+    "CodeFamily",
+    "CodeMatch",
+    "Fingerprint",
+    "CodeIndex",
+    "canonical_rotation",
+    "fingerprint",
+    "reference_code",
+    "default_index",
+    "classify",
+    "classify_many",
+)
+
+# candidate pruning gives up on Booth's algorithm after this many bits per bit
+_PRUNE_BUDGET = 64
+
+
+class CodeFamily(StrEnum):
+    M_SEQUENCE = "m-sequence"
+    GOLD = "gold"
+    KASAMI = "kasami"
+    WALSH = "walsh"
+
+
+class CodeMatch(NamedTuple):
+    """A family member matching a sequence.
+
+    The sequence equals `reference_code(match).shift(match.phase)`, inverted
+    when `inverted` is set. `polynomials` holds the feedback taps (one
+    polynomial, or the preferred pair for Gold codes, none for Walsh codes)
+    and `row` the row of the family as generated by `gold_codes`,
+    `kasami_codes` or `walsh_code` (0 for m-sequences).
+    """
+
+    family: CodeFamily
+    length: int
+    polynomials: tuple[tuple[int, ...], ...]
+    row: int
+    phase: int
+    inverted: bool
+
+
+class Fingerprint(NamedTuple):
+    """Rotation invariant summary of a sequence.
+
+    `rotation_hash` is a digest of the canonical rotation, `linear_complexity`
+    the periodic linear complexity (over two periods) and `peak_sidelobe` the
+    largest periodic autocorrelation magnitude off the zero lag.
+    """
+
+    length: int
+    rotation_hash: str
+    ones: int
+    linear_complexity: int
+    peak_sidelobe: int
+
+
+def canonical_rotation(seq: BinarySequence) -> tuple[BinarySequence, int]:
+    """Least rotation of a sequence and the left shift reaching it.
+
+    The least rotation starts with a longest (circular) run of zeros, so only
+    the starts of those runs are compared, pruning the candidates on doubling
+    prefixes. Periodic sequences are reduced to one period first, and
+    Booth's algorithm takes over when too many candidates survive.
+
+    Args:
+        seq (BinarySequence): Binary Sequence.
+
+    Returns:
+        tuple[BinarySequence, int]: Canonical rotation and offset, with
+            `seq.shift(offset) == canonical`.
+    """
+    n = seq.length
+    if not seq.ones or not seq.zeros:
+        return seq, 0
+
+    text = seq.bit_string
+    doubled = text + text
+    # smallest period: the first rotation equal to the sequence
+    period = doubled.find(text, 1)
+    run = min(longest_run(seq.to_length(2 * n), 0), n)
+
+    head = "1" + "0" * run
+    candidates = []
+    position = doubled.find(head)
+    while 0 <= position < period:
+        candidates.append((position + 1) % period)
+        position = doubled.find(head, position + 1)
+
+    size, spent = run, 0
+    while len(candidates) > 1 and size < period:
+        size = min(2 * size, period)
+        spent += len(candidates) * size
+        if spent > _PRUNE_BUDGET * n:
+            candidates = [_least_rotation(doubled[:period])]
+            break
+        windows = [doubled[p : p + size] for p in candidates]
+        best = min(windows)
+        candidates = [p for p, w in zip(candidates, windows, strict=True) if w == best]
+
+    offset = min(candidates)
+    return seq._rotated_left(offset), offset
+
+
+def _least_rotation(text: str) -> int:
+    """Start of the least rotation of text (Booth's algorithm, O(n))."""
+    doubled = text + text
+    failure = [-1] * len(doubled)
+    k = 0
+    for j in range(1, len(doubled)):
+        c = doubled[j]
+        i = failure[j - k - 1]
+        while i != -1 and c != doubled[k + i + 1]:
+            if c < doubled[k + i + 1]:
+                k = j - i - 1
+            i = failure[i]
+        if c != doubled[k + i + 1]:  # i == -1
+            if c < doubled[k]:
+                k = j
+            failure[j - k] = -1
+        else:
+            failure[j - k] = i + 1
+    return k
+
+
+def fingerprint(seq: BinarySequence) -> Fingerprint:
+    """Rotation invariant fingerprint of a sequence (see `Fingerprint`)."""
+    canonical, _ = canonical_rotation(seq)
+    digest = hashlib.blake2b(canonical.packed_bytes, digest_size=16).hexdigest()
+    complexity, _ = berlekamp_massey(seq.to_length(2 * seq.length))
+    sidelobe = max((abs(int(v)) for v in correlate(seq, seq)[1:]), default=0)
+    return Fingerprint(seq.length, digest, seq.ones, complexity, sidelobe)
+
+
+def reference_code(match: CodeMatch) -> BinarySequence:
+    """The family member of a match at phase 0 (not inverted)."""
+    match match.family:
+        case CodeFamily.M_SEQUENCE:
+            return m_sequence(match.polynomials[0])
+        case CodeFamily.GOLD:
+            u, v = (m_sequence(taps) for taps in match.polynomials)
+            if match.row < 2:
+                return (u, v)[match.row]
+            return u ^ v.shift(match.row - 2)
+        case CodeFamily.KASAMI:
+            u = m_sequence(match.polynomials[0])
+            if not match.row:
+                return u
+            return u ^ _kasami_decimation(u).shift(match.row - 1)
+        case CodeFamily.WALSH:
+            return walsh_code(match.row, match.length)
+
+
+def _kasami_decimation(u: BinarySequence) -> BinarySequence:
+    """u decimated by 2^(n/2) + 1."""
+    n = u.length
+    decimation = (1 << (n.bit_length() // 2)) + 1
+    bits = u.bit_string
+    return BinarySequence("".join(bits[(i * decimation) % n] for i in range(n)))
+
+
+class CodeIndex:
+    """Canonical rotation index of code family members.
+
+    Build one with `CodeIndex.build` (or add codes one at a time with `add`)
+    and reuse it: `classify` costs one canonical rotation of the input and a
+    dict lookup, whatever the size of the index.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[
+            tuple[int, int],
+            list[tuple[CodeFamily, tuple[tuple[int, ...], ...], int, int]],
+        ] = {}
+        self._codes = 0
+
+    def __len__(self) -> int:
+        """Number of codes added."""
+        return self._codes
+
+    @classmethod
+    def build(
+        cls,
+        max_degree: int = 10,
+        families: Iterable[
+            CodeFamily | Literal["m-sequence", "gold", "kasami", "walsh"]
+        ] = tuple(CodeFamily),
+    ) -> CodeIndex:
+        """Index every family member up to a register degree.
+
+        Args:
+            max_degree (int, optional): Largest register degree n, so codes of
+                length up to 2^n - 1 (2^n for Walsh codes). Defaults to 10.
+            families (Iterable[CodeFamily | Literal[...]], optional): Families
+                to add: every primitive polynomial's m-sequence, the Gold and
+                Kasami sets of `GOLD_PREFERRED_PAIRS` and `KASAMI_POLYNOMIALS`,
+                and Sylvester ordered Walsh codes. Defaults to all of them.
+
+        Returns:
+            CodeIndex: Populated index.
+        """
+        if not isinstance(max_degree, int) or max_degree < 1:
+            raise ValueError("max_degree must be a positive integer.")
+        index = cls()
+        for family in dict.fromkeys(CodeFamily(f) for f in families):
+            match family:
+                case CodeFamily.M_SEQUENCE:
+                    for n in range(2, max_degree + 1):
+                        for poly in primitive_polynomials(n):
+                            taps = poly_to_taps(poly)
+                            index.add(m_sequence(taps), family, (taps,))
+                case CodeFamily.GOLD:
+                    for n, pair in GOLD_PREFERRED_PAIRS.items():
+                        if n <= max_degree:
+                            index._add_gold(*pair)
+                case CodeFamily.KASAMI:
+                    for n, taps in KASAMI_POLYNOMIALS.items():
+                        if n <= max_degree:
+                            index._add_kasami(taps)
+                case CodeFamily.WALSH:
+                    for n in range(1, max_degree + 1):
+                        for row in range(1 << n):
+                            index.add(walsh_code(row, 1 << n), family, (), row)
+        return index
+
+    def _add_gold(self, first: tuple[int, ...], second: tuple[int, ...]) -> None:
+        u, v = m_sequence(first), m_sequence(second)
+        pair = (first, second)
+        self.add(u, CodeFamily.GOLD, pair, 0)
+        self.add(v, CodeFamily.GOLD, pair, 1)
+        for k in range(u.length):
+            self.add(u ^ v.shift(k), CodeFamily.GOLD, pair, 2 + k)
+
+    def _add_kasami(self, taps: tuple[int, ...]) -> None:
+        u = m_sequence(taps)
+        w = _kasami_decimation(u)
+        self.add(u, CodeFamily.KASAMI, (taps,), 0)
+        for k in range((1 << (taps[0] // 2)) - 1):
+            self.add(u ^ w.shift(k), CodeFamily.KASAMI, (taps,), 1 + k)
+
+    def add(
+        self,
+        code: BinarySequence,
+        family: CodeFamily | Literal["m-sequence", "gold", "kasami", "walsh"],
+        polynomials: tuple[tuple[int, ...], ...] = (),
+        row: int = 0,
+    ) -> None:
+        """Add one family member (at phase 0).
+
+        Args:
+            code (BinarySequence): Family member, as `reference_code` would
+                generate it.
+            family (CodeFamily | Literal[...]): Family name.
+            polynomials (tuple[tuple[int, ...], ...], optional): Feedback taps
+                identifying the family. Defaults to ().
+            row (int, optional): Row within the family. Defaults to 0.
+        """
+        canonical, offset = canonical_rotation(code)
+        key = (code.length, canonical._value)
+        entry = (CodeFamily(family), polynomials, row, offset)
+        self._entries.setdefault(key, []).append(entry)
+        self._codes += 1
+
+    def _lookup(self, seq: BinarySequence, inverted: bool) -> list[CodeMatch]:
+        canonical, offset = canonical_rotation(seq)
+        n = seq.length
+        return [
+            CodeMatch(family, n, polynomials, row, (reference - offset) % n, inverted)
+            for family, polynomials, row, reference in self._entries.get(
+                (n, canonical._value), ()
+            )
+        ]
+
+    def classify(self, seq: BinarySequence) -> list[CodeMatch]:
+        """Every indexed code matching a sequence at some phase.
+
+        Inverted codes are only looked for when the sequence itself has no
+        match. Sequences that are not indexed but have the length of an
+        m-sequence are checked for being one (see the module docstring).
+
+        Args:
+            seq (BinarySequence): Captured sequence, one code period.
+
+        Returns:
+            list[CodeMatch]: Matches, empty when the sequence is unknown.
+        """
+        if not isinstance(seq, BinarySequence):
+            raise TypeError("classify requires a BinarySequence.")
+        for inverted in (False, True):
+            matches = self._lookup(~seq if inverted else seq, inverted)
+            if matches:
+                return matches
+        for inverted in (False, True):
+            found = _find_m_sequence(~seq if inverted else seq, inverted)
+            if found is not None:
+                return [found]
+        return []
+
+    def classify_many(self, seqs: Iterable[BinarySequence]) -> list[list[CodeMatch]]:
+        """`classify` every sequence of a collection."""
+        return [self.classify(seq) for seq in seqs]
+
+
+def _find_m_sequence(seq: BinarySequence, inverted: bool) -> CodeMatch | None:
+    n = seq.length
+    degree = n.bit_length()
+    if n < 3 or n != (1 << degree) - 1:
+        return None
+    prefix = seq[: 2 * degree]
+    assert isinstance(prefix, BinarySequence)
+    complexity, poly = berlekamp_massey(prefix)
+    if complexity != degree or not is_primitive(poly):
+        return None
+
+    reference = m_sequence(poly)
+    canonical, offset = canonical_rotation(seq)
+    expected, reference_offset = canonical_rotation(reference)
+    if canonical != expected:
+        return None
+    phase = (reference_offset - offset) % n
+    return CodeMatch(
+        CodeFamily.M_SEQUENCE, n, (poly_to_taps(poly),), 0, phase, inverted
+    )
+
+
+@cache
+def default_index() -> CodeIndex:
+    """Shared `CodeIndex.build()`, built on first use."""
+    return CodeIndex.build()
+
+
+def classify(seq: BinarySequence, index: CodeIndex | None = None) -> list[CodeMatch]:
+    """Classify a sequence (see `CodeIndex.classify`).
+
+    Args:
+        seq (BinarySequence): Captured sequence, one code period.
+        index (CodeIndex | None, optional): Index to search. Defaults to None
+            (`default_index()`).
+
+    Returns:
+        list[CodeMatch]: Matches, empty when the sequence is unknown.
+    """
+    return (default_index() if index is None else index).classify(seq)
+
+
+def classify_many(
+    seqs: Iterable[BinarySequence], index: CodeIndex | None = None
+) -> list[list[CodeMatch]]:
+    """Classify every sequence of a collection against one index."""
+    return (default_index() if index is None else index).classify_many(seqs)
@@ -0,0 +1,200 @@
+"""Linear complexity (Berlekamp-Massey over GF(2)) on packed bits.
+
+The connection polynomial C(x) = 1 + c_1 x + ... + c_L x^L is a packed int
+(bit i holding c_i, as in `bseqgen.polynomials`), and the recent history is
+a packed window whose bit j is s[n - j], so the discrepancy at step n is the
+parity of C & window.
+
+While C is sparse (e.g. once an LFSR has been identified) whole blocks are
+checked at once: XORing the packed block shifted by every tap of C gives
+the discrepancy of every position in the block, so runs without a
+discrepancy cost a few word operations per tap instead of one step per bit.
+Dense polynomials use the bit by bit form with a window of about 2L bits.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from .base import BinarySequence
+
+__all__ = (
+    "BerlekampMassey",
+    "berlekamp_massey",
+    "linear_complexity",
+    "linear_complexity_profile",
+)
+
+# use the block skip while C has at most this many terms
+_SPARSE_TERMS = 64
+_MIN_BLOCK = 64
+_MAX_BLOCK = 1 << 16
+
+
+class BerlekampMassey:
+    """Incremental Berlekamp-Massey over a stream of BinarySequence chunks.
+
+    Feed chunks of any size with `update` (or `update_stream`); the linear
+    complexity, connection polynomial and profile always describe every bit
+    seen so far. All bits are kept (packed), since a later length change can
+    reach back to the start of the stream.
+    """
+
+    def __init__(self) -> None:
+        self._history = bytearray()
+        self._bits = 0
+        self._poly = 1
+        self._prev = 1
+        self._complexity = 0
+        self._changed_at = -1
+        self._profile: list[tuple[int, int]] = []
+
+    @property
+    def n(self) -> int:
+        """Number of bits seen."""
+        return self._bits
+
+    @property
+    def linear_complexity(self) -> int:
+        """Length of the shortest LFSR generating the bits seen so far."""
+        return self._complexity
+
+    @property
+    def connection_polynomial(self) -> int:
+        """Packed C(x) with s[n] = c_1 s[n-1] ^ ... ^ c_L s[n-L]."""
+        return self._poly
+
+    @property
+    def profile(self) -> list[tuple[int, int]]:
+        """(n, L) at every complexity change: the first n bits have linear
+        complexity L, until the next entry."""
+        return list(self._profile)
+
+    def update(self, chunk: BinarySequence) -> None:
+        """Add the next chunk of the stream."""
+        if not isinstance(chunk, BinarySequence):
+            raise TypeError("update requires a BinarySequence.")
+        start = self._bits
+        self._append(chunk)
+        self._run(start)
+
+    def update_stream(self, chunks: Iterable[BinarySequence]) -> None:
+        """Add every chunk of a stream."""
+        for chunk in chunks:
+            self.update(chunk)
+
+    def _append(self, chunk: BinarySequence) -> None:
+        spare = -self._bits % 8
+        if not spare:
+            self._history += chunk.packed_bytes
+        else:
+            # merge the chunk into the partly filled last byte
+            last = self._history.pop() >> spare
+            total = 8 - spare + chunk.length
+            value = ((last << chunk.length) | chunk._value) << (-total % 8)
+            self._history += value.to_bytes((total + 7) // 8, "big")
+        self._bits += chunk.length
+
+    def _window(self, start: int, stop: int) -> int:
+        """Packed bits [start, stop) of the history (bit 0 is s[stop - 1])."""
+        start = max(start, 0)
+        if stop <= start:
+            return 0
+        lo, hi = start // 8, (stop + 7) // 8
+        value = int.from_bytes(self._history[lo:hi], "big") >> (hi * 8 - stop)
+        return value & ((1 << (stop - start)) - 1)
+
+    def _run(self, n: int) -> None:
+        end = self._bits
+        block = _MIN_BLOCK
+        while n < end:
+            if self._poly.bit_count() <= _SPARSE_TERMS:
+                n, block = self._skip(n, end, block)
+                if n < end:
+                    self._discrepancy(n)
+                    n += 1
+            else:
+                n = self._bitwise(n, end)
+
+    def _skip(self, n: int, end: int, block: int) -> tuple[int, int]:
+        """Advance to the next step with a discrepancy (or to end)."""
+        poly = self._poly
+        taps = [i for i in range(poly.bit_length()) if (poly >> i) & 1]
+        degree = taps[-1]
+        while n < end:
+            size = min(block, end - n)
+            window = self._window(n - degree, n + size)
+            found = 0
+            for tap in taps:
+                found ^= window >> tap
+            found &= (1 << size) - 1
+            if found:
+                return n + size - found.bit_length(), _MIN_BLOCK
+            n += size
+            block = min(block * 2, _MAX_BLOCK)
+        return n, block
+
+    def _discrepancy(self, n: int) -> None:
+        """Connection polynomial update for a discrepancy at step n."""
+        poly = self._poly
+        self._poly ^= self._prev << (n - self._changed_at)
+        if 2 * self._complexity <= n:
+            self._complexity = n + 1 - self._complexity
+            self._prev = poly
+            self._changed_at = n
+            self._profile.append((n + 1, self._complexity))
+
+    def _bitwise(self, n: int, end: int) -> int:
+        """Step bit by bit until C is sparse again (or to end).
+
+        Each piece of up to 64 steps reads one window covering the piece and
+        the degree of C before it; step k uses that window shifted down to
+        end at s[n + k].
+        """
+        while n < end:
+            size = min(_MIN_BLOCK, end - n)
+            stop = n + size
+            width = self._poly.bit_length() + size + _MIN_BLOCK
+            window = self._window(stop - width, stop)
+            poly = self._poly
+            while n < stop:
+                if (poly & (window >> (stop - 1 - n))).bit_count() & 1:
+                    self._discrepancy(n)
+                    poly = self._poly
+                    if poly.bit_length() + size > width:
+                        width = poly.bit_length() + size + _MIN_BLOCK
+                        window = self._window(stop - width, stop)
+                n += 1
+            if poly.bit_count() <= _SPARSE_TERMS:
+                break
+        return n
+
+
+def berlekamp_massey(seq: BinarySequence) -> tuple[int, int]:
+    """Shortest LFSR generating a sequence.
+
+    Args:
+        seq (BinarySequence): Binary Sequence.
+
+    Returns:
+        tuple[int, int]: Linear complexity L and packed connection
+            polynomial C(x), with s[n] = c_1 s[n-1] ^ ... ^ c_L s[n-L].
+    """
+    state = BerlekampMassey()
+    state.update(seq)
+    return state.linear_complexity, state.connection_polynomial
+
+
+def linear_complexity(seq: BinarySequence) -> int:
+    """Length of the shortest LFSR generating a sequence."""
+    return berlekamp_massey(seq)[0]
+
+
+def linear_complexity_profile(seq: BinarySequence) -> list[tuple[int, int]]:
+    """(n, L) at every change of the linear complexity of the prefixes.
+
+    E.g. 0001 >> [(4, 4)] (every prefix of 000 has complexity 0).
+    """
+    state = BerlekampMassey()
+    state.update(seq)
+    return state.profile
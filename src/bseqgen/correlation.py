@@ -0,0 +1,80 @@
+"""Periodic and aperiodic correlation of binary sequences"""
+
+from __future__ import annotations
+
+from enum import StrEnum
+from typing import Literal
+
+from ._correlate import FFT_MIN_LENGTH, direct_correlate, fft_correlate, has_numpy
+from .base import BinarySequence
+
+__all__ = ("CorrelationMode", "CorrelationMethod", "correlate")
+
+
+class CorrelationMode(StrEnum):
+    PERIODIC = "periodic"
+    APERIODIC = "aperiodic"
+
+
+class CorrelationMethod(StrEnum):
+    AUTO = "auto"
+    FFT = "fft"
+    DIRECT = "direct"
+
+
+def correlate(
+    a: BinarySequence,
+    b: BinarySequence,
+    mode: CorrelationMode | Literal["periodic", "aperiodic"] = "periodic",
+    normalized: bool = False,
+    method: CorrelationMethod | Literal["auto", "fft", "direct"] = "auto",
+) -> tuple[float, ...]:
+    """Correlate the signed (+1/-1) forms of two equal length sequences.
+
+    The value at lag k is sum(a[i] * b[i + k]). Periodic correlation wraps
+    indices around (all circular shifts, lags 0 .. n-1). Aperiodic correlation
+    zero pads instead and returns lags -(n-1) .. n-1.
+
+    Args:
+        a (BinarySequence): First sequence.
+        b (BinarySequence): Second sequence, same length as a.
+        mode (CorrelationMode | Literal['periodic', 'aperiodic'], optional):
+            Correlation mode. Defaults to 'periodic'.
+        normalized (bool, optional): Divide values by the sequence length.
+            Defaults to False (raw integer values).
+        method (CorrelationMethod | Literal['auto', 'fft', 'direct'], optional):
+            'fft' needs NumPy, 'direct' uses packed-word popcounts, 'auto'
+            picks FFT for long sequences when NumPy is installed.
+            Defaults to 'auto'.
+
+    Returns:
+        tuple[float, ...]: Correlation per lag (ints unless normalized).
+    """
+    if not isinstance(a, BinarySequence) or not isinstance(b, BinarySequence):
+        raise TypeError("correlate requires BinarySequence inputs.")
+    if a.length != b.length:
+        raise ValueError("correlate requires both sequences to be the same length.")
+
+    mode = CorrelationMode(mode)
+    method = CorrelationMethod(method)
+
+    if method == CorrelationMethod.AUTO:
+        method = (
+            CorrelationMethod.FFT
+            if a.length >= FFT_MIN_LENGTH and has_numpy()
+            else CorrelationMethod.DIRECT
+        )
+
+    periodic = mode == CorrelationMode.PERIODIC
+    raw: list[int]
+    match method:
+        case CorrelationMethod.FFT:
+            raw = fft_correlate(a, b, periodic)
+        case CorrelationMethod.DIRECT:
+            raw = direct_correlate(a, b, periodic)
+        case _:
+            raise ValueError(f"{method} not a valid correlation method")
+
+    if normalized:
+        return tuple(value / a.length for value in raw)
+    return tuple(raw)
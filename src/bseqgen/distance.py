@@ -0,0 +1,106 @@
+"""Batch distance calculations between binary sequences"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, TypeAlias
+
+from .base import BinarySequence
+from .batch import BinarySequenceBatch
+
+__all__ = ("hamming_distances",)
+
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+    NpNDArrayUInt8: TypeAlias = NDArray[np.uint8]
+
+# rows compared per NumPy step, so an early exit does not scan the whole codebook
+_BLOCK_ROWS = 4096
+
+
+def hamming_distances(
+    query: BinarySequence,
+    candidates: Sequence[BinarySequence] | BinarySequenceBatch | NpNDArrayUInt8,
+    threshold: int | None = None,
+) -> list[int]:
+    """Hamming distance from one query sequence to many candidates.
+
+    Candidates can be a sequence of BinarySequence objects (compared with one
+    XOR and popcount of the packed values each) or a 2D NumPy uint8 array of
+    packed rows in `numpy.packbits` layout or a BinarySequenceBatch (compared
+    with a vectorized popcount).
+
+    Args:
+        query (BinarySequence): Sequence to compare against every candidate.
+        candidates (Sequence[BinarySequence] | BinarySequenceBatch |
+            NpNDArrayUInt8): Candidates, all the same length as query.
+        threshold (int | None, optional): If given, stop at the first candidate
+            whose distance is <= threshold. The returned list then ends with
+            that candidate. Defaults to None (compare all candidates).
+
+    Returns:
+        list[int]: Distance per candidate, in candidate order.
+    """
+    if not isinstance(query, BinarySequence):
+        raise TypeError("hamming_distances requires a BinarySequence query.")
+
+    if isinstance(candidates, BinarySequenceBatch):
+        if candidates.length != query.length:
+            raise ValueError(
+                "hamming_distances requires candidates to be the same length as query."
+            )
+        candidates = candidates.to_numpy(packed=True)
+    if not isinstance(candidates, Sequence):
+        return _packed_array_distances(query, candidates, threshold)
+
+    query_value = query._value
+    distances: list[int] = []
+    for candidate in candidates:
+        other_value = query._compatible_bits(candidate, "hamming_distances")
+        distance = (query_value ^ other_value).bit_count()
+        distances.append(distance)
+        if threshold is not None and distance <= threshold:
+            break
+    return distances
+
+
+def _packed_array_distances(
+    query: BinarySequence, candidates: Any, threshold: int | None
+) -> list[int]:
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError("NumPy is required for packed candidate arrays.") from e
+
+    if not isinstance(candidates, np.ndarray):
+        raise TypeError("Candidates must be a sequence or a NumPy array.")
+    if candidates.ndim != 2 or candidates.dtype != np.uint8:
+        raise ValueError("Packed candidates must be a 2D uint8 array.")
+
+    n_bytes = (query.length + 7) // 8
+    if candidates.shape[1] != n_bytes:
+        raise ValueError(
+            "hamming_distances requires candidates to be the same length as query."
+        )
+
+    pad = n_bytes * 8 - query.length
+    query_row = query.to_numpy(packed=True)
+    # padding bits are ignored so rows padded with ones still compare correctly
+    tail_mask = np.full(n_bytes, 0xFF, dtype=np.uint8)
+    tail_mask[-1] = (0xFF << pad) & 0xFF
+
+    distances: list[int] = []
+    for start in range(0, candidates.shape[0], _BLOCK_ROWS):
+        block = (candidates[start : start + _BLOCK_ROWS] ^ query_row) & tail_mask
+        block_distances = np.bitwise_count(block).sum(axis=1, dtype=np.int64)
+
+        if threshold is not None:
+            hits = np.flatnonzero(block_distances <= threshold)
+            if hits.size:
+                distances.extend(block_distances[: hits[0] + 1].tolist())
+                break
+        distances.extend(block_distances.tolist())
+    return distances
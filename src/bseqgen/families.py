@@ -0,0 +1,149 @@
+"""Gold and Kasami code families"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, TypeAlias
+
+from .lfsr import m_sequence
+
+__all__ = ("GOLD_PREFERRED_PAIRS", "KASAMI_POLYNOMIALS", "gold_codes", "kasami_codes")
+
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+    NpNDArrayInt: TypeAlias = NDArray[np.integer[Any]]
+    NpNDArrayUInt8: TypeAlias = NDArray[np.uint8]
+
+Taps: TypeAlias = int | Sequence[int]
+
+# Preferred pairs of m-sequence feedback polynomials (tap exponents) per degree.
+GOLD_PREFERRED_PAIRS: dict[int, tuple[tuple[int, ...], tuple[int, ...]]] = {
+    5: ((5, 3), (5, 4, 3, 2)),
+    6: ((6, 1), (6, 5, 2, 1)),
+    7: ((7, 3), (7, 3, 2, 1)),
+    9: ((9, 4), (9, 6, 4, 3)),
+    10: ((10, 3), (10, 8, 3, 2)),
+    11: ((11, 2), (11, 8, 5, 2)),
+}
+
+# Primitive feedback polynomials (tap exponents) for the Kasami small set.
+KASAMI_POLYNOMIALS: dict[int, tuple[int, ...]] = {
+    4: (4, 3),
+    6: (6, 5),
+    8: (8, 6, 5, 4),
+    10: (10, 7),
+    12: (12, 11, 10, 4),
+    14: (14, 13, 12, 2),
+    16: (16, 15, 13, 4),
+}
+
+
+def gold_codes(
+    degree: int,
+    pair: tuple[Taps, Taps] | None = None,
+    packed: bool = False,
+) -> NpNDArrayUInt8:
+    """Generate the full Gold code family for a preferred pair of m-sequences.
+
+    Row 0 is u, row 1 is v and row 2 + k is u ^ v.shift(k), giving 2^n + 1
+    codes of length 2^n - 1 in one 2D array.
+
+    Args:
+        degree (int): Register degree n.
+        pair (tuple[Taps, Taps] | None, optional): Preferred pair of feedback
+            polynomials. Defaults to None (GOLD_PREFERRED_PAIRS[degree]).
+        packed (bool, optional): Return rows packed with `numpy.packbits`.
+            Defaults to False (one uint8 per bit).
+
+    Returns:
+        NpNDArrayUInt8: Array of shape (2^n + 1, 2^n - 1), or packed rows.
+    """
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError("NumPy is required for gold_codes().") from e
+
+    if pair is None:
+        if degree not in GOLD_PREFERRED_PAIRS:
+            raise ValueError(
+                f"No default preferred pair for degree {degree}; "
+                f"use {sorted(GOLD_PREFERRED_PAIRS)} or pass pair."
+            )
+        pair = GOLD_PREFERRED_PAIRS[degree]
+
+    u = m_sequence(pair[0]).to_numpy()
+    v = m_sequence(pair[1]).to_numpy()
+    if u.size != (1 << degree) - 1 or v.size != u.size:
+        raise ValueError(f"pair polynomials must both have degree {degree}.")
+
+    n = u.size
+    codes = np.empty((n + 2, n), dtype=np.uint8)
+    codes[0] = u
+    codes[1] = v
+    np.bitwise_xor(u, _circulant(v), out=codes[2:])
+
+    return np.packbits(codes, axis=1) if packed else codes
+
+
+def kasami_codes(
+    degree: int,
+    poly: Taps | None = None,
+    packed: bool = False,
+) -> NpNDArrayUInt8:
+    """Generate the small Kasami set for an even degree n.
+
+    With u an m-sequence of degree n and w its decimation by 2^(n/2) + 1
+    (period 2^(n/2) - 1), row 0 is u and row 1 + k is u ^ w.shift(k), giving
+    2^(n/2) codes of length 2^n - 1.
+
+    Args:
+        degree (int): Register degree n (even).
+        poly (Taps | None, optional): Primitive feedback polynomial of degree n.
+            Defaults to None (KASAMI_POLYNOMIALS[degree]).
+        packed (bool, optional): Return rows packed with `numpy.packbits`.
+            Defaults to False (one uint8 per bit).
+
+    Returns:
+        NpNDArrayUInt8: Array of shape (2^(n/2), 2^n - 1), or packed rows.
+    """
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError("NumPy is required for kasami_codes().") from e
+
+    if degree < 2 or degree % 2:
+        raise ValueError("Kasami codes need an even degree.")
+    if poly is None:
+        if degree not in KASAMI_POLYNOMIALS:
+            raise ValueError(
+                f"No default polynomial for degree {degree}; "
+                f"use {sorted(KASAMI_POLYNOMIALS)} or pass poly."
+            )
+        poly = KASAMI_POLYNOMIALS[degree]
+
+    u = m_sequence(poly).to_numpy()
+    n = u.size
+    if n != (1 << degree) - 1:
+        raise ValueError(f"poly must have degree {degree}.")
+
+    half_period = (1 << (degree // 2)) - 1
+    decimation = (1 << (degree // 2)) + 1
+    w = u[(decimation * np.arange(n)) % n]
+
+    codes = np.empty((half_period + 1, n), dtype=np.uint8)
+    codes[0] = u
+    np.bitwise_xor(u, _circulant(w)[:half_period], out=codes[1:])
+
+    return np.packbits(codes, axis=1) if packed else codes
+
+
+def _circulant(row: NpNDArrayInt) -> NpNDArrayInt:
+    """Read-only square view whose row k is row rotated left by k."""
+    import numpy as np
+
+    n = row.size
+    doubled = np.concatenate((row, row))
+    return np.lib.stride_tricks.sliding_window_view(doubled, n)[:n]
@@ -0,0 +1,313 @@
+"""Opt-in instrumentation of BinarySequence operations and generators.
+
+    from bseqgen.instrument import Instrumentation
+
+    with Instrumentation(memory=True) as inst:
+        run_workload()
+    print(inst.report())
+
+While an Instrumentation is enabled the instrumented methods, properties and
+generator functions are replaced by timing wrappers. `disable` puts the
+original attributes back, so there is no overhead at all while
+instrumentation is off.
+
+Times are inclusive: an operation that calls another instrumented operation
+counts the inner time in both. Module level generators are patched in their
+defining module and in the `bseqgen` package namespace; names imported with
+`from ... import` before enabling keep pointing at the original functions.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable
+from typing import Any, ClassVar, NamedTuple, Self
+
+from .base import BinarySequence
+
+__all__ = ("OPERATIONS", "OpStats", "Instrumentation")
+
+# "module:attribute path" of every operation that can be instrumented.
+OPERATIONS: tuple[str, ...] = (
+    # construction / validation
+    "bseqgen.base:BinarySequence.__init__",
+    "bseqgen.base:BinarySequence._validate_bits",
+    "bseqgen.base:BinarySequence.from_int",
+    "bseqgen.base:BinarySequence.from_bytes",
+    "bseqgen.base:BinarySequence.from_hex",
+    # bitwise ops
+    "bseqgen.base:BinarySequence.xor",
+    "bseqgen.base:BinarySequence.bitwise_and",
+    "bseqgen.base:BinarySequence.bitwise_or",
+    "bseqgen.base:BinarySequence.inverted",
+    # shift / resize
+    "bseqgen.base:BinarySequence.shift",
+    "bseqgen.base:BinarySequence.to_length",
+    # metrics
+    "bseqgen.base:BinarySequence.ones",
+    "bseqgen.base:BinarySequence.zeros",
+    "bseqgen.base:BinarySequence.balance",
+    "bseqgen.base:BinarySequence.entropy",
+    "bseqgen.base:BinarySequence.run_lengths",
+    "bseqgen.base:BinarySequence.hamming_distance",
+    "bseqgen.base:BinarySequence.autocorr",
+    "bseqgen.base:BinarySequence.crosscorr",
+    # NumPy conversion
+    "bseqgen.base:BinarySequence.to_numpy",
+    "bseqgen.base:BinarySequence.from_numpy",
+    # generators
+    "bseqgen.random_seq:random_sequence",
+    "bseqgen.random_seq:random_stream",
+    "bseqgen.lfsr:m_sequence",
+    "bseqgen.lfsr:prbs",
+    "bseqgen.lfsr:LFSR.next_bits",
+    "bseqgen.lfsr:LFSR.jump",
+    "bseqgen.families:gold_codes",
+    "bseqgen.families:kasami_codes",
+    "bseqgen.walsh:walsh_code",
+)
+
+
+class OpStats(NamedTuple):
+    """Accumulated statistics for one operation.
+
+    `bits` is the total input size: the length of the sequence the method was
+    called on, or the size of the sequence/array built by constructors and
+    generators. `bytes_allocated` is the net traced memory still allocated
+    when each call returned (0 unless memory tracking is enabled).
+    """
+
+    calls: int
+    seconds: float
+    bytes_allocated: int
+    bits: int
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.seconds / self.calls if self.calls else 0.0
+
+
+class _Counter:
+    __slots__ = ("calls", "seconds", "bytes_allocated", "bits")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.seconds = 0.0
+        self.bytes_allocated = 0
+        self.bits = 0
+
+
+class Instrumentation:
+    """Records call counts, wall time, allocations and input sizes.
+
+    Only one Instrumentation can be enabled at a time, since enabling patches
+    the library globally. Statistics accumulate across enable/disable cycles
+    until `reset` is called.
+    """
+
+    _active: ClassVar[Instrumentation | None] = None
+
+    def __init__(
+        self, operations: Iterable[str] | None = None, memory: bool = False
+    ) -> None:
+        """
+        Args:
+            operations (Iterable[str] | None, optional): Operation names to
+                instrument, either full `OPERATIONS` entries or their
+                attribute path (e.g. "BinarySequence.xor", "prbs").
+                Defaults to None (all of them).
+            memory (bool, optional): Track allocations with tracemalloc.
+                Tracing slows every allocation down noticeably.
+                Defaults to False.
+        """
+        if operations is None:
+            self._operations = OPERATIONS
+        else:
+            by_name = {op.partition(":")[2]: op for op in OPERATIONS}
+            selected = []
+            for name in operations:
+                op = name if name in OPERATIONS else by_name.get(name)
+                if op is None:
+                    raise ValueError(f"Unknown operation {name!r}.")
+                selected.append(op)
+            self._operations = tuple(selected)
+        self._memory = memory
+        self._stats: dict[str, _Counter] = {}
+        self._lock = threading.Lock()
+        self._patched: list[tuple[object, str, object]] = []
+        self._started_tracemalloc = False
+
+    def __enter__(self) -> Self:
+        self.enable()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.disable()
+
+    @property
+    def enabled(self) -> bool:
+        return Instrumentation._active is self
+
+    @property
+    def memory(self) -> bool:
+        return self._memory
+
+    def enable(self) -> None:
+        """Install the instrumentation wrappers."""
+        if self.enabled:
+            return
+        if Instrumentation._active is not None:
+            raise RuntimeError("Another Instrumentation is already enabled.")
+
+        if self._memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        Instrumentation._active = self
+        try:
+            self._install()
+        except BaseException:
+            self.disable()
+            raise
+
+    def disable(self) -> None:
+        """Restore the original attributes."""
+        if not self.enabled:
+            return
+        for owner, name, original in reversed(self._patched):
+            setattr(owner, name, original)
+        self._patched.clear()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        Instrumentation._active = None
+
+    def reset(self) -> None:
+        """Discard the statistics recorded so far."""
+        with self._lock:
+            self._stats.clear()
+
+    def snapshot(self) -> dict[str, OpStats]:
+        """Copy of the statistics per operation (in first call order)."""
+        with self._lock:
+            return {
+                name: OpStats(c.calls, c.seconds, c.bytes_allocated, c.bits)
+                for name, c in self._stats.items()
+            }
+
+    def as_dict(self) -> dict[str, Any]:
+        """JSON serializable form of `snapshot`."""
+        return {
+            "memory": self._memory,
+            "operations": {
+                name: stats._asdict() for name, stats in self.snapshot().items()
+            },
+        }
+
+    def export_json(self, path: str | os.PathLike[str]) -> None:
+        """Write `as_dict` to a JSON file."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.as_dict(), f, indent=2)
+            f.write("\n")
+
+    def report(self) -> str:
+        """Text table of the statistics, slowest operation first."""
+        rows = sorted(self.snapshot().items(), key=lambda item: -item[1].seconds)
+        width = max((len(name) for name, _ in rows), default=9)
+        lines = [
+            f"{'operation':<{width}} {'calls':>9} {'total ms':>10} "
+            f"{'us/call':>10} {'bits':>12} {'bytes':>12}"
+        ]
+        for name, stats in rows:
+            lines.append(
+                f"{name:<{width}} {stats.calls:>9} {stats.seconds * 1e3:>10.3f} "
+                f"{stats.mean_seconds * 1e6:>10.2f} {stats.bits:>12} "
+                f"{stats.bytes_allocated:>12}"
+            )
+        return "\n".join(lines)
+
+    def _install(self) -> None:
+        package = importlib.import_module("bseqgen")
+        for op in self._operations:
+            module_name, _, path = op.partition(":")
+            owner: object = importlib.import_module(module_name)
+            *parents, name = path.split(".")
+            for parent in parents:
+                owner = getattr(owner, parent)
+
+            original = vars(owner)[name]
+            self._patch(owner, name, _wrap(original, self._timed(path)))
+            if not parents and getattr(package, name, None) is original:
+                self._patch(package, name, vars(owner)[name])
+
+    def _patch(self, owner: object, name: str, value: object) -> None:
+        self._patched.append((owner, name, vars(owner)[name]))
+        setattr(owner, name, value)
+
+    def _timed(self, name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        """Decorator recording every call of a function under `name`."""
+        memory = self._memory
+        lock = self._lock
+        stats = self._stats
+        perf_counter = time.perf_counter
+        traced = tracemalloc.get_traced_memory
+
+        def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+            @functools.wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                before = traced()[0] if memory else 0
+                result = None
+                start = perf_counter()
+                try:
+                    result = func(*args, **kwargs)
+                    return result
+                finally:
+                    elapsed = perf_counter() - start
+                    allocated = max(traced()[0] - before, 0) if memory else 0
+                    bits = _input_bits(args, result)
+                    with lock:
+                        counter = stats.get(name)
+                        if counter is None:
+                            counter = stats[name] = _Counter()
+                        counter.calls += 1
+                        counter.seconds += elapsed
+                        counter.bytes_allocated += allocated
+                        counter.bits += bits
+
+            return wrapper
+
+        return decorator
+
+
+def _wrap(
+    attr: object, timed: Callable[[Callable[..., Any]], Callable[..., Any]]
+) -> object:
+    """Instrumented replacement for a function, method or descriptor."""
+    if isinstance(attr, property):
+        assert attr.fget is not None
+        return property(timed(attr.fget), attr.fset, attr.fdel, attr.__doc__)
+    if isinstance(attr, staticmethod):
+        return staticmethod(timed(attr.__func__))
+    if isinstance(attr, classmethod):
+        return classmethod(timed(attr.__func__))
+    if callable(attr):
+        return timed(attr)
+    raise TypeError(f"Cannot instrument {attr!r}.")
+
+
+def _input_bits(args: tuple[Any, ...], result: object) -> int:
+    """Size of the sequence operated on, or of the sequence/array produced."""
+    if args and isinstance(args[0], BinarySequence):
+        length: int = getattr(args[0], "_length", 0)
+        return length
+    if isinstance(result, BinarySequence):
+        return result.length
+    if args and isinstance(args[0], (str, bytes, list, tuple)):
+        return len(args[0])
+    size = getattr(result, "size", None)
+    return size if isinstance(size, int) else 0
@@ -0,0 +1,306 @@
+"""Linear feedback shift registers and m-sequences"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from enum import StrEnum
+from typing import Literal
+
+from .base import BinarySequence
+from .polynomials import (
+    degree,
+    poly_from_taps,
+    poly_mulmod,
+    poly_powmod,
+    poly_to_taps,
+    reciprocal,
+)
+from .stream import DEFAULT_CHUNK_BITS
+
+__all__ = ("LFSRConfig", "LFSR", "PRBS_POLYNOMIALS", "m_sequence", "prbs")
+
+
+# ITU-T O.150 style PRBS feedback polynomials, as tap exponents.
+PRBS_POLYNOMIALS: dict[int, tuple[int, ...]] = {
+    7: (7, 6),
+    9: (9, 5),
+    11: (11, 9),
+    15: (15, 14),
+    20: (20, 3),
+    23: (23, 18),
+    31: (31, 28),
+}
+
+
+class LFSRConfig(StrEnum):
+    FIBONACCI = "fibonacci"
+    GALOIS = "galois"
+
+
+class LFSR:
+    """Linear feedback shift register over GF(2).
+
+    The feedback polynomial is given in delay form: taps (7, 6), i.e.
+    x^7 + x^6 + 1, produce the sequence s[t] = s[t-7] ^ s[t-6]. Both
+    configurations produce that recurrence (at different phases for the same
+    seed):
+
+    - Fibonacci: the state holds the next `degree` output bits, most
+      significant bit first, so the first output bits equal the seed.
+    - Galois: the state is a polynomial that is multiplied by x modulo the
+      reciprocal polynomial each step, outputting the x^(degree-1) coefficient.
+
+    Output is generated in blocks rather than one bit per loop: since
+    p(D)^(2^j) = p(D^(2^j)) over GF(2), s[t] = XOR s[t - 2^j e] for every tap
+    e, so a whole block of up to 2^j * min(taps) bits is a handful of shifts
+    and XORs of the bits already produced.
+    """
+
+    def __init__(
+        self,
+        poly: int | Sequence[int],
+        seed: int | None = None,
+        config: LFSRConfig | Literal["fibonacci", "galois"] = LFSRConfig.FIBONACCI,
+    ) -> None:
+        """
+        Args:
+            poly (int | Sequence[int]): Feedback polynomial, packed or as tap
+                exponents, e.g. (7, 6).
+            seed (int | None, optional): Initial non-zero state.
+                Defaults to None (all ones).
+            config (LFSRConfig | Literal['fibonacci', 'galois'], optional):
+                Register configuration. Defaults to LFSRConfig.FIBONACCI.
+        """
+        self._poly: int = poly_from_taps(poly)
+        self._degree: int = degree(self._poly)
+        self._taps: tuple[int, ...] = poly_to_taps(self._poly)
+        # characteristic polynomial of the recurrence
+        self._charpoly: int = reciprocal(self._poly)
+        self._config: LFSRConfig = LFSRConfig(config)
+
+        mask = (1 << self._degree) - 1
+        if seed is None:
+            seed = mask
+        if not isinstance(seed, int) or not 0 < seed <= mask:
+            raise ValueError(
+                f"Seed must be a non-zero integer below 2**{self._degree}."
+            )
+        self._seed: int = seed
+        self._state: int = seed
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(poly={self._taps}, "
+            f"state={self._state:#x}, config='{self._config}')"
+        )
+
+    @property
+    def poly(self) -> int:
+        """Packed feedback polynomial."""
+        return self._poly
+
+    @property
+    def taps(self) -> tuple[int, ...]:
+        """Feedback tap exponents, highest first."""
+        return self._taps
+
+    @property
+    def degree(self) -> int:
+        """Register length in bits."""
+        return self._degree
+
+    @property
+    def config(self) -> LFSRConfig:
+        """Register configuration."""
+        return self._config
+
+    @property
+    def state(self) -> int:
+        """Current register state."""
+        return self._state
+
+    @property
+    def max_period(self) -> int:
+        """Period of the output when the polynomial is primitive (2^n - 1)."""
+        return (1 << self._degree) - 1
+
+    def reset(self) -> None:
+        """Return the register to its seed state."""
+        self._state = self._seed
+
+    def step(self) -> int:
+        """Advance one step and return the output bit."""
+        n = self._degree
+        state = self._state
+        out = (state >> (n - 1)) & 1
+
+        match self._config:
+            case LFSRConfig.FIBONACCI:
+                feedback = 0
+                for tap in self._taps:
+                    feedback ^= state >> (tap - 1)
+                self._state = ((state << 1) | (feedback & 1)) & self.max_period
+            case LFSRConfig.GALOIS:
+                state <<= 1
+                if out:
+                    state ^= self._charpoly
+                self._state = state
+
+        return out
+
+    def next_bits(self, n: int) -> BinarySequence:
+        """Generate the next n output bits and advance the register.
+
+        Args:
+            n (int): Number of bits to generate.
+
+        Returns:
+            BinarySequence: Output bits.
+        """
+        if not isinstance(n, int) or n <= 0:
+            raise ValueError("n must be a positive integer")
+
+        match self._config:
+            case LFSRConfig.FIBONACCI:
+                window = self._extend(self._state, n + self._degree)
+                self._state = window & self.max_period
+                return BinarySequence._from_packed(window >> self._degree, n)
+            case LFSRConfig.GALOIS:
+                head = self._galois_head()
+                out = self._extend(head, n) if n > self._degree else head
+                out >>= max(self._degree - n, 0)
+                self.jump(n)
+                return BinarySequence._from_packed(out, n)
+
+        raise ValueError(f"{self._config} not a valid LFSR configuration")
+
+    def stream(
+        self, n: int | None = None, chunk_bits: int = DEFAULT_CHUNK_BITS
+    ) -> Iterator[BinarySequence]:
+        """Generate output as a stream of chunks, advancing the register.
+
+        Args:
+            n (int | None, optional): Total bits, None for an endless stream.
+                Defaults to None.
+            chunk_bits (int, optional): Bits per chunk.
+                Defaults to DEFAULT_CHUNK_BITS.
+
+        Returns:
+            Iterator[BinarySequence]: Output chunks (the last may be shorter).
+        """
+        if n is not None and (not isinstance(n, int) or n <= 0):
+            raise ValueError("n must be a positive integer or None")
+        if not isinstance(chunk_bits, int) or chunk_bits <= 0:
+            raise ValueError("chunk_bits must be a positive integer")
+        return self._chunks(n, chunk_bits)
+
+    def _chunks(self, n: int | None, chunk_bits: int) -> Iterator[BinarySequence]:
+        remaining = n
+        while remaining is None or remaining > 0:
+            size = chunk_bits if remaining is None else min(chunk_bits, remaining)
+            yield self.next_bits(size)
+            if remaining is not None:
+                remaining -= size
+
+    def jump(self, k: int) -> None:
+        """Advance the register k steps without generating output.
+
+        Uses x^k mod the characteristic polynomial, so the cost grows with
+        log(k) rather than k.
+
+        Args:
+            k (int): Number of steps to skip.
+        """
+        if not isinstance(k, int) or k < 0:
+            raise ValueError("k must be a non-negative integer")
+
+        n = self._degree
+        remainder = poly_powmod(0b10, k, self._charpoly)
+
+        match self._config:
+            case LFSRConfig.FIBONACCI:
+                # s[t+k+j] = XOR of r_i * s[t+i+j] for r = x^k mod charpoly
+                window = self._extend(self._state, 2 * n - 1)
+                state = 0
+                for i in range(n):
+                    if (remainder >> i) & 1:
+                        state ^= window >> (n - 1 - i)
+                self._state = state & self.max_period
+            case LFSRConfig.GALOIS:
+                self._state = poly_mulmod(self._state, remainder, self._charpoly)
+
+    def _galois_head(self) -> int:
+        """First `degree` output bits of a Galois register (state unchanged)."""
+        state = self._state
+        head = 0
+        for _ in range(self._degree):
+            out = (state >> (self._degree - 1)) & 1
+            head = (head << 1) | out
+            state <<= 1
+            if out:
+                state ^= self._charpoly
+        return head
+
+    def _extend(self, value: int, total: int) -> int:
+        """Extend `degree` known output bits (MSB first) to `total` bits."""
+        return _extend_recurrence(value, self._degree, total, self._taps)
+
+
+def _extend_recurrence(value: int, length: int, total: int, taps: Sequence[int]) -> int:
+    """Extend s[t] = XOR s[t - e] (e in taps) from length to total bits.
+
+    value holds the known bits most significant bit first, and length must be
+    at least max(taps). Each pass uses the squared recurrence with the largest
+    2^j for which the history is long enough.
+    """
+    e_min, e_max = min(taps), max(taps)
+    while length < total:
+        scale = 1 << ((length // e_max).bit_length() - 1)
+        block = min(total - length, scale * e_min)
+        new = 0
+        for tap in taps:
+            new ^= value >> (scale * tap - block)
+        value = (value << block) | (new & ((1 << block) - 1))
+        length += block
+    return value
+
+
+def m_sequence(
+    poly: int | Sequence[int],
+    seed: int | None = None,
+    config: LFSRConfig | Literal["fibonacci", "galois"] = LFSRConfig.FIBONACCI,
+) -> BinarySequence:
+    """One full period (2^n - 1 bits) of an LFSR output.
+
+    The result is a maximal length sequence when poly is primitive.
+
+    Args:
+        poly (int | Sequence[int]): Feedback polynomial, packed or as taps.
+        seed (int | None, optional): Initial non-zero state.
+            Defaults to None (all ones).
+        config (LFSRConfig | Literal['fibonacci', 'galois'], optional):
+            Register configuration. Defaults to LFSRConfig.FIBONACCI.
+
+    Returns:
+        BinarySequence: m-sequence.
+    """
+    lfsr = LFSR(poly, seed=seed, config=config)
+    return lfsr.next_bits(lfsr.max_period)
+
+
+def prbs(order: int, n: int | None = None, seed: int | None = None) -> BinarySequence:
+    """Standard PRBS test pattern (PRBS7, PRBS9, ... PRBS31).
+
+    Args:
+        order (int): PRBS order, a key of PRBS_POLYNOMIALS.
+        n (int | None, optional): Number of bits. Defaults to None (one period).
+        seed (int | None, optional): Initial non-zero state.
+            Defaults to None (all ones).
+
+    Returns:
+        BinarySequence: PRBS pattern.
+    """
+    if order not in PRBS_POLYNOMIALS:
+        raise ValueError(f"Unknown PRBS order {order}; use {sorted(PRBS_POLYNOMIALS)}.")
+    lfsr = LFSR(PRBS_POLYNOMIALS[order], seed=seed)
+    return lfsr.next_bits(lfsr.max_period if n is None else n)
@@ -0,0 +1,566 @@
+"""Polynomial arithmetic over GF(2).
+
+Polynomials are packed into ints, bit i holding the coefficient of x^i, so
+x^7 + x^6 + 1 is 0b11000001.
+
+`is_primitive` results are memoized in a small LRU cache persisted as JSON
+(see `PolynomialCache`), in $BSEQGEN_CACHE_DIR, $XDG_CACHE_HOME/bseqgen or
+~/.cache/bseqgen. Call `set_cache(None)` to turn it off.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import math
+import os
+import random
+from collections import OrderedDict
+from collections.abc import Iterator, Sequence
+from functools import cache
+from pathlib import Path
+
+__all__ = (
+    "PRIMITIVE_POLYNOMIALS",
+    "poly_from_taps",
+    "poly_to_taps",
+    "degree",
+    "reciprocal",
+    "poly_mul",
+    "poly_mod",
+    "poly_mulmod",
+    "poly_powmod",
+    "poly_gcd",
+    "is_irreducible",
+    "is_primitive",
+    "primitive_polynomials",
+    "PolynomialCache",
+    "set_cache",
+)
+
+# One primitive polynomial (tap exponents) per degree: a trinomial where one
+# exists, else a pentanomial; the largest taps of the lowest weight.
+PRIMITIVE_POLYNOMIALS: dict[int, tuple[int, ...]] = {
+    2: (2, 1),
+    3: (3, 2),
+    4: (4, 3),
+    5: (5, 3),
+    6: (6, 5),
+    7: (7, 6),
+    8: (8, 7, 6, 1),
+    9: (9, 5),
+    10: (10, 7),
+    11: (11, 9),
+    12: (12, 11, 10, 4),
+    13: (13, 12, 11, 8),
+    14: (14, 13, 12, 2),
+    15: (15, 14),
+    16: (16, 15, 13, 4),
+    17: (17, 14),
+    18: (18, 11),
+    19: (19, 18, 17, 14),
+    20: (20, 17),
+    21: (21, 19),
+    22: (22, 21),
+    23: (23, 18),
+    24: (24, 23, 22, 17),
+    25: (25, 22),
+    26: (26, 25, 24, 20),
+    27: (27, 26, 25, 22),
+    28: (28, 25),
+    29: (29, 27),
+    30: (30, 29, 28, 7),
+    31: (31, 28),
+    32: (32, 31, 30, 10),
+    33: (33, 20),
+    34: (34, 33, 32, 7),
+    35: (35, 33),
+    36: (36, 25),
+    37: (37, 36, 35, 28),
+    38: (38, 37, 35, 25),
+    39: (39, 35),
+    40: (40, 39, 38, 5),
+    41: (41, 38),
+    42: (42, 41, 40, 13),
+    43: (43, 42, 41, 31),
+    44: (44, 43, 41, 6),
+    45: (45, 44, 42, 41),
+    46: (46, 45, 43, 37),
+    47: (47, 42),
+    48: (48, 47, 45, 20),
+    49: (49, 40),
+    50: (50, 49, 48, 34),
+    51: (51, 50, 49, 23),
+    52: (52, 49),
+    53: (53, 52, 51, 47),
+    54: (54, 53, 52, 37),
+    55: (55, 31),
+    56: (56, 55, 54, 14),
+    57: (57, 50),
+    58: (58, 39),
+    59: (59, 58, 57, 35),
+    60: (60, 59),
+    61: (61, 60, 59, 56),
+    62: (62, 61, 59, 34),
+    63: (63, 62),
+    64: (64, 63, 62, 53),
+}
+
+# Every primitive polynomial (packed) of the small degrees.
+_SMALL_PRIMITIVE: dict[int, tuple[int, ...]] = {
+    1: (0x3,),
+    2: (0x7,),
+    3: (0xB, 0xD),
+    4: (0x13, 0x19),
+    5: (0x25, 0x29, 0x2F, 0x37, 0x3B, 0x3D),
+    6: (0x43, 0x5B, 0x61, 0x67, 0x6D, 0x73),
+    7: (
+        0x83,
+        0x89,
+        0x8F,
+        0x91,
+        0x9D,
+        0xA7,
+        0xAB,
+        0xB9,
+        0xBF,
+        0xC1,
+        0xCB,
+        0xD3,
+        0xD5,
+        0xE5,
+        0xEF,
+        0xF1,
+        0xF7,
+        0xFD,
+    ),
+    8: (
+        0x11D,
+        0x12B,
+        0x12D,
+        0x14D,
+        0x15F,
+        0x163,
+        0x165,
+        0x169,
+        0x171,
+        0x187,
+        0x18D,
+        0x1A9,
+        0x1C3,
+        0x1CF,
+        0x1E7,
+        0x1F5,
+    ),
+}
+
+
+def poly_from_taps(taps: int | Sequence[int]) -> int:
+    """Convert tap exponents, e.g. (7, 6) for x^7 + x^6 + 1, to a packed poly.
+
+    The constant term is always included. A packed int is returned unchanged
+    after checking it has a constant term.
+
+    Args:
+        taps (int | Sequence[int]): Packed polynomial or exponents of the
+            non-constant terms.
+
+    Returns:
+        int: Packed polynomial.
+    """
+    if isinstance(taps, int):
+        poly = taps
+    else:
+        if not taps:
+            raise ValueError("Taps cannot be empty.")
+        poly = 1
+        for exponent in taps:
+            if not isinstance(exponent, int) or exponent < 0:
+                raise ValueError("Tap exponents must be non-negative integers.")
+            poly |= 1 << exponent
+
+    if poly < 3 or not poly & 1:
+        raise ValueError("Polynomial must have degree >= 1 and a constant term.")
+    return poly
+
+
+def poly_to_taps(poly: int) -> tuple[int, ...]:
+    """Exponents of the non-constant terms of a packed poly, highest first."""
+    return tuple(i for i in range(degree(poly), 0, -1) if (poly >> i) & 1)
+
+
+def degree(poly: int) -> int:
+    """Degree of a packed polynomial (-1 for the zero polynomial)."""
+    return poly.bit_length() - 1
+
+
+def reciprocal(poly: int) -> int:
+    """Reciprocal polynomial x^n p(1/x) (coefficients reversed)."""
+    n = degree(poly)
+    return int(format(poly, f"0{n + 1}b")[::-1], 2)
+
+
+def poly_mul(a: int, b: int) -> int:
+    """Carry-less product of two packed polynomials."""
+    if a.bit_length() < b.bit_length():
+        a, b = b, a
+    result = 0
+    shift = 0
+    while b:
+        if b & 1:
+            result ^= a << shift
+        b >>= 1
+        shift += 1
+    return result
+
+
+def poly_mod(a: int, m: int) -> int:
+    """Remainder of a divided by m."""
+    if m == 0:
+        raise ZeroDivisionError("polynomial division by zero")
+    m_degree = degree(m)
+    while (a_degree := degree(a)) >= m_degree:
+        a ^= m << (a_degree - m_degree)
+    return a
+
+
+def poly_mulmod(a: int, b: int, m: int) -> int:
+    """a * b mod m."""
+    return poly_mod(poly_mul(a, b), m)
+
+
+def poly_powmod(a: int, exponent: int, m: int) -> int:
+    """a ** exponent mod m, by square and multiply."""
+    if exponent < 0:
+        raise ValueError("Exponent must be non-negative.")
+    result = poly_mod(1, m)
+    a = poly_mod(a, m)
+    while exponent:
+        if exponent & 1:
+            result = poly_mulmod(result, a, m)
+        a = poly_mod(_square(a), m)
+        exponent >>= 1
+    return result
+
+
+def poly_gcd(a: int, b: int) -> int:
+    """Greatest common divisor of two packed polynomials."""
+    while b:
+        a, b = b, poly_mod(a, b)
+    return a
+
+
+def is_irreducible(poly: int | Sequence[int]) -> bool:
+    """Check whether a polynomial has no non-trivial factors over GF(2).
+
+    Ben-Or's test: p of degree n is irreducible iff
+    gcd(x^(2^i) - x, p) = 1 for every i <= n / 2. Most reducible
+    polynomials have a small factor and are rejected after a few steps.
+
+    Args:
+        poly (int | Sequence[int]): Packed polynomial or tap exponents.
+
+    Returns:
+        bool: True if irreducible.
+    """
+    p = poly_from_taps(poly)
+    n = degree(p)
+    if n == 1:
+        return True
+    if not p.bit_count() & 1:
+        return False  # even weight: divisible by x + 1
+    power = 0b10
+    for _ in range(n // 2):
+        power = poly_mod(_square(power), p)
+        if poly_gcd(p, power ^ 0b10) != 1:
+            return False
+    return True
+
+
+def is_primitive(poly: int | Sequence[int]) -> bool:
+    """Check whether a polynomial is primitive (x has order 2^n - 1).
+
+    Primitive feedback polynomials give maximal length LFSR sequences. The
+    order is checked against every prime factor r of 2^n - 1:
+    x^((2^n - 1) / r) must not be 1 mod p. Results are memoized in the
+    polynomial cache.
+
+    Args:
+        poly (int | Sequence[int]): Packed polynomial or tap exponents.
+
+    Returns:
+        bool: True if primitive.
+    """
+    p = poly_from_taps(poly)
+    store = _cache_store()
+    if store is not None:
+        known = store.get(p)
+        if known is not None:
+            return known
+
+    result = _is_primitive(p)
+    if store is not None:
+        store.put(p, result)
+    return result
+
+
+def primitive_polynomials(n: int) -> Iterator[int]:
+    """All primitive polynomials of degree n, in increasing packed order.
+
+    There are phi(2^n - 1) / n of them, so this is meant for small degrees
+    (use PRIMITIVE_POLYNOMIALS[n] for one known polynomial of any degree up
+    to 64).
+
+    Args:
+        n (int): Degree (>= 1).
+
+    Yields:
+        int: Packed primitive polynomial.
+    """
+    if not isinstance(n, int) or n < 1:
+        raise ValueError("Degree must be a positive integer.")
+    if n in _SMALL_PRIMITIVE:
+        yield from _SMALL_PRIMITIVE[n]
+        return
+    top = 1 << n
+    for middle in range(0, top, 2):
+        p = top | middle | 1
+        if p.bit_count() & 1 and is_primitive(p):
+            yield p
+
+
+def _is_primitive(p: int) -> bool:
+    n = degree(p)
+    if n == 1:
+        return p == 0b11
+    if not is_irreducible(p):
+        return False
+    order = (1 << n) - 1
+    return all(poly_powmod(0b10, order // r, p) != 1 for r in _mersenne_factors(n))
+
+
+# spread[b]: the bits of byte b moved to even positions, i.e. b(x)^2
+_SPREAD = [int(format(byte, "08b"), 4).to_bytes(2, "big") for byte in range(256)]
+
+
+def _square(a: int) -> int:
+    """a(x)^2 (carry-less square: spread the bits apart)."""
+    data = a.to_bytes((a.bit_length() + 7) // 8, "big")
+    return int.from_bytes(b"".join([_SPREAD[byte] for byte in data]), "big")
+
+
+@cache
+def _mersenne_factors(n: int) -> tuple[int, ...]:
+    """Distinct prime factors of 2^n - 1.
+
+    2^n - 1 is the product of the cyclotomic values Phi_d(2) over d | n,
+    which are factored separately (much smaller than 2^n - 1).
+    """
+    primes: set[int] = set()
+    for d in range(1, n + 1):
+        if n % d == 0:
+            primes.update(_prime_factors(_cyclotomic_at_2(d)))
+    return tuple(sorted(primes))
+
+
+def _cyclotomic_at_2(d: int) -> int:
+    """Phi_d(2), by Moebius inversion of 2^d - 1 = prod Phi_k(2), k | d."""
+    numerator = denominator = 1
+    for k in range(1, d + 1):
+        if d % k == 0:
+            mu = _moebius(d // k)
+            if mu == 1:
+                numerator *= (1 << k) - 1
+            elif mu == -1:
+                denominator *= (1 << k) - 1
+    return numerator // denominator
+
+
+def _moebius(n: int) -> int:
+    result = 1
+    f = 2
+    while f * f <= n:
+        if n % f == 0:
+            n //= f
+            if n % f == 0:
+                return 0
+            result = -result
+        f += 1
+    return -result if n > 1 else result
+
+
+def _prime_factors(n: int) -> set[int]:
+    factors: set[int] = set()
+    for p in (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37):
+        while n % p == 0:
+            factors.add(p)
+            n //= p
+    stack = [n] if n > 1 else []
+    while stack:
+        m = stack.pop()
+        if _is_probable_prime(m):
+            factors.add(m)
+            continue
+        f = _pollard_brent(m)
+        stack += [f, m // f]
+    return factors
+
+
+def _is_probable_prime(n: int) -> bool:
+    """Miller-Rabin, deterministic below 3.3e24 (first 13 prime bases)."""
+    if n < 2:
+        return False
+    bases = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+    if n in bases:
+        return True
+    if any(n % p == 0 for p in bases):
+        return False
+    d, s = n - 1, 0
+    while not d & 1:
+        d >>= 1
+        s += 1
+    for a in bases:
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _pollard_brent(n: int) -> int:
+    """A non-trivial factor of the composite n (Brent's rho variant)."""
+    rng = random.Random(n)
+    while True:
+        y, c, m = rng.randrange(1, n), rng.randrange(1, n), 128
+        g = r = q = 1
+        x = ys = y
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += m
+            r *= 2
+        if g == n:
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        if g != n:
+            return g
+
+
+class PolynomialCache:
+    """LRU map of packed polynomial to primitivity, persisted as JSON.
+
+    Lookups refresh an entry; inserting past `max_entries` evicts the least
+    recently used one. Changes are written by `flush` (also called at
+    interpreter exit). A missing or unreadable file starts an empty cache,
+    and write errors are ignored, since the cache only saves time.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], max_entries: int = 1 << 16):
+        """
+        Args:
+            path (str | os.PathLike[str]): JSON file.
+            max_entries (int, optional): Entries kept. Defaults to 65536.
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive.")
+        self._path = Path(path)
+        self._max_entries = max_entries
+        self._entries: OrderedDict[int, bool] = OrderedDict()
+        self._dirty = False
+        try:
+            data = json.loads(self._path.read_text())
+            for key, value in data["primitive"]:
+                self._entries[int(key, 16)] = bool(value)
+        except (OSError, ValueError, KeyError, TypeError):
+            self._entries.clear()
+        while len(self._entries) > max_entries:
+            self._entries.popitem(last=False)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, poly: int) -> bool | None:
+        """Cached result, or None if unknown."""
+        value = self._entries.get(poly)
+        if value is not None:
+            self._entries.move_to_end(poly)
+        return value
+
+    def put(self, poly: int, value: bool) -> None:
+        self._entries[poly] = value
+        self._entries.move_to_end(poly)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        self._dirty = True
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._dirty = True
+
+    def flush(self) -> None:
+        """Write the cache if it changed (oldest entries first)."""
+        if not self._dirty:
+            return
+        data = {"primitive": [[f"{p:x}", v] for p, v in self._entries.items()]}
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = self._path.with_suffix(".tmp")
+            temporary.write_text(json.dumps(data))
+            temporary.replace(self._path)
+        except OSError:
+            return
+        self._dirty = False
+
+
+_store: PolynomialCache | None = None
+_store_configured = False
+
+
+def set_cache(store: PolynomialCache | None) -> None:
+    """Use a different polynomial cache, or None to disable caching."""
+    global _store, _store_configured
+    if _store is not None:
+        _store.flush()
+    _store = store
+    _store_configured = True
+
+
+def _cache_store() -> PolynomialCache | None:
+    """The configured cache, creating the default one on first use."""
+    global _store, _store_configured
+    if not _store_configured:
+        _store_configured = True
+        _store = PolynomialCache(_default_cache_dir() / "polynomials.json")
+    return _store
+
+
+@atexit.register
+def _flush_cache() -> None:
+    if _store is not None:
+        _store.flush()
+
+
+def _default_cache_dir() -> Path:
+    if directory := os.environ.get("BSEQGEN_CACHE_DIR"):
+        return Path(directory)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "bseqgen"
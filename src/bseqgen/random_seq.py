@@ -1,22 +1,45 @@
 """Generate PRBS with Random Modules"""
 
 import random
-from typing import TypeAlias
+from collections.abc import Callable, Iterator
+from enum import StrEnum
+from typing import Literal, TypeAlias
 
 from .base import BinarySequence
+from .stream import DEFAULT_CHUNK_BITS
 
-__all__ = ("random_sequence",)
+__all__ = ("RandomBackend", "random_sequence", "random_stream")
 
 Seed: TypeAlias = None | int | float | str | bytes | bytearray
 
 
-def random_sequence(n: int, seed: Seed = None) -> BinarySequence:
+class RandomBackend(StrEnum):
+    PYTHON = "python"
+    PCG64 = "pcg64"
+    PHILOX = "philox"
+
+
+def random_sequence(
+    n: int,
+    seed: Seed = None,
+    backend: RandomBackend | Literal["python", "pcg64", "philox"] = "python",
+    legacy: bool = False,
+) -> BinarySequence:
     """Generates a random sequence of length n.
     If a seed is provided, the output will be reproducible.
 
+    Bits are drawn in bulk as random bytes, 8 bits per byte, rather than one
+    call per bit. Sequences generated before bulk generation was added can be
+    reproduced with legacy=True.
+
     Args:
         n (int): number of bits to generate
         seed (Seed, optional): random seed. Defaults to None.
+        backend (RandomBackend | Literal['python', 'pcg64', 'philox'], optional):
+            'python' uses random.Random, 'pcg64' and 'philox' use a NumPy
+            Generator (seed must be None or an int). Defaults to 'python'.
+        legacy (bool, optional): use the original one randint(0, 1) per bit
+            stream (python backend only). Defaults to False.
 
     Returns:
         BinarySequence: Random binary sequence.
@@ -24,6 +47,83 @@ def random_sequence(n: int, seed: Seed = None) -> BinarySequence:
     if not isinstance(n, int) or n <= 0:
         raise ValueError("n must be a positive integer")
 
-    rng: random.Random = random.Random(seed)
-    random_bits = [rng.randint(0, 1) for _ in range(n)]
-    return BinarySequence(random_bits)
+    return _bit_source(seed, RandomBackend(backend), legacy)(n)
+
+
+def random_stream(
+    n: int | None,
+    chunk_bits: int = DEFAULT_CHUNK_BITS,
+    seed: Seed = None,
+    backend: RandomBackend | Literal["python", "pcg64", "philox"] = "python",
+    legacy: bool = False,
+) -> Iterator[BinarySequence]:
+    """Generates a random sequence of length n as a stream of chunks.
+
+    Concatenating the chunks gives the same bits as random_sequence(n, seed)
+    with the same backend, provided chunk_bits is a multiple of 32 (or legacy
+    is set).
+
+    Args:
+        n (int | None): number of bits to generate, None for an endless stream.
+        chunk_bits (int, optional): bits per chunk. Defaults to DEFAULT_CHUNK_BITS.
+        seed (Seed, optional): random seed. Defaults to None.
+        backend (RandomBackend | Literal['python', 'pcg64', 'philox'], optional):
+            random bit source, see random_sequence. Defaults to 'python'.
+        legacy (bool, optional): use the original one call per bit stream.
+            Defaults to False.
+
+    Returns:
+        Iterator[BinarySequence]: Random chunks (the last may be shorter).
+    """
+    if n is not None and (not isinstance(n, int) or n <= 0):
+        raise ValueError("n must be a positive integer or None")
+    if not isinstance(chunk_bits, int) or chunk_bits <= 0:
+        raise ValueError("chunk_bits must be a positive integer")
+
+    return _random_chunks(
+        _bit_source(seed, RandomBackend(backend), legacy), n, chunk_bits
+    )
+
+
+def _random_chunks(
+    source: Callable[[int], BinarySequence], n: int | None, chunk_bits: int
+) -> Iterator[BinarySequence]:
+    remaining = n
+    while remaining is None or remaining > 0:
+        size = chunk_bits if remaining is None else min(chunk_bits, remaining)
+        yield source(size)
+        if remaining is not None:
+            remaining -= size
+
+
+def _bit_source(
+    seed: Seed, backend: RandomBackend, legacy: bool
+) -> Callable[[int], BinarySequence]:
+    """Return a function drawing the next n random bits from a seeded source."""
+    if backend == RandomBackend.PYTHON:
+        rng: random.Random = random.Random(seed)
+        if legacy:
+            return lambda n: BinarySequence([rng.randint(0, 1) for _ in range(n)])
+        return lambda n: _from_random_bytes(rng.randbytes((n + 7) // 8), n)
+
+    if legacy:
+        raise ValueError("legacy generation is only available for the python backend")
+    if seed is not None and not isinstance(seed, int):
+        raise TypeError(f"The {backend} backend needs an int seed (or None).")
+
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError(f"NumPy is required for the {backend} backend.") from e
+
+    bit_generator = (
+        np.random.PCG64 if backend == RandomBackend.PCG64 else np.random.Philox
+    )
+    generator = np.random.Generator(bit_generator(seed))
+    return lambda n: _from_random_bytes(generator.bytes((n + 7) // 8), n)
+
+
+def _from_random_bytes(data: bytes, n: int) -> BinarySequence:
+    """First n bits of random bytes (most significant bit first)."""
+    value = int.from_bytes(data, "big") >> (len(data) * 8 - n)
+    return BinarySequence._from_packed(value, n)
@@ -0,0 +1,635 @@
+"""Statistical randomness tests in the style of NIST SP 800-22.
+
+Each test returns `RandomnessResult(name, statistic, p_value)`; a p-value
+below the significance level (commonly 0.01) counts as a failure. Bits are
+processed in chunks of unpacked NumPy arrays, so every test except the
+spectral (DFT) test also runs over a stream with `RandomnessAccumulator`.
+"""
+
+from __future__ import annotations
+
+import math
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, NamedTuple, TypeAlias
+
+from .base import BinarySequence
+from .stream import DEFAULT_CHUNK_BITS, chunked
+
+__all__ = (
+    "RandomnessResult",
+    "RandomnessAccumulator",
+    "monobit",
+    "block_frequency",
+    "runs",
+    "longest_run",
+    "serial",
+    "approximate_entropy",
+    "cumulative_sums",
+    "spectral",
+    "run_all",
+)
+
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+    NpNDArrayUInt8: TypeAlias = NDArray[np.uint8]
+    NpNDArrayInt64: TypeAlias = NDArray[np.int64]
+
+
+class RandomnessResult(NamedTuple):
+    name: str
+    statistic: float
+    p_value: float
+
+    def passed(self, alpha: float = 0.01) -> bool:
+        """True if the p-value is at least the significance level alpha."""
+        return self.p_value >= alpha
+
+
+# longest run of ones: (block size M, minimum n, smallest class, class probabilities)
+_LONGEST_RUN_TABLES = (
+    (8, 128, 1, (0.2148, 0.3672, 0.2305, 0.1875)),
+    (128, 6272, 4, (0.1174, 0.2430, 0.2493, 0.1752, 0.1027, 0.1124)),
+    (10_000, 750_000, 10, (0.0882, 0.2092, 0.2483, 0.1933, 0.1208, 0.0675, 0.0727)),
+)
+_MAX_PATTERN_BITS = 24
+
+
+def monobit(seq: BinarySequence) -> RandomnessResult:
+    """Frequency (monobit) test: proportion of ones close to 1/2."""
+    return _run(seq, _Monobit())[0]
+
+
+def block_frequency(seq: BinarySequence, block_size: int = 128) -> RandomnessResult:
+    """Frequency within blocks of block_size bits (trailing bits ignored)."""
+    return _run(seq, _BlockFrequency(block_size))[0]
+
+
+def runs(seq: BinarySequence) -> RandomnessResult:
+    """Runs test: number of runs of identical bits."""
+    return _run(seq, _Runs())[0]
+
+
+def longest_run(seq: BinarySequence) -> RandomnessResult:
+    """Longest run of ones in blocks (block size chosen from the length).
+
+    Needs at least 128 bits; 8, 128 or 10,000 bit blocks are used from 128,
+    6,272 and 750,000 bits respectively.
+    """
+    return _run(seq, _LongestRun(_longest_run_table(seq.length)))[0]
+
+
+def serial(
+    seq: BinarySequence, m: int | None = None
+) -> tuple[RandomnessResult, RandomnessResult]:
+    """Serial test: frequency of every overlapping m-bit pattern.
+
+    Args:
+        seq (BinarySequence): Sequence to test.
+        m (int | None, optional): Pattern length, 2 or more. Defaults to None
+            (min(16, floor(log2(n)) - 3)).
+
+    Returns:
+        tuple[RandomnessResult, RandomnessResult]: The two serial p-values.
+    """
+    m = _default_serial_m(seq.length) if m is None else m
+    results = _run(seq, _Serial(_Patterns(m), m))
+    return results[0], results[1]
+
+
+def approximate_entropy(seq: BinarySequence, m: int | None = None) -> RandomnessResult:
+    """Approximate entropy test: m and m+1 bit pattern frequencies.
+
+    Args:
+        seq (BinarySequence): Sequence to test.
+        m (int | None, optional): Pattern length, 1 or more. Defaults to None
+            (min(10, floor(log2(n)) - 6)).
+
+    Returns:
+        RandomnessResult: Result.
+    """
+    m = _default_apen_m(seq.length) if m is None else m
+    return _run(seq, _ApproximateEntropy(_Patterns(m + 1), m))[0]
+
+
+def cumulative_sums(
+    seq: BinarySequence,
+) -> tuple[RandomnessResult, RandomnessResult]:
+    """Cumulative sums test, forward and backward."""
+    results = _run(seq, _CumulativeSums())
+    return results[0], results[1]
+
+
+def spectral(seq: BinarySequence) -> RandomnessResult:
+    """Discrete Fourier transform (spectral) test for periodic features.
+
+    Needs the whole sequence at once, so it is not part of
+    RandomnessAccumulator.
+    """
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError("NumPy is required for randomness tests.") from e
+
+    n = seq.length
+    signed = seq.to_numpy().astype(np.float64) * 2.0 - 1.0
+    modulus = np.abs(np.fft.rfft(signed)[: n // 2])
+    threshold = math.sqrt(math.log(1 / 0.05) * n)
+    expected = 0.95 * n / 2
+    observed = int(np.count_nonzero(modulus < threshold))
+    d = (observed - expected) / math.sqrt(n * 0.95 * 0.05 / 4)
+    return RandomnessResult("spectral", d, math.erfc(abs(d) / math.sqrt(2)))
+
+
+def run_all(
+    seq: BinarySequence,
+    block_size: int = 128,
+    serial_m: int | None = None,
+    apen_m: int | None = None,
+) -> list[RandomnessResult]:
+    """Run every test on one sequence (a single pass plus the spectral test).
+
+    Args:
+        seq (BinarySequence): Sequence to test, at least 128 bits.
+        block_size (int, optional): Block frequency block size. Defaults to 128.
+        serial_m (int | None, optional): Serial pattern length. Defaults to None
+            (chosen from the length, see `serial`).
+        apen_m (int | None, optional): Approximate entropy pattern length.
+            Defaults to None (chosen from the length, see `approximate_entropy`).
+
+    Returns:
+        list[RandomnessResult]: Results in the order of RandomnessAccumulator,
+            followed by spectral.
+    """
+    accumulator = RandomnessAccumulator(
+        block_size,
+        _default_serial_m(seq.length) if serial_m is None else serial_m,
+        _default_apen_m(seq.length) if apen_m is None else apen_m,
+        _longest_run_table(seq.length)[0],
+    )
+    accumulator.update(seq)
+    return [*accumulator.results(), spectral(seq)]
+
+
+class RandomnessAccumulator:
+    """Runs the chunkable tests over a stream of BinarySequence chunks.
+
+    Feed chunks of any size with `update` (or `update_stream`), then call
+    `results` for monobit, block frequency, runs, longest run, serial (x2),
+    approximate entropy and cumulative sums (x2) over everything seen so
+    far. Memory use is bounded by the chunk size and 2**max(serial_m,
+    apen_m + 1) pattern counters.
+    """
+
+    def __init__(
+        self,
+        block_size: int = 128,
+        serial_m: int = 16,
+        apen_m: int = 10,
+        longest_run_block: int | None = None,
+    ) -> None:
+        """
+        Args:
+            block_size (int, optional): Block frequency block size.
+                Defaults to 128.
+            serial_m (int, optional): Serial pattern length. Defaults to 16.
+            apen_m (int, optional): Approximate entropy pattern length.
+                Defaults to 10.
+            longest_run_block (int | None, optional): Longest run block size
+                (8, 128 or 10000). Defaults to None (track all three and pick
+                from the final length).
+        """
+        tables = [
+            table
+            for table in _LONGEST_RUN_TABLES
+            if longest_run_block in (None, table[0])
+        ]
+        if not tables:
+            raise ValueError("longest_run_block must be 8, 128 or 10000.")
+
+        patterns = _Patterns(max(serial_m, apen_m + 1))
+        self._tests: list[_Test] = [
+            _Monobit(),
+            _BlockFrequency(block_size),
+            _Runs(),
+            _LongestRun(*tables),
+            _Serial(patterns, serial_m),
+            _ApproximateEntropy(patterns, apen_m),
+            _CumulativeSums(),
+        ]
+        self._states: list[_State] = [patterns, *self._tests]
+        self._n = 0
+
+    @property
+    def n(self) -> int:
+        """Number of bits seen."""
+        return self._n
+
+    def update(self, chunk: BinarySequence) -> None:
+        """Add the next chunk of the stream."""
+        for bits in _bit_arrays([chunk]):
+            for state in self._states:
+                state.update(bits)
+            self._n += len(bits)
+
+    def update_stream(self, stream: Iterable[BinarySequence]) -> None:
+        """Add every chunk of a stream."""
+        for chunk in stream:
+            self.update(chunk)
+
+    def results(self) -> list[RandomnessResult]:
+        """Results over all bits seen so far."""
+        if not self._n:
+            raise ValueError("No bits have been added.")
+        return [result for test in self._tests for result in test.result(self._n)]
+
+
+def _igamc(a: float, x: float) -> float:
+    """Regularized upper incomplete gamma function Q(a, x)."""
+    if a <= 0 or x < 0:
+        raise ValueError("igamc requires a > 0 and x >= 0.")
+    if x == 0:
+        return 1.0
+    log_prefix = a * math.log(x) - x - math.lgamma(a)
+
+    if x < a + 1:
+        # series for P(a, x)
+        term = total = 1.0 / a
+        denom = a
+        while abs(term) > abs(total) * 1e-15:
+            denom += 1
+            term *= x / denom
+            total += term
+        return max(0.0, 1.0 - total * math.exp(log_prefix))
+
+    # continued fraction for Q(a, x) (modified Lentz)
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+    for i in range(1, 10_000):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-15:
+            break
+    return math.exp(log_prefix) * h
+
+
+class _State(ABC):
+    @abstractmethod
+    def update(self, bits: NpNDArrayUInt8) -> None:
+        """Add the next chunk of unpacked bits."""
+
+
+class _Test(_State):
+    @abstractmethod
+    def result(self, n: int) -> tuple[RandomnessResult, ...]:
+        """Results after n bits."""
+
+
+class _Monobit(_Test):
+    def __init__(self) -> None:
+        self.ones = 0
+
+    def update(self, bits: NpNDArrayUInt8) -> None:
+        import numpy as np
+
+        self.ones += int(bits.sum(dtype=np.int64))
+
+    def result(self, n: int) -> tuple[RandomnessResult, ...]:
+        s_obs = abs(2 * self.ones - n) / math.sqrt(n)
+        return (RandomnessResult("monobit", s_obs, math.erfc(s_obs / math.sqrt(2))),)
+
+
+class _BlockFrequency(_Test):
+    def __init__(self, block_size: int) -> None:
+        if not isinstance(block_size, int) or block_size <= 0:
+            raise ValueError("block_size must be a positive integer")
+        self.block_size = block_size
+        self.blocks = 0
+        self.squares = 0.0
+        self.carry = _empty_bits()
+
+    def update(self, bits: NpNDArrayUInt8) -> None:
+        import numpy as np
+
+        self.carry, blocks = _take_blocks(self.carry, bits, self.block_size)
+        proportions = blocks.sum(axis=1, dtype=np.int64) / self.block_size
+        self.squares += float(((proportions - 0.5) ** 2).sum())
+        self.blocks += len(blocks)
+
+    def result(self, n: int) -> tuple[RandomnessResult, ...]:
+        if not self.blocks:
+            raise ValueError("block_frequency needs at least one full block.")
+        chi2 = 4 * self.block_size * self.squares
+        return (
+            RandomnessResult(
+                "block_frequency", chi2, _igamc(self.blocks / 2, chi2 / 2)
+            ),
+        )
+
+
+class _Runs(_Test):
+    def __init__(self) -> None:
+        self.ones = 0
+        self.changes = 0
+        self.last = -1
+
+    def update(self, bits: NpNDArrayUInt8) -> None:
+        import numpy as np
+
+        self.ones += int(bits.sum(dtype=np.int64))
+        self.changes += int(np.count_nonzero(bits[1:] != bits[:-1]))
+        self.changes += self.last not in (-1, int(bits[0]))
+        self.last = int(bits[-1])
+
+    def result(self, n: int) -> tuple[RandomnessResult, ...]:
+        pi = self.ones / n
+        runs_obs = self.changes + 1
+        if abs(pi - 0.5) >= 2 / math.sqrt(n):
+            # frequency prerequisite failed, the runs test is not applicable
+            return (RandomnessResult("runs", runs_obs, 0.0),)
+        spread = 2 * math.sqrt(2 * n) * pi * (1 - pi)
+        p_value = math.erfc(abs(runs_obs - 2 * n * pi * (1 - pi)) / spread)
+        return (RandomnessResult("runs", runs_obs, p_value),)
+
+
+class _LongestRun(_Test):
+    def __init__(self, *tables: tuple[int, int, int, tuple[float, ...]]) -> None:
+        import numpy as np
+
+        self.tables = tables
+        self.carries = [_empty_bits() for _ in tables]
+        self.counts = [np.zeros(len(table[3]), dtype=np.int64) for table in tables]
+
+    def update(self, bits: NpNDArrayUInt8) -> None:
+        import numpy as np
+
+        for i, (block_size, _, low, probabilities) in enumerate(self.tables):
+            self.carries[i], blocks = _take_blocks(self.carries[i], bits, block_size)
+            if len(blocks):
+                classes = np.clip(
+                    _longest_ones(blocks) - low, 0, len(probabilities) - 1
+                )
+                self.counts[i] += np.bincount(classes, minlength=len(probabilities))
+
+    def result(self, n: int) -> tuple[RandomnessResult, ...]:
+        table = _longest_run_table(n)
+        if table not in self.tables:
+            raise ValueError(f"longest_run needs {table[0]} bit blocks for n={n}.")
+        counts = self.counts[self.tables.index(table)].tolist()
+        probabilities = table[3]
+        blocks = sum(counts)
+        chi2 = sum(
+            (count - blocks * p) ** 2 / (blocks * p)
+            for count, p in zip(counts, probabilities, strict=True)
+        )
+        k = len(probabilities) - 1
+        return (RandomnessResult("longest_run", chi2, _igamc(k / 2, chi2 / 2)),)
+
+
+class _Patterns(_State):
+    """Circular counts of every overlapping `width` bit pattern."""
+
+    def __init__(self, width: int) -> None:
+        import numpy as np
+
+        if not isinstance(width, int) or not 1 <= width <= _MAX_PATTERN_BITS:
+            raise ValueError(
+                f"Pattern length must be between 1 and {_MAX_PATTERN_BITS}."
+            )
+        self.width = width
+        self.counts = np.zeros(1 << width, dtype=np.int64)
+        self.head = _empty_bits()
+        self.carry = _empty_bits()
+
+    def update(self, bits: NpNDArrayUInt8) -> None:
+        import numpy as np
+
+        if len(self.head) < self.width - 1:
+            self.head = np.concatenate((self.head, bits[: self.width - 1]))
+            self.head = self.head[: self.width - 1]
+        data = np.concatenate((self.carry, bits))
+        self.counts += _pattern_counts(data, self.width)
+        self.carry = data[len(data) - (self.width - 1) :]
+
+    def circular_counts(self, m: int, n: int) -> list[int]:
+        """Counts of m bit patterns with the sequence wrapped around."""
+        import numpy as np
+
+        if n < self.width:
+            raise ValueError(f"Pattern tests need at least {self.width} bits.")
+        wrap = np.concatenate((self.carry, self.head))
+        counts = self.counts + _pattern_counts(wrap, self.width)
+        out: list[int] = counts.reshape(1 << m, -1).sum(axis=1).tolist()
+        return out
+
+
+class _Serial(_Test):
+    def __init__(self, patterns: _Patterns, m: int) -> None:
+        if not isinstance(m, int) or not 2 <= m <= patterns.width:
+            raise ValueError(f"Serial m must be between 2 and {_MAX_PATTERN_BITS}.")
+        self.patterns = patterns
+        self.m = m
+
+    def update(self, bits: NpNDArrayUInt8) -> None:
+        pass  # counted by the shared _Patterns state
+
+    def result(self, n: int) -> tuple[RandomnessResult, ...]:
+        m = self.m
+
+        def psi2(k: int) -> float:
+            if k <= 0:
+                return 0.0
+            squares = sum(c * c for c in self.patterns.circular_counts(k, n))
+            return (1 << k) * squares / n - n
+
+        psi_m, psi_m1, psi_m2 = psi2(m), psi2(m - 1), psi2(m - 2)
+        delta1 = psi_m - psi_m1
+        delta2 = psi_m - 2 * psi_m1 + psi_m2
+        return (
+            RandomnessResult("serial_1", delta1, _igamc(2 ** (m - 2), delta1 / 2)),
+            RandomnessResult("serial_2", delta2, _igamc(2 ** (m - 3), delta2 / 2)),
+        )
+
+
+class _ApproximateEntropy(_Test):
+    def __init__(self, patterns: _Patterns, m: int) -> None:
+        if not isinstance(m, int) or not 1 <= m < patterns.width:
+            raise ValueError(
+                f"Approximate entropy m must be between 1 and {_MAX_PATTERN_BITS - 1}."
+            )
+        self.patterns = patterns
+        self.m = m
+
+    def update(self, bits: NpNDArrayUInt8) -> None:
+        pass  # counted by the shared _Patterns state
+
+    def result(self, n: int) -> tuple[RandomnessResult, ...]:
+        def phi(k: int) -> float:
+            counts = self.patterns.circular_counts(k, n)
+            return sum(c / n * math.log(c / n) for c in counts if c)
+
+        apen = phi(self.m) - phi(self.m + 1)
+        chi2 = 2 * n * (math.log(2) - apen)
+        return (
+            RandomnessResult(
+                "approximate_entropy", chi2, _igamc(2 ** (self.m - 1), chi2 / 2)
+            ),
+        )
+
+
+class _CumulativeSums(_Test):
+    def __init__(self) -> None:
+        self.total = 0
+        # extremes of the partial sums S_1..S_n (forward) and S_0..S_n-1 (backward)
+        self.forward = (0, 0)
+        self.backward = (0, 0)
+        self.started = False
+
+    def update(self, bits: NpNDArrayUInt8) -> None:
+        import numpy as np
+
+        sums = np.cumsum(bits.astype(np.int64) * 2 - 1) + self.total
+        low, high = int(sums.min()), int(sums.max())
+        self.forward = (
+            (min(self.forward[0], low), max(self.forward[1], high))
+            if self.started
+            else (low, high)
+        )
+        before = sums[:-1]
+        candidates = [self.total] + (
+            [int(before.min()), int(before.max())] if len(before) else []
+        )
+        self.backward = (
+            min(self.backward[0], *candidates),
+            max(self.backward[1], *candidates),
+        )
+        self.total = int(sums[-1])
+        self.started = True
+
+    def result(self, n: int) -> tuple[RandomnessResult, ...]:
+        z_forward = max(-self.forward[0], self.forward[1])
+        z_backward = max(self.total - self.backward[0], self.backward[1] - self.total)
+        return (
+            RandomnessResult("cusum_forward", z_forward, _cusum_p_value(z_forward, n)),
+            RandomnessResult(
+                "cusum_backward", z_backward, _cusum_p_value(z_backward, n)
+            ),
+        )
+
+
+def _cusum_p_value(z: int, n: int) -> float:
+    if z == 0:
+        return 1.0
+
+    def phi(x: float) -> float:
+        return 0.5 * math.erfc(-x / math.sqrt(2))
+
+    # summation limits use C integer division, as in the reference implementation
+    ratio = n // z
+    scale = z / math.sqrt(n)
+    p_value = 1.0
+    for k in range(int((1 - ratio) / 4), (ratio - 1) // 4 + 1):
+        p_value -= phi((4 * k + 1) * scale) - phi((4 * k - 1) * scale)
+    for k in range(int((-3 - ratio) / 4), (ratio - 1) // 4 + 1):
+        p_value += phi((4 * k + 3) * scale) - phi((4 * k + 1) * scale)
+    return min(1.0, max(0.0, p_value))
+
+
+def _run(seq: BinarySequence, test: _Test) -> tuple[RandomnessResult, ...]:
+    if not isinstance(seq, BinarySequence):
+        raise TypeError("Randomness tests require a BinarySequence.")
+    states: list[_State] = [test]
+    if isinstance(test, _Serial | _ApproximateEntropy):
+        states.insert(0, test.patterns)
+    for bits in _bit_arrays([seq]):
+        for state in states:
+            state.update(bits)
+    return test.result(seq.length)
+
+
+def _bit_arrays(stream: Iterable[BinarySequence]) -> Iterator[NpNDArrayUInt8]:
+    """Unpacked uint8 arrays of at most DEFAULT_CHUNK_BITS bits."""
+    import numpy as np
+
+    for chunk in stream:
+        for piece in chunked(chunk, DEFAULT_CHUNK_BITS):
+            packed = np.frombuffer(piece.packed_bytes, dtype=np.uint8)
+            yield np.unpackbits(packed, count=piece.length)
+
+
+def _take_blocks(
+    carry: NpNDArrayUInt8, bits: NpNDArrayUInt8, size: int
+) -> tuple[NpNDArrayUInt8, NpNDArrayUInt8]:
+    """Split carry + bits into whole blocks of size bits and the leftover."""
+    import numpy as np
+
+    data = np.concatenate((carry, bits))
+    whole = len(data) // size * size
+    return data[whole:], data[:whole].reshape(-1, size)
+
+
+def _longest_ones(blocks: NpNDArrayUInt8) -> NpNDArrayInt64:
+    """Longest run of ones in each row."""
+    import numpy as np
+
+    rows, size = blocks.shape
+    # a zero on both sides of every row, so runs never cross rows
+    padded = np.zeros((rows, size + 2), dtype=np.uint8)
+    padded[:, 1:-1] = blocks
+    zero_positions = np.flatnonzero(padded.ravel() == 0)
+    gaps = np.diff(zero_positions) - 1
+    zeros_per_row = size + 2 - blocks.sum(axis=1, dtype=np.int64)
+    starts = np.concatenate(([0], np.cumsum(zeros_per_row)[:-1]))
+    out: NpNDArrayInt64 = np.maximum.reduceat(gaps, starts)
+    return out
+
+
+def _pattern_counts(bits: NpNDArrayUInt8, width: int) -> NpNDArrayInt64:
+    """Counts of every overlapping (non-wrapping) width bit pattern."""
+    import numpy as np
+
+    windows = len(bits) - width + 1
+    if windows <= 0:
+        return np.zeros(1 << width, dtype=np.int64)
+    values = np.zeros(windows, dtype=np.uint32)
+    for offset in range(width):
+        values <<= 1
+        values |= bits[offset : offset + windows]
+    out: NpNDArrayInt64 = np.bincount(values, minlength=1 << width)
+    return out
+
+
+def _longest_run_table(n: int) -> tuple[int, int, int, tuple[float, ...]]:
+    for table in reversed(_LONGEST_RUN_TABLES):
+        if n >= table[1]:
+            return table
+    raise ValueError("longest_run needs at least 128 bits.")
+
+
+def _default_serial_m(n: int) -> int:
+    return max(2, min(16, n.bit_length() - 4))
+
+
+def _default_apen_m(n: int) -> int:
+    return max(1, min(10, n.bit_length() - 7))
+
+
+def _empty_bits() -> NpNDArrayUInt8:
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError("NumPy is required for randomness tests.") from e
+    return np.zeros(0, dtype=np.uint8)
@@ -0,0 +1,378 @@
+"""Run-length analysis and a run-length encoded sequence"""
+
+from __future__ import annotations
+
+import operator
+import re
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from itertools import accumulate, cycle, repeat
+from typing import TYPE_CHECKING, Literal, Self, TypeAlias, overload
+
+from .base import BinarySequence
+
+__all__ = (
+    "run_lengths",
+    "run_boundaries",
+    "run_count",
+    "run_histogram",
+    "longest_run",
+    "RunLengthSequence",
+)
+
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+    NpNDArrayInt64: TypeAlias = NDArray[np.int64]
+
+_RUN_PATTERN = re.compile("0+|1+")
+_BIT_OPS = {"xor": operator.xor, "and": operator.and_, "or": operator.or_}
+
+
+def run_lengths(seq: BinarySequence) -> list[tuple[int, int]]:
+    """Run lengths [(digit, run count)] of a sequence.
+
+    E.g. 111001 >> [(1, 3), (0, 2), (1, 1)]
+    """
+    first = _first_bit(seq)
+    try:
+        import numpy as np
+    except ImportError:
+        # runs alternate between the two digits, starting with first
+        return list(zip(cycle((first, 1 - first)), _regex_run_lengths(seq)))
+
+    bounds = _run_bounds_array(seq)
+    digits = np.arange(first, first + len(bounds) - 1) & 1
+    return list(zip(digits.tolist(), np.diff(bounds).tolist(), strict=True))
+
+
+def run_boundaries(seq: BinarySequence) -> list[int]:
+    """Start index of every run (always begins with 0)."""
+    return _run_bounds(seq)[0]
+
+
+def run_count(seq: BinarySequence) -> int:
+    """Number of runs, from a popcount of the packed transition mask."""
+    transitions = (seq._value ^ (seq._value >> 1)) & ((1 << (seq.length - 1)) - 1)
+    return transitions.bit_count() + 1
+
+
+def run_histogram(seq: BinarySequence, bit: int | None = None) -> dict[int, int]:
+    """Number of runs of each length.
+
+    Args:
+        seq (BinarySequence): Sequence.
+        bit (int | None, optional): Only count runs of this digit (0 or 1).
+            Defaults to None (runs of both digits).
+
+    Returns:
+        dict[int, int]: {run length: number of runs}, sorted by length.
+    """
+    if bit not in (None, 0, 1):
+        raise ValueError("bit must be 0, 1 or None")
+    # runs alternate, so runs of bit are every other run
+    first_run = 0 if bit is None or bit == _first_bit(seq) else 1
+    run_step = 1 if bit is None else 2
+
+    try:
+        import numpy as np
+    except ImportError:
+        lengths = _regex_run_lengths(seq)[first_run::run_step]
+        return dict(sorted(Counter(lengths).items()))
+
+    counts = np.bincount(np.diff(_run_bounds_array(seq))[first_run::run_step])
+    present = np.flatnonzero(counts)
+    return dict(zip(present.tolist(), counts[present].tolist(), strict=True))
+
+
+def longest_run(seq: BinarySequence, bit: int = 1) -> int:
+    """Length of the longest run of bit (0 if there is none).
+
+    Uses O(log(run length)) shift-and-AND steps on the packed value: after
+    the doubling phase, v marks every position that starts k consecutive
+    ones, and a binary search then extends k to the exact maximum.
+    """
+    if bit not in (0, 1):
+        raise ValueError("bit must be 0 or 1")
+    value = seq._value if bit else seq._value ^ ((1 << seq.length) - 1)
+    if not value:
+        return 0
+
+    k = 1
+    while shifted := value & (value >> k):
+        value = shifted
+        k *= 2
+    step = k // 2
+    while step:
+        if shifted := value & (value >> step):
+            value = shifted
+            k += step
+        step //= 2
+    return k
+
+
+def _first_bit(seq: BinarySequence) -> int:
+    return (seq._value >> (seq.length - 1)) & 1
+
+
+def _run_bounds(seq: BinarySequence) -> tuple[list[int], list[int]]:
+    """(starts, stops) of every run, via NumPy diff or a regex scan."""
+    if not isinstance(seq, BinarySequence):
+        raise TypeError("Run analysis requires a BinarySequence.")
+    try:
+        bounds: list[int] = _run_bounds_array(seq).tolist()
+    except ImportError:
+        bounds = [0, *accumulate(_regex_run_lengths(seq))]
+    return bounds[:-1], bounds[1:]
+
+
+def _regex_run_lengths(seq: BinarySequence) -> list[int]:
+    """Run lengths without NumPy, from a C-level regex scan of bit_string."""
+    return list(map(len, _RUN_PATTERN.findall(seq.bit_string)))
+
+
+def _run_bounds_array(seq: BinarySequence) -> NpNDArrayInt64:
+    """Run boundaries 0, start_1, ..., start_k, length as one NumPy array."""
+    import numpy as np
+
+    bits = np.unpackbits(
+        np.frombuffer(seq.packed_bytes, dtype=np.uint8), count=seq.length
+    )
+    changes = np.flatnonzero(bits[1:] != bits[:-1]) + 1
+    out: NpNDArrayInt64 = np.concatenate(([0], changes, [seq.length]))
+    return out
+
+
+class RunLengthSequence:
+    """Binary sequence stored as runs, for sparse or long-run data.
+
+    Only the first bit and the end offset of each run are stored (runs
+    alternate between 0 and 1), so idle patterns and mostly-zero masks take
+    memory proportional to their number of runs. `ones`, indexing, slicing,
+    inversion and bitwise ops work on the runs directly; convert with
+    `to_sequence` for everything else.
+
+    RunLengthSequence objects are immutable and hashable.
+    """
+
+    __slots__ = ("_first", "_ends", "_ones")
+
+    _first: int
+    _ends: tuple[int, ...]
+    _ones: int
+
+    def __init__(self, runs: Iterable[tuple[int, int]]) -> None:
+        """
+        Args:
+            runs (Iterable[tuple[int, int]]): (digit, run length) pairs, as
+                returned by `BinarySequence.run_lengths`. Adjacent runs of the
+                same digit are merged.
+        """
+        first = -1
+        ends: list[int] = []
+        position = 0
+        last = -1
+        for bit, count in runs:
+            if bit not in (0, 1):
+                raise ValueError("Run digits must be 0 or 1.")
+            if not isinstance(count, int) or count <= 0:
+                raise ValueError("Run lengths must be positive integers.")
+            position += count
+            if bit == last:
+                ends[-1] = position
+            else:
+                ends.append(position)
+                last = bit
+                if first < 0:
+                    first = bit
+        if not ends:
+            raise ValueError("Input bits cannot be None or empty.")
+        self._init_runs(first, tuple(ends))
+
+    @classmethod
+    def _from_ends(cls, first: int, ends: tuple[int, ...]) -> Self:
+        """Trusted constructor from canonical (alternating) runs."""
+        out = cls.__new__(cls)
+        out._init_runs(first, ends)
+        return out
+
+    @classmethod
+    def from_sequence(cls, seq: BinarySequence) -> Self:
+        """Run-length encode a BinarySequence."""
+        return cls._from_ends(_first_bit(seq), tuple(_run_bounds(seq)[1]))
+
+    def _init_runs(self, first: int, ends: tuple[int, ...]) -> None:
+        object.__setattr__(self, "_first", first)
+        object.__setattr__(self, "_ends", ends)
+        ones = sum(
+            ends[i] - (ends[i - 1] if i else 0) for i in range(1 - first, len(ends), 2)
+        )
+        object.__setattr__(self, "_ones", ones)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(length={len(self)}, runs={self.run_count})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RunLengthSequence):
+            return NotImplemented
+        return self._first == other._first and self._ends == other._ends
+
+    def __hash__(self) -> int:
+        return hash((self._first, self._ends))
+
+    def __len__(self) -> int:
+        return self._ends[-1]
+
+    def __iter__(self) -> Iterator[int]:
+        for bit, count in self.runs:
+            yield from repeat(bit, count)
+
+    @overload
+    def __getitem__(self, key: int) -> int: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> RunLengthSequence: ...
+
+    def __getitem__(self, key: int | slice) -> int | RunLengthSequence:
+        length = len(self)
+        if isinstance(key, slice):
+            start, stop, step = key.indices(length)
+            if step != 1:
+                sliced = self.to_sequence()[key]
+                assert isinstance(sliced, BinarySequence)
+                return RunLengthSequence.from_sequence(sliced)
+            if stop <= start:
+                raise ValueError("Input bits cannot be None or empty.")
+            first_run = bisect_right(self._ends, start)
+            last_run = bisect_left(self._ends, stop)
+            ends = tuple(end - start for end in self._ends[first_run:last_run]) + (
+                stop - start,
+            )
+            return RunLengthSequence._from_ends(self._run_bit(first_run), ends)
+
+        if key < 0:
+            key += length
+        if not 0 <= key < length:
+            raise IndexError("RunLengthSequence index out of range")
+        return self._run_bit(bisect_right(self._ends, key))
+
+    def __invert__(self) -> RunLengthSequence:
+        return self.inverted()
+
+    def __xor__(self, other: object) -> RunLengthSequence:
+        if not isinstance(other, RunLengthSequence | BinarySequence):
+            return NotImplemented
+        return self.xor(other)
+
+    def __and__(self, other: object) -> RunLengthSequence:
+        if not isinstance(other, RunLengthSequence | BinarySequence):
+            return NotImplemented
+        return self.bitwise_and(other)
+
+    def __or__(self, other: object) -> RunLengthSequence:
+        if not isinstance(other, RunLengthSequence | BinarySequence):
+            return NotImplemented
+        return self.bitwise_or(other)
+
+    @property
+    def length(self) -> int:
+        return len(self)
+
+    @property
+    def runs(self) -> list[tuple[int, int]]:
+        """Run lengths [(digit, run count)]."""
+        starts = (0, *self._ends[:-1])
+        return [
+            (self._run_bit(i), end - start)
+            for i, (start, end) in enumerate(zip(starts, self._ends, strict=True))
+        ]
+
+    @property
+    def run_count(self) -> int:
+        return len(self._ends)
+
+    @property
+    def ones(self) -> int:
+        """Number of 1's."""
+        return self._ones
+
+    @property
+    def zeros(self) -> int:
+        """Number of 0's."""
+        return len(self) - self._ones
+
+    def longest_run(self, bit: int = 1) -> int:
+        """Length of the longest run of bit (0 if there is none)."""
+        if bit not in (0, 1):
+            raise ValueError("bit must be 0 or 1")
+        return max((count for b, count in self.runs if b == bit), default=0)
+
+    def to_sequence(self) -> BinarySequence:
+        """Expand to a BinarySequence."""
+        return BinarySequence("".join(str(bit) * count for bit, count in self.runs))
+
+    def inverted(self) -> RunLengthSequence:
+        """Invert the sequence (O(1): the runs stay, the digits flip)."""
+        return RunLengthSequence._from_ends(1 - self._first, self._ends)
+
+    def xor(self, other: RunLengthSequence | BinarySequence) -> RunLengthSequence:
+        """Bitwise XOR, in time proportional to the number of runs."""
+        return self._merge(other, "xor")
+
+    def bitwise_and(
+        self, other: RunLengthSequence | BinarySequence
+    ) -> RunLengthSequence:
+        """Bitwise AND, in time proportional to the number of runs."""
+        return self._merge(other, "and")
+
+    def bitwise_or(
+        self, other: RunLengthSequence | BinarySequence
+    ) -> RunLengthSequence:
+        """Bitwise OR, in time proportional to the number of runs."""
+        return self._merge(other, "or")
+
+    def _run_bit(self, index: int) -> int:
+        return self._first ^ (index & 1)
+
+    def _merge(
+        self,
+        other: RunLengthSequence | BinarySequence,
+        op: Literal["xor", "and", "or"],
+    ) -> RunLengthSequence:
+        if isinstance(other, BinarySequence):
+            other = RunLengthSequence.from_sequence(other)
+        if not isinstance(other, RunLengthSequence):
+            raise TypeError(f"{op} requires a RunLengthSequence or BinarySequence.")
+        if len(other) != len(self):
+            raise ValueError(f"{op} requires sequences of the same length.")
+
+        combine = _BIT_OPS[op]
+        a_ends, b_ends = self._ends, other._ends
+        a_bit, b_bit = self._first, other._first
+        i = j = 0
+        ends: list[int] = []
+        bit = -1
+        first = -1
+        while i < len(a_ends):
+            end = min(a_ends[i], b_ends[j])
+            value = combine(a_bit, b_bit)
+            if value == bit:
+                ends[-1] = end
+            else:
+                ends.append(end)
+                bit = value
+                if first < 0:
+                    first = value
+            if a_ends[i] == end:
+                i += 1
+                a_bit ^= 1
+            if b_ends[j] == end:
+                j += 1
+                b_bit ^= 1
+        return RunLengthSequence._from_ends(first, tuple(ends))
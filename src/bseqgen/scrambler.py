@@ -0,0 +1,253 @@
+"""Additive and self-synchronizing (multiplicative) scramblers.
+
+With feedback polynomial p(x) = 1 + x^a + ... + x^n, given as taps (n, a, ...)
+as for `LFSR`:
+
+- additive (synchronous): y = x ^ s, where s is the output of an LFSR that
+  runs independently of the data. Descrambling is the same operation, with
+  the same seed at the same point of the stream.
+- multiplicative (self-synchronizing): y[t] = x[t] ^ y[t - a] ^ ... ^ y[t - n]
+  and the descrambler computes x[t] = y[t] ^ y[t - a] ^ ... ^ y[t - n], so it
+  recovers the data after n correct bits whatever its initial state.
+
+Stages keep their state between calls, so a stream split into chunks of any
+size gives the same output as the whole sequence. Every step works on whole
+packed chunks: the keystream comes from the LFSR block generator, the
+descrambler is one XOR per tap, and the self-synchronizing scrambler uses
+p(D)^(2^J) = p(D^(2^J)): filtering the input by p(D) p(D^2) ... p(D^(2^(J-1)))
+gives y[t] = z[t] ^ XOR y[t - e 2^J], so blocks of min(taps) * 2^J output bits
+follow from earlier output with a few shifts and XORs.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from enum import StrEnum
+from typing import Literal
+
+from .base import BinarySequence
+from .lfsr import LFSR, _extend_recurrence
+from .polynomials import degree, poly_from_taps, poly_to_taps
+from .stream import _concat, _split
+
+__all__ = (
+    "ScramblerMode",
+    "SCRAMBLER_POLYNOMIALS",
+    "Scrambler",
+    "Descrambler",
+    "scramble",
+    "descramble",
+)
+
+# Standard scrambler feedback polynomials, as tap exponents.
+SCRAMBLER_POLYNOMIALS: dict[str, tuple[int, ...]] = {
+    "ieee802.11": (7, 4),  # additive, x^7 + x^4 + 1
+    "sonet": (7, 6),  # additive, frame synchronous x^7 + x^6 + 1
+    "dvb": (15, 14),  # additive, x^15 + x^14 + 1
+    "10gbase-r": (58, 39),  # multiplicative, x^58 + x^39 + 1 (64b/66b)
+}
+
+# target output block of the self-synchronizing scrambler recurrence
+_BLOCK_BITS = 1 << 14
+# input bits handled per pass, bounding the size of the packed integers
+_PIECE_BITS = 1 << 17
+
+
+class ScramblerMode(StrEnum):
+    ADDITIVE = "additive"
+    MULTIPLICATIVE = "multiplicative"
+
+
+class Scrambler:
+    """Scrambler stage for BinarySequence chunks.
+
+    `process` scrambles the next chunk and `stream` a whole chunk stream,
+    with the register state carried across chunks.
+    """
+
+    _descrambler = False
+
+    def __init__(
+        self,
+        poly: int | Sequence[int],
+        mode: ScramblerMode | Literal["additive", "multiplicative"] = (
+            ScramblerMode.ADDITIVE
+        ),
+        seed: int | None = None,
+    ) -> None:
+        """
+        Args:
+            poly (int | Sequence[int]): Feedback polynomial, packed or as tap
+                exponents, e.g. (58, 39) for x^58 + x^39 + 1.
+            mode (ScramblerMode | Literal['additive', 'multiplicative'],
+                optional): Scrambler type. Defaults to ScramblerMode.ADDITIVE.
+            seed (int | None, optional): Initial register state, the last n
+                bits of the register sequence (keystream for additive stages,
+                scrambled bits for multiplicative ones), most recent least
+                significant. Non-zero for additive stages.
+                Defaults to None (all ones).
+        """
+        self._poly = poly_from_taps(poly)
+        self._degree = degree(self._poly)
+        self._taps = poly_to_taps(self._poly)
+        self._mode = ScramblerMode(mode)
+
+        mask = (1 << self._degree) - 1
+        if seed is None:
+            seed = mask
+        if not isinstance(seed, int) or not 0 <= seed <= mask:
+            raise ValueError(f"Seed must be an integer below 2**{self._degree}.")
+        if self._mode == ScramblerMode.ADDITIVE and not seed:
+            raise ValueError("Additive scramblers need a non-zero seed.")
+        self._seed = seed
+
+        # y[t] = z[t] ^ XOR y[t - e * scale] for blocks up to min(taps) * scale
+        self._scale = 1 << max((_BLOCK_BITS // min(self._taps)).bit_length() - 1, 0)
+        self.reset()
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(poly={self._taps}, mode='{self._mode}', "
+            f"state={self.state:#x})"
+        )
+
+    @property
+    def poly(self) -> int:
+        """Packed feedback polynomial."""
+        return self._poly
+
+    @property
+    def taps(self) -> tuple[int, ...]:
+        """Feedback tap exponents, highest first."""
+        return self._taps
+
+    @property
+    def mode(self) -> ScramblerMode:
+        """Scrambler type."""
+        return self._mode
+
+    @property
+    def state(self) -> int:
+        """Current register state (see `seed`)."""
+        return self._outputs & ((1 << self._degree) - 1)
+
+    def reset(self) -> None:
+        """Return the register to its seed state."""
+        self._lfsr: LFSR | None = None
+        if self._mode == ScramblerMode.ADDITIVE:
+            # the keystream continues the sequence held in the register
+            self._lfsr = LFSR(self._poly, seed=self._seed)
+            self._lfsr.jump(self._degree)
+        # history of the last register (outputs) and data (inputs) bits,
+        # oldest first, as far back as the block recurrence reaches
+        self._inputs = 0
+        self._outputs = self._seed
+        if self._mode == ScramblerMode.MULTIPLICATIVE and not self._descrambler:
+            self._outputs = self._free_run(self._seed, self._degree * self._scale)
+
+    def process(self, chunk: BinarySequence) -> BinarySequence:
+        """Scramble the next chunk of the stream."""
+        if not isinstance(chunk, BinarySequence):
+            raise TypeError("process requires a BinarySequence.")
+        if self._lfsr is not None:
+            keystream = self._lfsr.next_bits(chunk.length)
+            window = (self._outputs << chunk.length) | keystream._value
+            self._outputs = window & ((1 << self._degree) - 1)
+            return chunk ^ keystream
+        if self._descrambler:
+            value = self._multiply(chunk._value, chunk.length)
+        else:
+            pieces = [
+                (self._divide(piece, size), size)
+                for piece, size in _split(chunk._value, chunk.length, _PIECE_BITS)
+            ]
+            value = _concat(pieces)[0]
+        return BinarySequence._from_packed(value, chunk.length)
+
+    def stream(self, chunks: Iterable[BinarySequence]) -> Iterator[BinarySequence]:
+        """Process every chunk of a stream."""
+        for chunk in chunks:
+            yield self.process(chunk)
+
+    def _free_run(self, state: int, length: int) -> int:
+        """length bits of zero input output ending in state (oldest first).
+
+        Read backwards, the output follows the reciprocal recurrence.
+        """
+        n = self._degree
+        if not state:
+            return 0
+        backwards = int(format(state, f"0{n}b")[::-1], 2)
+        taps = [n, *(n - tap for tap in self._taps[1:])]
+        history = _extend_recurrence(backwards, n, length, taps)
+        return int(format(history, f"0{length}b")[::-1], 2)
+
+    def _multiply(self, value: int, length: int) -> int:
+        """x = p(D) y over the chunk, with the last n bits of y before it."""
+        n = self._degree
+        window = (self._outputs << length) | value
+        out = window
+        for tap in self._taps:
+            out ^= window >> tap
+        self._outputs = window & ((1 << n) - 1)
+        return out & ((1 << length) - 1)
+
+    def _divide(self, value: int, length: int) -> int:
+        """y = x / p(D) over the chunk (see the module docstring)."""
+        n, scale = self._degree, self._scale
+        kept = n * (scale - 1)
+
+        # z = p(D) p(D^2) ... p(D^(scale/2)) x, valid for the chunk bits
+        filtered = (self._inputs << length) | value
+        step = 1
+        while step < scale:
+            current = filtered
+            for tap in self._taps:
+                filtered ^= current >> (tap * step)
+            step *= 2
+        self._inputs = ((self._inputs << length) | value) & ((1 << kept) - 1)
+
+        out = self._outputs
+        block_bits = min(self._taps) * scale
+        for start in range(0, length, block_bits):
+            size = min(block_bits, length - start)
+            new = filtered >> (length - start - size)
+            for tap in self._taps:
+                new ^= out >> (tap * scale - size)
+            out = (out << size) | (new & ((1 << size) - 1))
+        self._outputs = out & ((1 << (n * scale)) - 1)
+        return out & ((1 << length) - 1)
+
+
+class Descrambler(Scrambler):
+    """Descrambler stage, the inverse of a `Scrambler` with the same settings.
+
+    A multiplicative descrambler synchronizes itself: after the first n bits
+    its output is correct whatever its seed.
+    """
+
+    _descrambler = True
+
+
+def scramble(
+    seq: BinarySequence,
+    poly: int | Sequence[int],
+    mode: ScramblerMode | Literal["additive", "multiplicative"] = (
+        ScramblerMode.ADDITIVE
+    ),
+    seed: int | None = None,
+) -> BinarySequence:
+    """Scramble a whole sequence (see `Scrambler`)."""
+    return Scrambler(poly, mode, seed).process(seq)
+
+
+def descramble(
+    seq: BinarySequence,
+    poly: int | Sequence[int],
+    mode: ScramblerMode | Literal["additive", "multiplicative"] = (
+        ScramblerMode.ADDITIVE
+    ),
+    seed: int | None = None,
+) -> BinarySequence:
+    """Descramble a whole sequence (see `Descrambler`)."""
+    return Descrambler(poly, mode, seed).process(seq)
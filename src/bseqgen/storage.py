@@ -0,0 +1,317 @@
+"""Packed binary file format for sequences and sequence libraries.
+
+File layout (little-endian integers):
+
+- header: magic b"BSEQ", version (u16), flags (u16, 0), count (u64)
+- index: count entries of payload byte offset (u64) and bit length (u64)
+- payloads: each sequence in `numpy.packbits` layout (most significant bit
+  first, zero padded at the end), starting on an 8 byte boundary
+
+Files are read through `mmap`, so a single window of a multi GB sequence is
+served by reading only the bytes that cover it.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from collections.abc import Iterable, Iterator
+from typing import Literal, Self, TypeAlias, overload
+
+from .base import BinarySequence
+from .stream import DEFAULT_CHUNK_BITS, _check_chunk_bits, chunked, rechunk
+
+__all__ = ("save", "load", "SequenceLibrary", "MappedSequence")
+
+StrPath: TypeAlias = str | os.PathLike[str]
+
+_MAGIC = b"BSEQ"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHHQ")
+_ENTRY = struct.Struct("<QQ")
+_ALIGN = 8
+
+
+def save(
+    path: StrPath,
+    sequences: BinarySequence | Iterable[BinarySequence | Iterable[BinarySequence]],
+) -> None:
+    """Write one or more sequences to a packed sequence file.
+
+    Each item is a BinarySequence or a stream of BinarySequence chunks, so
+    sequences larger than memory can be written from a generator such as
+    `LFSR.stream`.
+
+    Args:
+        path (StrPath): Output file path (overwritten).
+        sequences (BinarySequence | Iterable[BinarySequence |
+            Iterable[BinarySequence]]): A sequence, or the sequences/streams
+            to store, in index order.
+    """
+    items = [sequences] if isinstance(sequences, BinarySequence) else list(sequences)
+    if not items:
+        raise ValueError("save requires at least one sequence.")
+
+    entries: list[tuple[int, int]] = []
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, 0, len(items)))
+        f.write(bytes(_ENTRY.size * len(items)))
+        for item in items:
+            f.write(bytes(-f.tell() % _ALIGN))
+            offset = f.tell()
+            if isinstance(item, BinarySequence):
+                f.write(item.packed_bytes)
+                length = item.length
+            else:
+                length = 0
+                for chunk in rechunk(item):
+                    f.write(chunk.packed_bytes)
+                    length += chunk.length
+                if not length:
+                    raise ValueError("Cannot save an empty stream.")
+            entries.append((offset, length))
+
+        f.seek(_HEADER.size)
+        f.write(b"".join(_ENTRY.pack(*entry) for entry in entries))
+
+
+@overload
+def load(
+    path: StrPath, index: int = 0, mapped: Literal[False] = False
+) -> BinarySequence: ...
+
+
+@overload
+def load(path: StrPath, index: int = 0, *, mapped: Literal[True]) -> MappedSequence: ...
+
+
+@overload
+def load(
+    path: StrPath, index: int = 0, mapped: bool = False
+) -> BinarySequence | MappedSequence: ...
+
+
+def load(
+    path: StrPath, index: int = 0, mapped: bool = False
+) -> BinarySequence | MappedSequence:
+    """Read one sequence from a packed sequence file.
+
+    Args:
+        path (StrPath): File written by `save`.
+        index (int, optional): Sequence index within the file. Defaults to 0.
+        mapped (bool, optional): Return a MappedSequence backed by the memory
+            mapped file instead of reading the sequence into memory.
+            Defaults to False.
+
+    Returns:
+        BinarySequence | MappedSequence: The stored sequence.
+    """
+    library = SequenceLibrary(path)
+    if mapped:
+        try:
+            return library[index]
+        except IndexError:
+            library.close()
+            raise
+    with library:
+        return library[index].to_sequence()
+
+
+class SequenceLibrary:
+    """Memory mapped, read-only view of every sequence in a packed file.
+
+    Use as a context manager (or call `close`) to release the mapping.
+    MappedSequence objects taken from the library keep the mapping alive
+    until they are garbage collected, unless the library is closed.
+    """
+
+    def __init__(self, path: StrPath) -> None:
+        """
+        Args:
+            path (StrPath): File written by `save`.
+        """
+        with open(path, "rb") as f:
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._entries = self._read_index()
+        except Exception:
+            self._buffer.close()
+            raise
+
+    def _read_index(self) -> list[tuple[int, int]]:
+        """Validate the header and read the (offset, length) index."""
+        size = len(self._buffer)
+        if size < _HEADER.size:
+            raise ValueError("Not a bseqgen sequence file.")
+        magic, version, _, count = _HEADER.unpack_from(self._buffer)
+        if magic != _MAGIC:
+            raise ValueError("Not a bseqgen sequence file.")
+        if version != _VERSION:
+            raise ValueError(f"Unsupported sequence file version {version}.")
+        if _HEADER.size + count * _ENTRY.size > size:
+            raise ValueError("Sequence file index is truncated.")
+
+        entries = []
+        for i in range(count):
+            offset, length = _ENTRY.unpack_from(
+                self._buffer, _HEADER.size + i * _ENTRY.size
+            )
+            if length <= 0 or offset + (length + 7) // 8 > size:
+                raise ValueError(f"Sequence {i} lies outside the file.")
+            entries.append((offset, length))
+        return entries
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the memory mapping."""
+        self._buffer.close()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[MappedSequence]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __getitem__(self, index: int) -> MappedSequence:
+        try:
+            offset, length = self._entries[index]
+        except IndexError as e:
+            raise IndexError("SequenceLibrary index out of range") from e
+        return MappedSequence(self._buffer, offset, 0, length)
+
+    @property
+    def lengths(self) -> list[int]:
+        """Bit length of every stored sequence."""
+        return [length for _, length in self._entries]
+
+
+class MappedSequence:
+    """A stored sequence (or a window of one) read lazily from a file mapping.
+
+    Indexing and slicing read only the bytes that cover the requested bits
+    and return ints / BinarySequence objects. `ones`, `hamming_distance` and
+    `stream` walk the window in chunks, so memory use stays bounded.
+    """
+
+    __slots__ = ("_buffer", "_offset", "_start", "_length", "_ones")
+
+    def __init__(self, buffer: mmap.mmap, offset: int, start: int, length: int) -> None:
+        self._buffer = buffer
+        self._offset = offset
+        self._start = start
+        self._length = length
+        self._ones: int | None = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(length={self._length})"
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, key: int) -> int: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> BinarySequence: ...
+
+    def __getitem__(self, key: int | slice) -> int | BinarySequence:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._length)
+            if step != 1:
+                positions = range(start, stop, step)
+                if not positions:
+                    raise ValueError("Slice results in empty BinarySequence.")
+                lo = min(positions[0], positions[-1])
+                hi = max(positions[0], positions[-1]) + 1
+                return self.window(lo, hi).to_sequence()[::step]
+            if stop <= start:
+                raise ValueError("Slice results in empty BinarySequence.")
+            return BinarySequence._from_packed(self._read(start, stop), stop - start)
+
+        if key < 0:
+            key += self._length
+        if not 0 <= key < self._length:
+            raise IndexError("MappedSequence index out of range")
+        return self._read(key, key + 1)
+
+    @property
+    def length(self) -> int:
+        return self._length
+
+    @property
+    def ones(self) -> int:
+        """Number of 1's, counted one chunk at a time (cached)."""
+        if self._ones is None:
+            self._ones = sum(chunk.ones for chunk in self.stream())
+        return self._ones
+
+    @property
+    def zeros(self) -> int:
+        return self._length - self.ones
+
+    def window(self, start: int, stop: int) -> MappedSequence:
+        """Lazy view of bits [start, stop); nothing is read until used."""
+        if not 0 <= start < stop <= self._length:
+            raise ValueError(
+                f"Window must satisfy 0 <= start < stop <= {self._length}."
+            )
+        return MappedSequence(
+            self._buffer, self._offset, self._start + start, stop - start
+        )
+
+    def to_sequence(self) -> BinarySequence:
+        """Read the whole window into a BinarySequence."""
+        return BinarySequence._from_packed(self._read(0, self._length), self._length)
+
+    def stream(self, chunk_bits: int = DEFAULT_CHUNK_BITS) -> Iterator[BinarySequence]:
+        """Stream of BinarySequence chunks covering the window."""
+        _check_chunk_bits(chunk_bits)
+        for start in range(0, self._length, chunk_bits):
+            stop = min(start + chunk_bits, self._length)
+            yield BinarySequence._from_packed(self._read(start, stop), stop - start)
+
+    def xor(self, other: BinarySequence) -> BinarySequence:
+        """Bitwise XOR of the window with an equal length sequence."""
+        return self.to_sequence().xor(other)
+
+    def bitwise_and(self, other: BinarySequence) -> BinarySequence:
+        """Bitwise AND of the window with an equal length sequence."""
+        return self.to_sequence().bitwise_and(other)
+
+    def bitwise_or(self, other: BinarySequence) -> BinarySequence:
+        """Bitwise OR of the window with an equal length sequence."""
+        return self.to_sequence().bitwise_or(other)
+
+    def hamming_distance(
+        self,
+        other: BinarySequence | MappedSequence,
+        chunk_bits: int = DEFAULT_CHUNK_BITS,
+    ) -> int:
+        """Hamming distance to an equal length sequence, chunk by chunk."""
+        if len(other) != self._length:
+            raise ValueError("hamming_distance requires sequences of the same length.")
+        if isinstance(other, BinarySequence):
+            other_chunks = chunked(other, chunk_bits)
+        else:
+            other_chunks = other.stream(chunk_bits)
+        return sum(
+            (a._value ^ b._value).bit_count()
+            for a, b in zip(self.stream(chunk_bits), other_chunks, strict=True)
+        )
+
+    def _read(self, start: int, stop: int) -> int:
+        """Packed value of bits [start, stop) of the window."""
+        first = self._start + start
+        last = self._start + stop
+        lo, hi = first // 8, (last + 7) // 8
+        data = self._buffer[self._offset + lo : self._offset + hi]
+        value = int.from_bytes(data, "big") >> (hi * 8 - last)
+        return value & ((1 << (last - first)) - 1)
@@ -0,0 +1,197 @@
+"""Chunked streams of binary sequences.
+
+A stream is any iterable of BinarySequence chunks. Producers yield chunks of
+a fixed size (the final chunk may be shorter), so arbitrarily long patterns
+can be generated, transformed and measured in constant memory.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator
+from itertools import zip_longest
+
+from .base import BinarySequence
+
+__all__ = (
+    "DEFAULT_CHUNK_BITS",
+    "chunked",
+    "rechunk",
+    "collect",
+    "count_ones",
+    "xor_streams",
+    "and_streams",
+    "or_streams",
+    "invert_stream",
+    "iter_packed",
+    "from_packed",
+)
+
+DEFAULT_CHUNK_BITS = 1 << 20
+
+
+def chunked(
+    seq: BinarySequence, chunk_bits: int = DEFAULT_CHUNK_BITS
+) -> Iterator[BinarySequence]:
+    """Split a sequence into chunks of chunk_bits (the last may be shorter)."""
+    _check_chunk_bits(chunk_bits)
+    for value, length in _split(seq._value, seq.length, chunk_bits):
+        yield BinarySequence._from_packed(value, length)
+
+
+def rechunk(
+    stream: Iterable[BinarySequence], chunk_bits: int = DEFAULT_CHUNK_BITS
+) -> Iterator[BinarySequence]:
+    """Regroup a stream into chunks of chunk_bits (the last may be shorter)."""
+    _check_chunk_bits(chunk_bits)
+    buffer, buffer_len = 0, 0
+    for chunk in stream:
+        buffer = (buffer << chunk.length) | chunk._value
+        buffer_len += chunk.length
+        if buffer_len < chunk_bits:
+            continue
+        remainder = buffer_len % chunk_bits
+        head = buffer >> remainder
+        buffer &= (1 << remainder) - 1
+        for value, length in _split(head, buffer_len - remainder, chunk_bits):
+            yield BinarySequence._from_packed(value, length)
+        buffer_len = remainder
+    if buffer_len:
+        yield BinarySequence._from_packed(buffer, buffer_len)
+
+
+def collect(stream: Iterable[BinarySequence]) -> BinarySequence:
+    """Concatenate a (finite) stream into one BinarySequence."""
+    pieces = [(chunk._value, chunk.length) for chunk in stream]
+    if not pieces:
+        raise ValueError("Cannot collect an empty stream.")
+    value, length = _concat(pieces)
+    return BinarySequence._from_packed(value, length)
+
+
+def count_ones(stream: Iterable[BinarySequence]) -> int:
+    """Total number of 1's in a stream."""
+    return sum(chunk.ones for chunk in stream)
+
+
+def xor_streams(
+    a: Iterable[BinarySequence],
+    b: Iterable[BinarySequence],
+    chunk_bits: int = DEFAULT_CHUNK_BITS,
+) -> Iterator[BinarySequence]:
+    """Bitwise XOR of two streams of the same total length."""
+    return _combine(a, b, chunk_bits, BinarySequence.xor)
+
+
+def and_streams(
+    a: Iterable[BinarySequence],
+    b: Iterable[BinarySequence],
+    chunk_bits: int = DEFAULT_CHUNK_BITS,
+) -> Iterator[BinarySequence]:
+    """Bitwise AND of two streams of the same total length."""
+    return _combine(a, b, chunk_bits, BinarySequence.bitwise_and)
+
+
+def or_streams(
+    a: Iterable[BinarySequence],
+    b: Iterable[BinarySequence],
+    chunk_bits: int = DEFAULT_CHUNK_BITS,
+) -> Iterator[BinarySequence]:
+    """Bitwise OR of two streams of the same total length."""
+    return _combine(a, b, chunk_bits, BinarySequence.bitwise_or)
+
+
+def invert_stream(stream: Iterable[BinarySequence]) -> Iterator[BinarySequence]:
+    """Bitwise inversion of every chunk in a stream."""
+    return (chunk.inverted() for chunk in stream)
+
+
+def iter_packed(stream: Iterable[BinarySequence]) -> Iterator[bytes]:
+    """Packed bytes (most significant bit first) for each chunk of a stream.
+
+    Every chunk but the last must be a whole number of bytes. The last chunk
+    is zero padded at the end, matching `numpy.packbits`.
+    """
+    pending: BinarySequence | None = None
+    for chunk in stream:
+        if pending is not None:
+            if pending.length % 8:
+                raise ValueError("Only the last chunk may have a partial byte.")
+            yield pending.packed_bytes
+        pending = chunk
+    if pending is not None:
+        yield pending.packed_bytes
+
+
+def from_packed(
+    chunks: Iterable[bytes], n_bits: int | None = None
+) -> Iterator[BinarySequence]:
+    """Stream of BinarySequence chunks from packed byte chunks.
+
+    Args:
+        chunks (Iterable[bytes]): Packed bytes, most significant bit first.
+        n_bits (int | None, optional): Total number of bits to read; trailing
+            bits past this are dropped. Defaults to None (all bits).
+
+    Returns:
+        Iterator[BinarySequence]: One chunk per non-empty input chunk.
+    """
+    remaining = n_bits
+    for data in chunks:
+        length = len(data) * 8
+        value = int.from_bytes(data, "big")
+        if remaining is not None:
+            if remaining <= 0:
+                return
+            if length > remaining:
+                value >>= length - remaining
+                length = remaining
+            remaining -= length
+        if length:
+            yield BinarySequence._from_packed(value, length)
+
+
+def _combine(
+    a: Iterable[BinarySequence],
+    b: Iterable[BinarySequence],
+    chunk_bits: int,
+    op: Callable[[BinarySequence, BinarySequence], BinarySequence],
+) -> Iterator[BinarySequence]:
+    for x, y in zip_longest(rechunk(a, chunk_bits), rechunk(b, chunk_bits)):
+        if x is None or y is None or x.length != y.length:
+            raise ValueError("Streams must be the same length.")
+        yield op(x, y)
+
+
+def _check_chunk_bits(chunk_bits: int) -> None:
+    if not isinstance(chunk_bits, int) or chunk_bits <= 0:
+        raise ValueError("chunk_bits must be a positive integer")
+
+
+def _split(value: int, length: int, size: int) -> Iterator[tuple[int, int]]:
+    """Split a packed value into size bit pieces by halving.
+
+    Halving keeps the cost at O(length log(length / size)) instead of one
+    full-width shift per piece.
+    """
+    if length <= size:
+        yield value, length
+        return
+    head_len = max((length // size) // 2, 1) * size
+    tail_len = length - head_len
+    yield from _split(value >> tail_len, head_len, size)
+    yield from _split(value & ((1 << tail_len) - 1), tail_len, size)
+
+
+def _concat(pieces: list[tuple[int, int]]) -> tuple[int, int]:
+    """Concatenate (value, length) pieces by pairwise merging."""
+    while len(pieces) > 1:
+        merged = [
+            ((hi << lo_len) | lo, hi_len + lo_len)
+            for (hi, hi_len), (lo, lo_len) in zip(
+                pieces[0::2], pieces[1::2], strict=False
+            )
+        ]
+        if len(pieces) % 2:
+            merged.append(pieces[-1])
+        pieces = merged
+    return pieces[0]
@@ -0,0 +1,380 @@
+"""Lazy views and deferred bitwise expressions over binary sequences.
+
+    code = m_sequence((15, 14)).lazy()
+    chips = code.to_length(10**9).shift(k) ^ other.lazy().to_length(10**9)
+    chips.ones  # one fused pass, chunk by chunk
+
+`to_length`, `shift` and slicing return views that reference their base,
+and `^ & | ~` build an expression tree. Nothing is computed until the view
+is consumed: every node reads the packed bits of a range from its children
+(`_read`), so `ones`, `hamming_distance`, `to_numpy`, `stream` and
+`to_sequence` evaluate the whole chain in one pass over bounded chunks,
+without intermediate sequences. `ones` of periodic, rotated and inverted
+views is derived from the base without reading any bits.
+"""
+
+from __future__ import annotations
+
+import operator
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING, Literal, TypeAlias, overload
+
+from .base import BinarySequence, Direction
+from .storage import MappedSequence
+from .stream import DEFAULT_CHUNK_BITS, _check_chunk_bits
+
+__all__ = (
+    "SequenceView",
+    "SourceView",
+    "PeriodicView",
+    "RotatedView",
+    "SliceView",
+    "BitOpView",
+    "InvertView",
+    "lazy",
+)
+
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+    NpNDArrayUInt8: TypeAlias = NDArray[np.uint8]
+
+Operand: TypeAlias = "SequenceView | BinarySequence | MappedSequence"
+
+
+def lazy(source: Operand) -> SequenceView:
+    """View of a BinarySequence or MappedSequence (views are returned as is)."""
+    if isinstance(source, SequenceView):
+        return source
+    if isinstance(source, BinarySequence | MappedSequence):
+        return SourceView(source)
+    raise TypeError("lazy requires a BinarySequence, MappedSequence or view.")
+
+
+class SequenceView(ABC):
+    """Read-only, lazily evaluated binary sequence.
+
+    Subclasses implement `_read(start, stop)`, the packed value of bits
+    [start, stop) with the first bit most significant (the BinarySequence
+    layout).
+    """
+
+    __slots__ = ("_length",)
+
+    _length: int
+
+    @abstractmethod
+    def _read(self, start: int, stop: int) -> int:
+        """Packed value of bits [start, stop)."""
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(length={self._length})"
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def length(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, key: int) -> int: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> SequenceView | BinarySequence: ...
+
+    def __getitem__(self, key: int | slice) -> int | SequenceView | BinarySequence:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._length)
+            if step != 1:
+                positions = range(start, stop, step)
+                if not positions:
+                    raise ValueError("Slice results in empty BinarySequence.")
+                lo = min(positions[0], positions[-1])
+                hi = max(positions[0], positions[-1]) + 1
+                window = SliceView(self, lo, hi).to_sequence()
+                return window[::step]
+            if stop <= start:
+                raise ValueError("Slice results in empty BinarySequence.")
+            return SliceView(self, start, stop)
+
+        if key < 0:
+            key += self._length
+        if not 0 <= key < self._length:
+            raise IndexError("SequenceView index out of range")
+        return self._read(key, key + 1)
+
+    def to_length(self, n: int) -> PeriodicView:
+        """Repeat or truncate to length n (periodic extension)."""
+        return PeriodicView(self, n)
+
+    def shift(
+        self,
+        n: int,
+        direction: Direction | Literal["left", "right"] = Direction.LEFT,
+    ) -> SequenceView:
+        """Circular shift, as `BinarySequence.shift`."""
+        n %= self._length
+        if Direction(direction) == Direction.RIGHT:
+            n = -n % self._length
+        return RotatedView(self, n) if n else self
+
+    def inverted(self) -> SequenceView:
+        return InvertView(self)
+
+    def xor(self, other: Operand) -> SequenceView:
+        return BitOpView(operator.xor, self, lazy(other), "xor")
+
+    def bitwise_and(self, other: Operand) -> SequenceView:
+        return BitOpView(operator.and_, self, lazy(other), "bitwise_and")
+
+    def bitwise_or(self, other: Operand) -> SequenceView:
+        return BitOpView(operator.or_, self, lazy(other), "bitwise_or")
+
+    def __invert__(self) -> SequenceView:
+        return self.inverted()
+
+    def __xor__(self, other: object) -> SequenceView:
+        if not isinstance(other, SequenceView | BinarySequence | MappedSequence):
+            return NotImplemented
+        return self.xor(other)
+
+    def __and__(self, other: object) -> SequenceView:
+        if not isinstance(other, SequenceView | BinarySequence | MappedSequence):
+            return NotImplemented
+        return self.bitwise_and(other)
+
+    def __or__(self, other: object) -> SequenceView:
+        if not isinstance(other, SequenceView | BinarySequence | MappedSequence):
+            return NotImplemented
+        return self.bitwise_or(other)
+
+    __rxor__ = __xor__
+    __rand__ = __and__
+    __ror__ = __or__
+
+    @property
+    def ones(self) -> int:
+        """Number of 1's, evaluated chunk by chunk."""
+        return sum(chunk.ones for chunk in self.stream())
+
+    @property
+    def zeros(self) -> int:
+        return self._length - self.ones
+
+    def hamming_distance(self, other: Operand) -> int:
+        """Hamming distance to an equal length sequence or view."""
+        return self.xor(other).ones
+
+    def stream(self, chunk_bits: int = DEFAULT_CHUNK_BITS) -> Iterator[BinarySequence]:
+        """Stream of BinarySequence chunks covering the view."""
+        _check_chunk_bits(chunk_bits)
+        for start in range(0, self._length, chunk_bits):
+            stop = min(start + chunk_bits, self._length)
+            yield BinarySequence._from_packed(self._read(start, stop), stop - start)
+
+    def to_sequence(self) -> BinarySequence:
+        """Materialize the view as a BinarySequence."""
+        return BinarySequence._from_packed(self._read(0, self._length), self._length)
+
+    def to_numpy(self, packed: bool = False) -> NpNDArrayUInt8:
+        """Evaluate the view chunk by chunk into a uint8 NumPy array.
+
+        Args:
+            packed (bool, optional): Return `np.packbits` layout bytes instead
+                of one element per bit. Defaults to False.
+
+        Returns:
+            NpNDArrayUInt8: Bits, or packed bytes.
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ImportError("NumPy is required for to_numpy().") from e
+
+        out = np.empty((self._length + 7) // 8, dtype=np.uint8)
+        start = 0
+        for chunk in self.stream(DEFAULT_CHUNK_BITS):  # multiple of 8 bits
+            data = np.frombuffer(chunk.packed_bytes, dtype=np.uint8)
+            out[start // 8 : start // 8 + data.size] = data
+            start += chunk.length
+        if packed:
+            return out
+        bits: NpNDArrayUInt8 = np.unpackbits(out, count=self._length)
+        return bits
+
+
+class SourceView(SequenceView):
+    """View of a BinarySequence or MappedSequence."""
+
+    __slots__ = ("_source", "_packed")
+
+    def __init__(self, source: BinarySequence | MappedSequence) -> None:
+        self._source = source
+        self._length = len(source)
+        self._packed: bytes | None = None
+
+    @property
+    def source(self) -> BinarySequence | MappedSequence:
+        return self._source
+
+    def _read(self, start: int, stop: int) -> int:
+        source = self._source
+        if isinstance(source, MappedSequence):
+            return source._read(start, stop)
+        if stop - start == self._length:
+            return source._value
+        # read through the packed bytes, so a chunk costs its size rather than
+        # a shift of the whole value
+        if self._packed is None:
+            self._packed = source.packed_bytes
+        lo, hi = start // 8, (stop + 7) // 8
+        value = int.from_bytes(self._packed[lo:hi], "big") >> (hi * 8 - stop)
+        return value & ((1 << (stop - start)) - 1)
+
+    @property
+    def ones(self) -> int:
+        return self._source.ones
+
+
+class PeriodicView(SequenceView):
+    """Base repeated (or truncated) to `length` bits."""
+
+    __slots__ = ("_base",)
+
+    def __init__(self, base: SequenceView, length: int) -> None:
+        if not isinstance(length, int) or length <= 0:
+            raise ValueError("Target length must be positive and not zero.")
+        self._base = base
+        self._length = length
+
+    def _read(self, start: int, stop: int) -> int:
+        period = self._base.length
+        offset = start % period
+        size = stop - start
+        if size <= period:
+            return _circular(self._base, offset, size)
+
+        # one period starting at offset, doubled until it covers the range
+        value, length = _circular(self._base, offset, period), period
+        while length < size:
+            value = (value << length) | value
+            length *= 2
+        return value >> (length - size)
+
+    @property
+    def ones(self) -> int:
+        period = self._base.length
+        full, rest = divmod(self._length, period)
+        ones = full * self._base.ones if full else 0
+        if rest:
+            ones += _circular(self._base, 0, rest).bit_count()
+        return ones
+
+
+class RotatedView(SequenceView):
+    """Base rotated left by `offset` bits (bit i is base[(i + offset) % n])."""
+
+    __slots__ = ("_base", "_offset")
+
+    def __init__(self, base: SequenceView, offset: int) -> None:
+        self._base = base
+        self._length = base.length
+        self._offset = offset % base.length
+
+    def _read(self, start: int, stop: int) -> int:
+        return _circular(
+            self._base, (start + self._offset) % self._length, stop - start
+        )
+
+    def shift(
+        self,
+        n: int,
+        direction: Direction | Literal["left", "right"] = Direction.LEFT,
+    ) -> SequenceView:
+        if Direction(direction) == Direction.RIGHT:
+            n = -n
+        return self._base.shift(self._offset + n)
+
+    @property
+    def ones(self) -> int:
+        return self._base.ones
+
+
+class SliceView(SequenceView):
+    """Bits [start, stop) of the base."""
+
+    __slots__ = ("_base", "_start")
+
+    _base: SequenceView
+    _start: int
+
+    def __init__(self, base: SequenceView, start: int, stop: int) -> None:
+        if not 0 <= start < stop <= base.length:
+            raise ValueError(f"Slice must satisfy 0 <= start < stop <= {base.length}.")
+        # slices of slices reference the original base
+        if isinstance(base, SliceView):
+            start += base._start
+            stop += base._start
+            base = base._base
+        self._base = base
+        self._start = start
+        self._length = stop - start
+
+    def _read(self, start: int, stop: int) -> int:
+        return self._base._read(self._start + start, self._start + stop)
+
+
+class BitOpView(SequenceView):
+    """Deferred bitwise operation of two equal length views."""
+
+    __slots__ = ("_op", "_left", "_right")
+
+    def __init__(
+        self,
+        op: Callable[[int, int], int],
+        left: SequenceView,
+        right: SequenceView,
+        name: str = "bitwise op",
+    ) -> None:
+        if left.length != right.length:
+            raise ValueError(f"{name} requires both sequences to be the same length.")
+        self._op = op
+        self._left = left
+        self._right = right
+        self._length = left.length
+
+    def _read(self, start: int, stop: int) -> int:
+        return self._op(self._left._read(start, stop), self._right._read(start, stop))
+
+
+class InvertView(SequenceView):
+    """Deferred bitwise inversion."""
+
+    __slots__ = ("_base",)
+
+    def __init__(self, base: SequenceView) -> None:
+        self._base = base
+        self._length = base.length
+
+    def _read(self, start: int, stop: int) -> int:
+        return self._base._read(start, stop) ^ ((1 << (stop - start)) - 1)
+
+    def inverted(self) -> SequenceView:
+        return self._base
+
+    @property
+    def ones(self) -> int:
+        return self._length - self._base.ones
+
+
+def _circular(view: SequenceView, start: int, size: int) -> int:
+    """Packed value of size <= len(view) bits from start, wrapping around."""
+    stop = start + size
+    if stop <= view.length:
+        return view._read(start, stop)
+    wrapped = stop - view.length
+    return (view._read(start, view.length) << wrapped) | view._read(0, wrapped)
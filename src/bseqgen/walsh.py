@@ -0,0 +1,147 @@
+"""Walsh-Hadamard codes and the fast Walsh-Hadamard transform"""
+
+from __future__ import annotations
+
+from collections.abc import MutableSequence
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any, Literal, TypeAlias, TypeVar, overload
+
+from .base import BinarySequence
+
+__all__ = ("WalshOrdering", "walsh_code", "fwht", "walsh_spectrum")
+
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+    NpNDArrayNumber: TypeAlias = NDArray[np.number[Any]]
+
+Values = TypeVar("Values", bound=MutableSequence[Any])
+
+
+class WalshOrdering(StrEnum):
+    SYLVESTER = "sylvester"
+    SEQUENCY = "sequency"
+
+
+def walsh_code(
+    index: int,
+    length: int,
+    ordering: WalshOrdering | Literal["sylvester", "sequency"] = "sylvester",
+) -> BinarySequence:
+    """Row `index` of the order `length` Hadamard matrix as a BinarySequence.
+
+    Bits map to matrix entries the same way as `BinarySequence.signed`
+    (1 -> +1, 0 -> -1). The row is built by doubling a packed value log2(length)
+    times, so the matrix itself is never formed.
+
+    Args:
+        index (int): Row index, 0 <= index < length.
+        length (int): Code length, a power of two.
+        ordering (WalshOrdering | Literal['sylvester', 'sequency'], optional):
+            'sylvester' is natural Hadamard order, 'sequency' orders rows by
+            number of sign changes. Defaults to 'sylvester'.
+
+    Returns:
+        BinarySequence: Walsh code.
+    """
+    order = _log2_length(length)
+    if not isinstance(index, int) or not 0 <= index < length:
+        raise ValueError(f"index must be in range 0 to {length - 1}.")
+
+    match WalshOrdering(ordering):
+        case WalshOrdering.SYLVESTER:
+            row = index
+        case WalshOrdering.SEQUENCY:
+            # sequency index -> Gray code -> bit reversal gives the Sylvester row
+            gray = index ^ (index >> 1)
+            row = int(format(gray, f"0{order}b")[::-1], 2) if order else 0
+
+    # H(2m) = [[H, H], [H, -H]]: bit j of the row picks the sign of level j
+    value, size = 1, 1
+    for level in range(order):
+        half = value ^ ((1 << size) - 1) if (row >> level) & 1 else value
+        value = (value << size) | half
+        size *= 2
+    return BinarySequence._from_packed(value, length)
+
+
+@overload
+def fwht(values: Values) -> Values: ...
+
+
+@overload
+def fwht(values: NpNDArrayNumber) -> NpNDArrayNumber: ...
+
+
+def fwht(values: Values | NpNDArrayNumber) -> Values | NpNDArrayNumber:
+    """In-place fast Walsh-Hadamard transform (Sylvester order, unnormalized).
+
+    NumPy arrays are transformed along the last axis, so a 2D array of
+    received channels is despread against every Walsh code at once in
+    O(n log n) per row. Other inputs must be mutable sequences of numbers
+    and use a pure Python butterfly.
+
+    Args:
+        values (Values | NpNDArrayNumber): Data with a power of two length
+            (last axis for arrays). A C-contiguous NumPy array or a list.
+
+    Returns:
+        Values | NpNDArrayNumber: The same object, transformed.
+    """
+    if isinstance(values, MutableSequence):
+        _fwht_python(values, _log2_length(len(values)))
+        return values
+
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError("NumPy is required for array input to fwht().") from e
+
+    if not isinstance(values, np.ndarray):
+        raise TypeError("fwht requires a list or NumPy array.")
+    if not values.flags.c_contiguous or not values.flags.writeable:
+        raise ValueError("fwht requires a writeable C-contiguous array.")
+
+    n = values.shape[-1]
+    _log2_length(n)
+    lead = values.shape[:-1]
+    half = 1
+    while half < n:
+        view = values.reshape(*lead, n // (2 * half), 2, half)
+        low = view[..., 0, :].copy()
+        high = view[..., 1, :]
+        np.add(low, high, out=view[..., 0, :])
+        np.subtract(low, high, out=high)
+        half *= 2
+    return values
+
+
+def walsh_spectrum(seq: BinarySequence) -> list[int]:
+    """Correlation of seq.signed with every Sylvester ordered Walsh code.
+
+    Args:
+        seq (BinarySequence): Sequence with a power of two length.
+
+    Returns:
+        list[int]: Correlation with Walsh code k at index k.
+    """
+    return fwht(list(seq.signed))
+
+
+def _fwht_python(values: MutableSequence[Any], order: int) -> None:
+    n = 1 << order
+    half = 1
+    while half < n:
+        for start in range(0, n, 2 * half):
+            for i in range(start, start + half):
+                a, b = values[i], values[i + half]
+                values[i], values[i + half] = a + b, a - b
+        half *= 2
+
+
+def _log2_length(length: int) -> int:
+    if not isinstance(length, int) or length <= 0 or length & (length - 1):
+        raise ValueError("Length must be a positive power of two.")
+    return length.bit_length() - 1
@@ -0,0 +1,74 @@
+import pytest
+
+from bseqgen import prbs
+from bseqgen.acquisition import AcquisitionResult, CodeAcquirer
+from bseqgen.base import BinarySequence
+from bseqgen.batch import BinarySequenceBatch
+from bseqgen.correlation import correlate
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def reference() -> BinarySequence:
+    return prbs(9)
+
+
+@pytest.mark.parametrize("method", ["fft", "direct"])
+def test_search_hard(reference: BinarySequence, method: str) -> None:
+    acquirer = CodeAcquirer(reference, method=method)  # type: ignore[arg-type]
+    received = reference.shift(123)
+
+    assert acquirer.search(received) == [AcquisitionResult(123, 511)]
+    assert acquirer.correlate(received) == list(correlate(received, reference))
+
+
+def test_search_top_k_and_magnitude(reference: BinarySequence) -> None:
+    acquirer = CodeAcquirer(reference)
+    received = ~reference.shift(40)
+
+    best = acquirer.search(received, top_k=3)
+    assert len(best) == 3
+    assert best[0].peak == 1
+    assert all(a.peak >= b.peak for a, b in zip(best, best[1:], strict=False))
+
+    assert acquirer.search(received, magnitude=True) == [AcquisitionResult(40, -511)]
+    assert acquirer.search(received, magnitude=True, normalized=True)[0].peak == -1.0
+
+
+def test_search_soft(reference: BinarySequence) -> None:
+    rng = np.random.default_rng(0)
+    signed = reference.shift(300).to_numpy() * 2.0 - 1.0
+    samples = signed + rng.normal(0, 2.0, reference.length)
+
+    lag, peak = CodeAcquirer(reference).search(samples)[0]
+    assert lag == 300
+    assert peak == pytest.approx(float(samples @ signed))
+
+
+def test_search_many(reference: BinarySequence) -> None:
+    acquirer = CodeAcquirer(reference)
+    lags = [0, 5, 510, 77]
+    shifted = [reference.shift(k) for k in lags]
+
+    hard = acquirer.search_many(BinarySequenceBatch.from_sequences(shifted), top_k=2)
+    assert [row[0] for row in hard] == [AcquisitionResult(k, 511) for k in lags]
+    assert all(row[1].peak == -1 for row in hard)
+    assert acquirer.search_many(shifted) == [row[:1] for row in hard]
+
+    soft = np.stack([s.to_numpy() * 0.5 - 0.25 for s in shifted])
+    results = acquirer.search_many(soft)
+    assert [row[0].lag for row in results] == lags
+    assert results[0][0].peak == pytest.approx(511 * 0.25)
+
+
+def test_invalid_input(reference: BinarySequence) -> None:
+    acquirer = CodeAcquirer(reference)
+    with pytest.raises(ValueError):
+        acquirer.search(BinarySequence("101"))
+    with pytest.raises(ValueError):
+        acquirer.search(reference, top_k=0)
+    with pytest.raises(ValueError):
+        acquirer.search_many(np.zeros((2, 10)))
+    with pytest.raises(ValueError):
+        CodeAcquirer(reference, method="direct").search([0.5] * 511)
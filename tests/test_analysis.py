@@ -0,0 +1,132 @@
+import pytest
+
+from bseqgen import random_sequence
+from bseqgen.analysis import (
+    PairPeak,
+    analyze_family,
+    is_preferred_pair,
+    iter_pair_blocks,
+    max_crosscorrelation,
+    peak_sidelobes,
+)
+from bseqgen.base import BinarySequence
+from bseqgen.batch import BinarySequenceBatch
+from bseqgen.correlation import correlate
+from bseqgen.families import GOLD_PREFERRED_PAIRS, gold_codes, kasami_codes
+from bseqgen.lfsr import m_sequence
+
+np = pytest.importorskip("numpy")
+
+
+def _brute_force(seqs: list[BinarySequence]) -> PairPeak:
+    best = PairPeak(-1, -1, -1, -1)
+    for i, a in enumerate(seqs):
+        for j in range(i + 1, len(seqs)):
+            values = [abs(int(v)) for v in correlate(a, seqs[j])]
+            peak = max(values)
+            if peak > best.value:
+                best = PairPeak(i, j, values.index(peak), peak)
+    return best
+
+
+@pytest.mark.parametrize("block_rows", [1, 3, 64])
+def test_max_crosscorrelation_matches_brute_force(block_rows: int) -> None:
+    seqs = [random_sequence(50, seed=i) for i in range(7)]
+
+    assert max_crosscorrelation(
+        seqs, processes=1, block_rows=block_rows
+    ) == _brute_force(seqs)
+
+
+def test_pair_blocks_cover_every_pair_once() -> None:
+    seqs = [random_sequence(40, seed=i) for i in range(9)]
+    seen = np.zeros((9, 9), dtype=int)
+    for block in iter_pair_blocks(seqs, processes=1, block_rows=4):
+        for a, i in enumerate(block.rows):
+            for b, j in enumerate(block.cols):
+                if block.peaks[a, b] >= 0:
+                    assert i < j
+                    assert block.peaks[a, b] == max(
+                        abs(v) for v in correlate(seqs[i], seqs[j])
+                    )
+                    seen[i, j] += 1
+
+    assert (seen == np.triu(np.ones((9, 9), dtype=int), 1)).all()
+
+
+def test_interleaved_iterators_are_independent() -> None:
+    codes = gold_codes(5)
+    other = kasami_codes(6)
+    expected = list(iter_pair_blocks(codes, processes=1, block_rows=8))
+    first = iter_pair_blocks(codes, processes=1, block_rows=8)
+    second = iter_pair_blocks(other, processes=1, block_rows=8)
+
+    next(second)
+    for block in expected:
+        got = next(first)
+        assert (got.rows, got.cols) == (block.rows, block.cols)
+        assert (got.peaks == block.peaks).all()
+        assert (got.lags == block.lags).all()
+        next(second, None)
+    assert next(first, None) is None
+
+
+def test_process_pool_matches_single_process() -> None:
+    codes = gold_codes(6)
+    serial = max_crosscorrelation(codes, processes=1)
+    blocks = list(iter_pair_blocks(codes, processes=2, block_rows=16))
+
+    assert len(blocks) == 15
+    assert max_crosscorrelation(codes, processes=2, block_rows=16) == serial
+
+
+def test_gold_family_bound() -> None:
+    analysis = analyze_family(gold_codes(5), processes=1)
+
+    # t(5) = 2^3 + 1
+    assert analysis.max_crosscorrelation.value == 9
+    assert analysis.max_sidelobe == 9
+    assert list(analysis.peak_sidelobes[:2]) == [1, 1]  # the two m-sequences
+
+
+def test_kasami_family_bound() -> None:
+    analysis = analyze_family(kasami_codes(6), processes=1)
+
+    # 2^(n/2) + 1
+    assert analysis.max_crosscorrelation.value == 9
+    assert analysis.max_sidelobe == 9
+
+
+def test_peak_sidelobes_inputs() -> None:
+    seqs = [random_sequence(30, seed=i) for i in range(5)]
+    expected = [max(abs(v) for v in correlate(s, s)[1:]) for s in seqs]
+    batch = BinarySequenceBatch.from_sequences(seqs)
+
+    assert list(peak_sidelobes(seqs)) == expected
+    assert list(peak_sidelobes(batch)) == expected
+    assert list(peak_sidelobes(batch.to_numpy())) == expected
+    assert (
+        list(peak_sidelobes(batch.to_numpy(packed=True), length=30, packed=True))
+        == expected
+    )
+
+
+def test_family_analysis_errors() -> None:
+    with pytest.raises(ValueError):
+        max_crosscorrelation([random_sequence(10, seed=1)])
+    with pytest.raises(ValueError):
+        max_crosscorrelation(gold_codes(5), processes=0)
+
+
+@pytest.mark.parametrize("degree", sorted(GOLD_PREFERRED_PAIRS))
+def test_is_preferred_pair(degree: int) -> None:
+    first, second = GOLD_PREFERRED_PAIRS[degree]
+
+    assert is_preferred_pair(m_sequence(first), m_sequence(second))
+    assert not is_preferred_pair(m_sequence(first), m_sequence(first))
+
+
+def test_is_preferred_pair_rejects_non_m_sequence_lengths() -> None:
+    assert not is_preferred_pair(random_sequence(30), random_sequence(30))
+    with pytest.raises(ValueError):
+        is_preferred_pair(random_sequence(31), random_sequence(30))
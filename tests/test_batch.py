@@ -0,0 +1,104 @@
+import pytest
+
+from bseqgen import random_sequence
+from bseqgen.base import BinarySequence
+from bseqgen.batch import BinarySequenceBatch
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def sequences() -> list[BinarySequence]:
+    return [random_sequence(21, seed=i) for i in range(20)]
+
+
+@pytest.fixture
+def batch(sequences: list[BinarySequence]) -> BinarySequenceBatch:
+    return BinarySequenceBatch.from_sequences(sequences)
+
+
+def test_round_trip(
+    batch: BinarySequenceBatch, sequences: list[BinarySequence]
+) -> None:
+    assert len(batch) == 20
+    assert batch.shape == (20, 21)
+    assert batch.to_sequences() == sequences
+    assert batch[3] == sequences[3]
+    assert batch[-1] == sequences[-1]
+    assert batch[2:5].to_sequences() == sequences[2:5]
+    with pytest.raises(IndexError):
+        batch[20]
+
+
+def test_from_numpy(batch: BinarySequenceBatch) -> None:
+    bits = batch.to_numpy()
+    assert bits.shape == (20, 21)
+    assert BinarySequenceBatch.from_numpy(bits) == batch
+    assert BinarySequenceBatch.from_numpy(bits.astype(bool)) == batch
+
+    packed = batch.to_numpy(packed=True)
+    assert BinarySequenceBatch.from_numpy(packed, length=21, packed=True) == batch
+    with pytest.raises(ValueError):
+        packed[0, 0] = 1
+
+
+def test_padding_bits_cleared() -> None:
+    batch = BinarySequenceBatch(np.full((2, 1), 0xFF, dtype=np.uint8), 3)
+    assert batch[0] == BinarySequence("111")
+    assert batch.ones.tolist() == [3, 3]
+    assert batch.inverted()[1] == BinarySequence("000")
+
+
+def test_invalid_input() -> None:
+    with pytest.raises(ValueError):
+        BinarySequenceBatch.from_sequences([BinarySequence("1"), BinarySequence("10")])
+    with pytest.raises(ValueError):
+        BinarySequenceBatch.from_sequences([])
+    with pytest.raises(ValueError):
+        BinarySequenceBatch.from_numpy(np.array([[0, 2]]))
+    with pytest.raises(ValueError):
+        BinarySequenceBatch(np.zeros((2, 2), dtype=np.uint8), 3)
+
+
+def test_bitwise_ops(
+    batch: BinarySequenceBatch, sequences: list[BinarySequence]
+) -> None:
+    other = batch[::-1]
+    mask = sequences[0]
+
+    assert (batch ^ other).to_sequences() == [
+        a ^ b for a, b in zip(sequences, sequences[::-1], strict=True)
+    ]
+    assert (batch & mask).to_sequences() == [s & mask for s in sequences]
+    assert (batch | mask).to_sequences() == [s | mask for s in sequences]
+    assert (~batch).to_sequences() == [~s for s in sequences]
+
+    with pytest.raises(ValueError):
+        batch.xor(BinarySequence("101"))
+    with pytest.raises(ValueError):
+        batch.xor(batch[:3])
+
+
+def test_shift(batch: BinarySequenceBatch, sequences: list[BinarySequence]) -> None:
+    assert batch.shift(5).to_sequences() == [s.shift(5) for s in sequences]
+    assert batch.shift(26, "right").to_sequences() == [
+        s.shift(26, "right") for s in sequences
+    ]
+    assert batch.shift(21) == batch
+
+
+def test_metrics(batch: BinarySequenceBatch, sequences: list[BinarySequence]) -> None:
+    assert batch.ones.tolist() == [s.ones for s in sequences]
+    assert batch.zeros.tolist() == [s.zeros for s in sequences]
+    assert batch.balance.tolist() == [s.balance for s in sequences]
+    assert batch.entropy.tolist() == [s.entropy for s in sequences]
+    assert batch.run_lengths == [s.run_lengths for s in sequences]
+    assert batch.hamming_distance(sequences[4]).tolist() == [
+        s.hamming_distance(sequences[4]) for s in sequences
+    ]
+
+
+def test_constant_rows_entropy() -> None:
+    batch = BinarySequenceBatch.from_numpy(np.array([[0, 0, 0], [1, 1, 1]]))
+    assert batch.entropy.tolist() == [0.0, 0.0]
+    assert batch.run_lengths == [[(0, 3)], [(1, 3)]]
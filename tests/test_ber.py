@@ -0,0 +1,178 @@
+import random
+
+import pytest
+
+from bseqgen import random_sequence
+from bseqgen.base import BinarySequence
+from bseqgen.ber import BERTester, ErrorBurst
+from bseqgen.lfsr import LFSR, m_sequence, prbs
+from bseqgen.stream import chunked, collect
+
+
+def _flip(seq: BinarySequence, positions: list[int]) -> BinarySequence:
+    value = seq._value
+    for p in positions:
+        value ^= 1 << (seq.length - 1 - p)
+    return BinarySequence._from_packed(value, seq.length)
+
+
+@pytest.mark.parametrize("chunk_bits", [1, 61, 4096, 100_000])
+def test_locks_after_garbage(chunk_bits: int) -> None:
+    rx = collect(
+        [random_sequence(500, seed=1), LFSR((23, 18), seed=77).next_bits(20_000)]
+    )
+    tester = BERTester((23, 18))
+    tester.update_stream(chunked(rx, chunk_bits))
+    result = tester.result()
+
+    assert tester.locked
+    assert result.errors == 0
+    assert 450 <= result.unsynced_bits <= 500
+    assert result.bits + result.unsynced_bits == tester.n == rx.length
+
+
+def test_counts_errors_and_bursts() -> None:
+    data = LFSR((31, 28), seed=99).next_bits(300_000)
+    positions = [1000, 1005, 1010, 50_000, 200_000, 200_031, 250_000]
+    tester = BERTester(LFSR((31, 28)), window_bits=100_000)
+    tester.update_stream(chunked(_flip(data, positions), 8191))
+    result = tester.result()
+
+    assert (result.bits, result.errors, result.sync_losses) == (300_000, 7, 0)
+    assert result.ber == pytest.approx(7 / 300_000)
+    assert result.bursts == (
+        ErrorBurst(1000, 11, 3),
+        ErrorBurst(50_000, 1, 1),
+        ErrorBurst(200_000, 32, 2),
+        ErrorBurst(250_000, 1, 1),
+    )
+    assert tester.window_errors == [4, 0, 3]
+    assert result.window_ber == (4e-5, 0.0, 3e-5)
+
+
+def test_random_errors_match_reference_count() -> None:
+    data = prbs(15, n=200_000)
+    positions = random.Random(3).sample(range(200, 200_000), 400)
+    rx = _flip(data, positions)
+    tester = BERTester((15, 14))
+    tester.update(rx)
+
+    assert tester.errors == rx.hamming_distance(data)
+    assert tester.bits == 200_000
+
+
+@pytest.mark.parametrize("reference", [(7, 6), prbs(7)])
+def test_resynchronizes_after_slip(reference: tuple[int, ...] | BinarySequence) -> None:
+    data = prbs(7, n=100_000)
+    before, after = data[:40_000], data[40_003:]
+    assert isinstance(before, BinarySequence) and isinstance(after, BinarySequence)
+    tester = BERTester(reference)
+    tester.update_stream(chunked(collect([before, after]), 5000))
+    result = tester.result()
+
+    assert result.sync_losses == 1
+    assert tester.locked
+    # the errors before the slip was detected, within one loss block
+    assert result.errors < 1024
+    assert result.bits + result.unsynced_bits == 99_997
+
+
+def _irregular(seq: BinarySequence, sizes: list[int]) -> list[BinarySequence]:
+    chunks: list[BinarySequence] = []
+    position = 0
+    while position < seq.length:
+        size = sizes[len(chunks) % len(sizes)]
+        chunk = seq[position : position + size]
+        assert isinstance(chunk, BinarySequence)
+        chunks.append(chunk)
+        position += size
+    return chunks
+
+
+def test_slip_detection_is_independent_of_chunking() -> None:
+    data = LFSR((23, 18), seed=5).next_bits(100_000)
+    before, after = data[:40_000], data[40_037:]
+    assert isinstance(before, BinarySequence) and isinstance(after, BinarySequence)
+    rx = _flip(collect([before, after]), [20_000])
+    results = set()
+    for sizes in ([64], [128], [200], [1000], [999, 17, 4096], [100_000]):
+        tester = BERTester((23, 18))
+        tester.update_stream(_irregular(rx, sizes))
+        result = tester.result()
+        assert result.sync_losses == 1
+        assert result.errors <= 1 + 204
+        results.add(result)
+
+    assert len(results) == 1
+
+
+def test_periodic_reference() -> None:
+    pattern = random_sequence(1000, seed=5)
+    data = pattern.to_length(30_000).shift(321)
+    rx = _flip(data, [10_000, 20_000])
+    tester = BERTester(pattern)
+    tester.update_stream(chunked(rx, 777))
+
+    assert (tester.bits, tester.errors) == (30_000, 2)
+
+
+def test_galois_pattern_locks() -> None:
+    rx = LFSR((9, 5), seed=3, config="galois").next_bits(10_000)
+    tester = BERTester(m_sequence((9, 5)))
+    tester.update(rx)
+
+    assert (tester.bits, tester.errors) == (10_000, 0)
+
+
+def test_no_lock_on_noise() -> None:
+    tester = BERTester((31, 28))
+    tester.update(random_sequence(50_000, seed=8))
+    tester.update(BinarySequence("0" * 5000))
+
+    assert not tester.locked
+    assert tester.bits == 0
+    assert tester.ber == 0.0
+
+
+def test_validation() -> None:
+    with pytest.raises(ValueError):
+        BERTester((31, 28), sync_bits=40)
+    with pytest.raises(ValueError):
+        BERTester((7, 6), loss_bits=100)
+    with pytest.raises(ValueError):
+        BERTester((7, 6), loss_threshold=0)
+    with pytest.raises(ValueError):
+        BERTester((7, 6), window_bits=0)
+    with pytest.raises(TypeError):
+        BERTester((7, 6)).update("0101")  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(("sync_bits", "garbage"), [(33, 777), (64, 777), (200, 777)])
+def test_periodic_hunt(sync_bits: int, garbage: int) -> None:
+    # the zero run repeats key windows at many phases
+    pattern = collect([BinarySequence("0" * 40), random_sequence(260, seed=9)])
+    rx = collect(
+        [random_sequence(garbage, seed=10), pattern.to_length(6000).shift(123)]
+    )
+    results = set()
+    for chunk_bits in (1, 50, 6777):
+        tester = BERTester(pattern, sync_bits=sync_bits)
+        tester.update_stream(chunked(rx, chunk_bits))
+        results.add((tester.result(), tester.locked))
+
+    ((result, locked),) = results
+    assert locked
+    assert result.bits + result.unsynced_bits == rx.length
+    assert garbage - sync_bits < result.unsynced_bits <= garbage
+    assert result.errors == 0
+
+
+def test_periodic_hunt_short_sync() -> None:
+    pattern = m_sequence((5, 3))
+    rx = collect([BinarySequence("11"), pattern.to_length(310).shift(7)])
+    tester = BERTester(pattern, sync_bits=12)
+    tester.update_stream(chunked(rx, 5))
+
+    result = tester.result()
+
+    assert (result.unsynced_bits, result.bits, result.errors) == (2, 310, 0)
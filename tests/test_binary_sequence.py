@@ -1,3 +1,5 @@
+import sys
+
 import pytest
 
 from bseqgen.base import BinarySequence, Direction
@@ -51,6 +53,47 @@ def test_create_sequence_strlist() -> None:
     assert test_sequence.length == 2
 
 
+def test_create_sequence_bytes_values() -> None:
+    assert BinarySequence(b"\x01\x00\x01").bits == (1, 0, 1)
+    with pytest.raises(ValueError):
+        BinarySequence(b"\x01\x02")
+
+
+def test_create_sequence_negative_values() -> None:
+    with pytest.raises(ValueError):
+        BinarySequence([1, -1])
+
+
+def test_create_sequence_bad_string() -> None:
+    with pytest.raises(ValueError):
+        BinarySequence("1021")
+    with pytest.raises(TypeError):
+        BinarySequence("10a")
+
+
+def test_from_int() -> None:
+    assert BinarySequence.from_int(6, 4).bits == (0, 1, 1, 0)
+    with pytest.raises(ValueError):
+        BinarySequence.from_int(16, 4)
+    with pytest.raises(ValueError):
+        BinarySequence.from_int(1, 0)
+
+
+def test_from_bytes_round_trip() -> None:
+    seq = BinarySequence((1, 1, 1, 0, 0, 0, 1, 0, 1))
+    assert BinarySequence.from_bytes(seq.as_bytes, seq.length) == seq
+    assert BinarySequence.from_bytes(b"\xf0").bit_string == "11110000"
+    with pytest.raises(ValueError):
+        BinarySequence.from_bytes(b"\xff", 4)
+
+
+def test_from_hex_round_trip(test_seq: BinarySequence) -> None:
+    assert BinarySequence.from_hex(test_seq.hex_string, 3) == test_seq
+    assert BinarySequence.from_hex("0xa").bit_string == "1010"
+    with pytest.raises(ValueError):
+        BinarySequence.from_hex("0xag")
+
+
 def test__str__(test_seq: BinarySequence) -> None:
     assert str(test_seq) == "110"
 
@@ -100,6 +143,14 @@ def test__getitem__(test_seq: BinarySequence) -> None:
     assert test_seq[1:].bits == (1, 0)  # type: ignore
 
 
+def test__getitem__slices() -> None:
+    seq = BinarySequence("1101001110")
+    for key in (slice(2, 7), slice(-4, None), slice(None, None, 2), slice(8, 1, -3)):
+        assert seq[key].bits == seq.bits[key]  # type: ignore[union-attr]
+    with pytest.raises(ValueError):
+        seq[5:5]
+
+
 def test__invert__(test_seq: BinarySequence) -> None:
     assert (~test_seq).bits == (0, 0, 1)
 
@@ -214,6 +265,12 @@ def test_to_length_truncate() -> None:
     assert seq.to_length(1).hex_string == "01"
 
 
+def test_to_length_repeats_pattern() -> None:
+    seq = BinarySequence("110")
+    assert seq.to_length(8).bit_string == "11011011"
+    assert seq.to_length(2).bit_string == "11"
+
+
 def test_shift_left(test_seq: BinarySequence) -> None:
     assert test_seq.shift(1, "left").bits == (1, 0, 1)
     assert test_seq.shift(2).bits == (0, 1, 1)
@@ -232,11 +289,16 @@ def test_shift_reject_direction(test_seq: BinarySequence) -> None:
 
 
 def test_autocorr(test_seq: BinarySequence) -> None:
-    pass
+    assert test_seq.autocorr() == (3, -1, -1)
+    assert test_seq.autocorr(normalized=True)[0] == 1.0
+    assert test_seq.autocorr("aperiodic") == (-1, 0, 3, 0, -1)
 
 
 def test_crosscor(test_seq: BinarySequence) -> None:
-    pass
+    other = BinarySequence("100")
+    assert test_seq.crosscorr(other) == (1, -3, 1)
+    with pytest.raises(ValueError):
+        test_seq.crosscorr(BinarySequence("1001"))
 
 
 def test_to_numpy_default(test_seq: BinarySequence) -> None:
@@ -294,6 +356,43 @@ def test_from_numpy_rejects_non_binary_values() -> None:
         BinarySequence.from_numpy(arr)
 
 
+def test_packed_bytes() -> None:
+    assert BinarySequence("101").packed_bytes == b"\xa0"
+    assert BinarySequence("111000101").packed_bytes == b"\xe2\x80"
+
+
+def test_to_numpy_packed() -> None:
+    np = pytest.importorskip("numpy")
+    bits = [1, 1, 1, 0, 0, 0, 1, 0, 1, 1]
+    arr = BinarySequence(bits).to_numpy(packed=True)
+    assert arr.dtype == np.uint8
+    assert arr.tolist() == np.packbits(bits).tolist()
+
+
+def test_from_numpy_packed_round_trip() -> None:
+    pytest.importorskip("numpy")
+    seq = BinarySequence("1110001011")
+    assert BinarySequence.from_numpy(seq.to_numpy(packed=True), 10, packed=True) == seq
+    assert (
+        BinarySequence.from_numpy(seq.to_numpy(packed=True), packed=True).length == 16
+    )
+
+
+def test_from_numpy_packed_rejects_bad_input() -> None:
+    np = pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        BinarySequence.from_numpy(np.zeros(2, dtype=np.uint8), 17, packed=True)
+    with pytest.raises(TypeError):
+        BinarySequence.from_numpy(np.zeros(2, dtype=np.int8), packed=True)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="buffer protocol needs 3.12")
+def test_memoryview(test_seq: BinarySequence) -> None:
+    view = memoryview(test_seq)  # type: ignore[arg-type]
+    assert view.readonly
+    assert view.tobytes() == b"\xc0"
+
+
 def test_invert(test_seq: BinarySequence) -> None:
     assert test_seq.inverted().bits == (0, 0, 1)
 
@@ -319,4 +418,63 @@ def test_bitwise_or(test_seq: BinarySequence) -> None:
 
 
 def test_hamming_distance(test_seq: BinarySequence) -> None:
-    pass
+    assert test_seq.hamming_distance(BinarySequence("011")) == 2
+    assert test_seq.hamming_distance(test_seq) == 0
+    with pytest.raises(ValueError):
+        test_seq.hamming_distance(BinarySequence("0110"))
+
+
+def test__getitem__index(test_seq: BinarySequence) -> None:
+    assert test_seq[0] == 1
+    assert test_seq[-1] == 0
+    with pytest.raises(IndexError):
+        test_seq[3]
+
+
+def test_shift_full_rotation(test_seq: BinarySequence) -> None:
+    assert test_seq.shift(3) == test_seq
+    assert test_seq.shift(0, "right") == test_seq
+
+
+def test_packed_ops_match_bitwise() -> None:
+    a_bits = [(i * 7 + 3) % 5 % 2 for i in range(1000)]
+    b_bits = [(i * 3 + 1) % 7 % 2 for i in range(1000)]
+    a, b = BinarySequence(a_bits), BinarySequence(b_bits)
+
+    assert (a ^ b).bits == tuple(x ^ y for x, y in zip(a_bits, b_bits, strict=True))
+    assert (a & b).bits == tuple(x & y for x, y in zip(a_bits, b_bits, strict=True))
+    assert (a | b).bits == tuple(x | y for x, y in zip(a_bits, b_bits, strict=True))
+    assert (~a).bits == tuple(1 - x for x in a_bits)
+    assert a.shift(123).bits == tuple(a_bits[123:] + a_bits[:123])
+    assert a.ones == sum(a_bits)
+
+
+def test_hashable_and_set_dedupe() -> None:
+    a, b, c = BinarySequence("101"), BinarySequence((1, 0, 1)), BinarySequence("0101")
+    assert hash(a) == hash(b)
+    assert len({a, b, c}) == 2
+    assert {a: 1}[b] == 1
+
+
+def test_immutable(test_seq: BinarySequence) -> None:
+    with pytest.raises(AttributeError):
+        test_seq.bits = (0, 0, 0)  # type: ignore[misc]
+    with pytest.raises(AttributeError):
+        test_seq._value = 0  # type: ignore[misc]
+    with pytest.raises(AttributeError):
+        test_seq.extra = 1  # type: ignore[attr-defined]
+    assert not hasattr(test_seq, "__dict__")
+
+
+def test_cached_run_lengths_not_shared(test_seq: BinarySequence) -> None:
+    runs = test_seq.run_lengths
+    runs.append((1, 99))
+    assert test_seq.run_lengths == [(1, 2), (0, 1)]
+
+
+def test_pickle_round_trip(test_seq: BinarySequence) -> None:
+    import copy
+    import pickle
+
+    assert pickle.loads(pickle.dumps(test_seq)) == test_seq
+    assert copy.deepcopy(test_seq) == test_seq
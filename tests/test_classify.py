@@ -0,0 +1,147 @@
+from collections.abc import Iterator
+
+import pytest
+
+from bseqgen import m_sequence, random_sequence
+from bseqgen.base import BinarySequence
+from bseqgen.classify import (
+    CodeFamily,
+    CodeIndex,
+    canonical_rotation,
+    classify,
+    fingerprint,
+    reference_code,
+)
+from bseqgen.families import GOLD_PREFERRED_PAIRS
+from bseqgen.polynomials import PolynomialCache, set_cache
+from bseqgen.walsh import walsh_code
+
+
+@pytest.fixture(scope="module", autouse=True)
+def polynomial_cache(tmp_path_factory: pytest.TempPathFactory) -> Iterator[None]:
+    set_cache(PolynomialCache(tmp_path_factory.mktemp("cache") / "polynomials.json"))
+    yield
+    set_cache(None)
+
+
+@pytest.fixture(scope="module")
+def index() -> CodeIndex:
+    return CodeIndex.build(max_degree=8)
+
+
+@pytest.mark.parametrize("n", range(1, 11))
+def test_canonical_rotation_is_least_rotation(n: int) -> None:
+    for value in range(1 << n):
+        seq = BinarySequence.from_int(value, n)
+        canonical, offset = canonical_rotation(seq)
+
+        assert canonical._value == min(seq.shift(k)._value for k in range(n))
+        assert seq.shift(offset) == canonical
+
+
+def test_canonical_rotation_of_periodic_sequences() -> None:
+    # many equal runs: candidate pruning falls back to Booth's algorithm
+    seq = BinarySequence("01" * 500 + "0")
+    canonical, offset = canonical_rotation(seq)
+    assert canonical.bit_string == "00" + "10" * 499 + "1"
+    assert seq.shift(offset) == canonical
+
+    code = walsh_code(5, 256)
+    canonical, offset = canonical_rotation(code.shift(9))
+    assert canonical == canonical_rotation(code)[0]
+    assert code.shift(9).shift(offset) == canonical
+
+
+def test_classify_m_sequence_phase(index: CodeIndex) -> None:
+    seq = m_sequence((7, 1)).shift(100)
+    (match,) = index.classify(seq)
+
+    assert match.family == CodeFamily.M_SEQUENCE
+    assert match.polynomials == ((7, 1),)
+    assert (match.length, match.phase, match.inverted) == (127, 100, False)
+    assert reference_code(match).shift(match.phase) == seq
+
+
+@pytest.mark.parametrize("row", [2, 3, 40, 128])
+def test_classify_gold_codes(index: CodeIndex, row: int) -> None:
+    pair = GOLD_PREFERRED_PAIRS[7]
+    u, v = m_sequence(pair[0]), m_sequence(pair[1])
+    seq = (u ^ v.shift(row - 2)).shift(55)
+    (match,) = index.classify(seq)
+
+    assert (match.family, match.polynomials, match.row) == ("gold", pair, row)
+    assert reference_code(match).shift(match.phase) == seq
+
+
+def test_classify_kasami_and_inverted(index: CodeIndex) -> None:
+    np = pytest.importorskip("numpy")
+    from bseqgen.families import kasami_codes
+
+    for row, bits in enumerate(kasami_codes(8)):
+        seq = ~BinarySequence.from_numpy(np.asarray(bits)).shift(3 * row)
+        matches = index.classify(seq)
+
+        assert any(m.family == "kasami" and m.row == row for m in matches)
+        for match in matches:
+            assert match.inverted
+            assert ~reference_code(match).shift(match.phase) == seq
+
+
+def test_classify_walsh_codes(index: CodeIndex) -> None:
+    for row in range(32):
+        seq = walsh_code(row, 32).shift(row)
+        matches = index.classify(seq)
+
+        assert any(m.family == "walsh" and m.row == row for m in matches)
+        for match in matches:
+            assert reference_code(match).shift(match.phase) == seq
+
+
+def test_m_sequence_outside_index(index: CodeIndex) -> None:
+    seq = m_sequence((17, 14), seed=12345)
+    (match,) = index.classify(seq)
+
+    assert (match.family, match.polynomials) == ("m-sequence", ((17, 14),))
+    assert reference_code(match).shift(match.phase) == seq
+    assert index.classify(~seq)[0].inverted
+
+
+def test_unknown_sequences(index: CodeIndex) -> None:
+    assert index.classify(random_sequence(127, seed=1)) == []
+    assert index.classify(random_sequence(1000, seed=1)) == []
+    with pytest.raises(TypeError):
+        index.classify("0101")  # type: ignore[arg-type]
+
+
+def test_classify_many_and_custom_index() -> None:
+    custom = CodeIndex()
+    custom.add(BinarySequence("0010111"), "m-sequence", ((3, 2),))
+    assert len(custom) == 1
+
+    matches = custom.classify_many(
+        [BinarySequence("1110010"), BinarySequence("1111000")]
+    )
+    assert [len(m) for m in matches] == [1, 0]
+    assert matches[0][0].phase == 4
+    assert classify(BinarySequence("1110010"), index=custom) == matches[0]
+
+
+def test_fingerprint() -> None:
+    code = m_sequence((7, 6))
+    fp = fingerprint(code.shift(30))
+
+    assert fp == fingerprint(code)
+    assert (fp.length, fp.ones, fp.linear_complexity, fp.peak_sidelobe) == (
+        127,
+        64,
+        7,
+        1,
+    )
+    assert fp.rotation_hash != fingerprint(m_sequence((7, 1))).rotation_hash
+
+
+def test_build_validation() -> None:
+    with pytest.raises(ValueError):
+        CodeIndex.build(max_degree=0)
+    with pytest.raises(ValueError):
+        CodeIndex.build(families=["barker"])  # type: ignore[list-item]
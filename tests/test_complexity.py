@@ -0,0 +1,102 @@
+import pytest
+
+from bseqgen import m_sequence, prbs, random_sequence
+from bseqgen.base import BinarySequence
+from bseqgen.complexity import (
+    BerlekampMassey,
+    berlekamp_massey,
+    linear_complexity,
+    linear_complexity_profile,
+)
+from bseqgen.lfsr import LFSR
+from bseqgen.polynomials import poly_from_taps
+from bseqgen.stream import chunked, collect
+
+
+def _reference(bits: tuple[int, ...]) -> tuple[int, int, list[tuple[int, int]]]:
+    """Textbook list based Berlekamp-Massey."""
+    n = len(bits)
+    c, b = [1] + [0] * n, [1] + [0] * n
+    complexity, changed_at, profile = 0, -1, []
+    for i in range(n):
+        d = bits[i]
+        for j in range(1, complexity + 1):
+            d ^= c[j] & bits[i - j]
+        if d:
+            previous = c[:]
+            for j in range(n + 1 - (i - changed_at)):
+                c[j + i - changed_at] ^= b[j]
+            if 2 * complexity <= i:
+                complexity = i + 1 - complexity
+                changed_at, b = i, previous
+                profile.append((i + 1, complexity))
+    return complexity, sum(bit << k for k, bit in enumerate(c)), profile
+
+
+@pytest.mark.parametrize(
+    "seq",
+    [
+        random_sequence(1, seed=1),
+        random_sequence(257, seed=2),
+        random_sequence(1000, seed=3),
+        BinarySequence("0001"),
+        BinarySequence("0" * 40 + "1" + "0" * 100),
+        prbs(7, n=300),
+        m_sequence((5, 3)) ^ m_sequence((5, 4, 3, 2)).shift(3),
+    ],
+)
+def test_matches_reference(seq: BinarySequence) -> None:
+    complexity, poly, profile = _reference(seq.bits)
+
+    assert berlekamp_massey(seq) == (complexity, poly)
+    assert linear_complexity(seq) == complexity
+    assert linear_complexity_profile(seq) == profile
+
+
+@pytest.mark.parametrize("taps", [(7, 6), (9, 5), (31, 28)])
+@pytest.mark.parametrize("config", ["fibonacci", "galois"])
+def test_recovers_lfsr(taps: tuple[int, ...], config: str) -> None:
+    bits = LFSR(taps, seed=5, config=config).next_bits(10_000)  # type: ignore[arg-type]
+
+    assert berlekamp_massey(bits) == (taps[0], poly_from_taps(taps))
+
+
+def test_gold_code_complexity() -> None:
+    gold = m_sequence((5, 3)) ^ m_sequence((5, 4, 3, 2)).shift(7)
+
+    assert linear_complexity(gold.to_length(2 * gold.length)) == 10
+
+
+def test_random_complexity_is_about_half() -> None:
+    seq = random_sequence(20_000, seed=9)
+
+    assert abs(linear_complexity(seq) - 10_000) <= 10
+
+
+def test_incremental_updates_match_whole_sequence() -> None:
+    seq = collect([random_sequence(3000, seed=4), prbs(9, n=5000)])
+    state = BerlekampMassey()
+    for size in (1, 3, 7, 100, 2000):
+        state.update(BinarySequence(seq.bits[state.n : state.n + size]))
+    rest = seq[state.n :]
+    assert isinstance(rest, BinarySequence)
+    state.update_stream(chunked(rest, 999))
+
+    assert state.n == seq.length
+    assert (state.linear_complexity, state.connection_polynomial) == (
+        berlekamp_massey(seq)
+    )
+    assert state.profile == linear_complexity_profile(seq)
+
+
+def test_profile_tracks_running_complexity() -> None:
+    state = BerlekampMassey()
+    state.update(BinarySequence("000"))
+    assert (state.linear_complexity, state.profile) == (0, [])
+    state.update(BinarySequence("1"))
+    assert (state.linear_complexity, state.profile) == (4, [(4, 4)])
+
+
+def test_update_requires_sequence() -> None:
+    with pytest.raises(TypeError):
+        BerlekampMassey().update("0101")  # type: ignore[arg-type]
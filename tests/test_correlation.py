@@ -0,0 +1,54 @@
+import pytest
+
+from bseqgen import random_sequence
+from bseqgen.base import BinarySequence
+from bseqgen.correlation import correlate
+
+
+def _naive(a: BinarySequence, b: BinarySequence, periodic: bool) -> list[int]:
+    n = a.length
+    sa, sb = a.signed, b.signed
+    if periodic:
+        return [sum(sa[i] * sb[(i + k) % n] for i in range(n)) for k in range(n)]
+    return [
+        sum(sa[i] * sb[i + k] for i in range(n) if 0 <= i + k < n)
+        for k in range(-(n - 1), n)
+    ]
+
+
+@pytest.mark.parametrize("mode", ["periodic", "aperiodic"])
+def test_direct_matches_naive(mode: str) -> None:
+    a, b = random_sequence(37, seed=1), random_sequence(37, seed=2)
+    result = correlate(a, b, mode=mode, method="direct")  # type: ignore[arg-type]
+    assert list(result) == _naive(a, b, mode == "periodic")
+
+
+@pytest.mark.parametrize("mode", ["periodic", "aperiodic"])
+def test_fft_matches_direct(mode: str) -> None:
+    pytest.importorskip("numpy")
+    a, b = random_sequence(300, seed=3), random_sequence(300, seed=4)
+    fft = correlate(a, b, mode=mode, method="fft")  # type: ignore[arg-type]
+    direct = correlate(a, b, mode=mode, method="direct")  # type: ignore[arg-type]
+    assert fft == direct
+
+
+def test_normalized() -> None:
+    a = random_sequence(50, seed=5)
+    result = correlate(a, a, normalized=True)
+    assert result[0] == 1.0
+    assert all(-1.0 <= value <= 1.0 for value in result)
+
+
+def test_aperiodic_length() -> None:
+    a = random_sequence(10, seed=6)
+    assert len(correlate(a, a, mode="aperiodic")) == 19
+
+
+def test_rejects_mismatched_lengths() -> None:
+    with pytest.raises(ValueError):
+        correlate(BinarySequence("101"), BinarySequence("10"))
+
+
+def test_rejects_bad_mode() -> None:
+    with pytest.raises(ValueError):
+        correlate(BinarySequence("101"), BinarySequence("101"), mode="bloop")  # type: ignore[arg-type]
@@ -0,0 +1,56 @@
+import pytest
+
+from bseqgen import random_sequence
+from bseqgen.base import BinarySequence
+from bseqgen.distance import hamming_distances
+
+
+@pytest.fixture
+def codebook() -> list[BinarySequence]:
+    return [random_sequence(21, seed=i) for i in range(50)]
+
+
+def test_hamming_distances(codebook: list[BinarySequence]) -> None:
+    query = codebook[7]
+    distances = hamming_distances(query, codebook)
+
+    assert len(distances) == 50
+    assert distances[7] == 0
+    assert distances == [query.hamming_distance(c) for c in codebook]
+
+
+def test_hamming_distances_threshold(codebook: list[BinarySequence]) -> None:
+    distances = hamming_distances(codebook[7], codebook, threshold=0)
+    assert len(distances) == 8
+    assert distances[-1] == 0
+
+
+def test_hamming_distances_length_mismatch(codebook: list[BinarySequence]) -> None:
+    with pytest.raises(ValueError):
+        hamming_distances(codebook[0], [BinarySequence("101")])
+
+
+def test_hamming_distances_packed(codebook: list[BinarySequence]) -> None:
+    np = pytest.importorskip("numpy")
+    packed = np.packbits(np.array([c.bits for c in codebook], dtype=np.uint8), axis=1)
+    query = codebook[7]
+
+    assert hamming_distances(query, packed) == hamming_distances(query, codebook)
+    assert hamming_distances(query, packed, threshold=0) == hamming_distances(
+        query, codebook, threshold=0
+    )
+
+
+def test_hamming_distances_packed_wrong_width(codebook: list[BinarySequence]) -> None:
+    np = pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        hamming_distances(codebook[0], np.zeros((2, 5), dtype=np.uint8))
+
+
+def test_hamming_distances_batch(codebook: list[BinarySequence]) -> None:
+    from bseqgen.batch import BinarySequenceBatch
+
+    batch = BinarySequenceBatch.from_sequences(codebook)
+    assert hamming_distances(codebook[3], batch) == hamming_distances(
+        codebook[3], codebook
+    )
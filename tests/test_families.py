@@ -0,0 +1,50 @@
+import pytest
+
+from bseqgen.base import BinarySequence
+from bseqgen.families import gold_codes, kasami_codes
+from bseqgen.lfsr import m_sequence
+
+np = pytest.importorskip("numpy")
+
+
+def test_gold_codes_shape_and_rows() -> None:
+    codes = gold_codes(5)
+    u, v = m_sequence((5, 3)), m_sequence((5, 4, 3, 2))
+
+    assert codes.shape == (33, 31)
+    assert codes.dtype == np.uint8
+    assert BinarySequence.from_numpy(codes[0]) == u
+    assert BinarySequence.from_numpy(codes[1]) == v
+    assert BinarySequence.from_numpy(codes[2 + 4]) == u ^ v.shift(4)
+
+
+def test_gold_codes_three_valued_crosscorrelation() -> None:
+    codes = gold_codes(7)
+    a = BinarySequence.from_numpy(codes[5])
+    b = BinarySequence.from_numpy(codes[40])
+    assert set(a.crosscorr(b)) <= {-1, -17, 15}
+
+
+def test_gold_codes_packed() -> None:
+    codes = gold_codes(6)
+    assert np.array_equal(gold_codes(6, packed=True), np.packbits(codes, axis=1))
+
+
+def test_gold_codes_unknown_degree() -> None:
+    with pytest.raises(ValueError):
+        gold_codes(8)
+
+
+def test_kasami_codes() -> None:
+    codes = kasami_codes(6)
+    assert codes.shape == (8, 63)
+
+    a = BinarySequence.from_numpy(codes[2])
+    b = BinarySequence.from_numpy(codes[5])
+    # small Kasami set correlation values are -1, -(2^(n/2) + 1), 2^(n/2) - 1
+    assert set(a.crosscorr(b)) <= {-1, -9, 7}
+
+
+def test_kasami_codes_odd_degree() -> None:
+    with pytest.raises(ValueError):
+        kasami_codes(5)
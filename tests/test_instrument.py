@@ -0,0 +1,119 @@
+import json
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+import bseqgen
+from bseqgen import random_seq
+from bseqgen.base import BinarySequence
+from bseqgen.instrument import OPERATIONS, Instrumentation, OpStats
+from bseqgen.lfsr import LFSR
+
+
+def _originals() -> dict[str, object]:
+    return {name: value for name, value in vars(BinarySequence).items()}
+
+
+def test_counts_operations() -> None:
+    a = BinarySequence("1100")
+    b = BinarySequence("1010")
+    with Instrumentation() as inst:
+        assert inst.enabled
+        assert a ^ b == BinarySequence("0110")
+        a.xor(b)
+        _ = a.shift(1).ones
+        BinarySequence.from_int(5, 8)
+    stats = inst.snapshot()
+
+    assert stats["BinarySequence.xor"].calls == 2
+    assert stats["BinarySequence.xor"].bits == 8
+    assert stats["BinarySequence.shift"].calls == 1
+    assert stats["BinarySequence.ones"].calls == 1
+    assert stats["BinarySequence.from_int"].bits == 8
+    assert stats["BinarySequence.__init__"].calls == 1
+    assert stats["BinarySequence._validate_bits"].bits == 4
+    assert all(s.seconds >= 0 and s.bytes_allocated == 0 for s in stats.values())
+    assert not inst.enabled
+
+
+def test_disable_restores_originals() -> None:
+    before = _originals()
+    package_random = bseqgen.random_sequence
+    with Instrumentation():
+        assert vars(BinarySequence)["xor"] is not before["xor"]
+        assert bseqgen.random_sequence is not package_random
+    assert _originals() == before
+    assert bseqgen.random_sequence is package_random
+    assert random_seq.random_sequence is package_random
+
+
+def test_generators() -> None:
+    with Instrumentation(["random_sequence", "LFSR.next_bits", "prbs"]) as inst:
+        bseqgen.random_sequence(100, seed=1)
+        LFSR((5, 3)).next_bits(31)
+        bseqgen.prbs(7)
+    stats = inst.snapshot()
+
+    assert set(stats) == {"random_sequence", "LFSR.next_bits", "prbs"}
+    assert stats["random_sequence"] == OpStats(
+        1, stats["random_sequence"].seconds, 0, 100
+    )
+    # prbs generates through LFSR.next_bits, so its call is counted as well
+    assert stats["LFSR.next_bits"].calls == 2
+    assert stats["LFSR.next_bits"].bits == 31 + 127
+    assert stats["prbs"].bits == 127
+
+
+def test_records_failed_calls() -> None:
+    with Instrumentation(["BinarySequence.__init__"]) as inst:
+        with pytest.raises(ValueError):
+            BinarySequence("012")
+    assert inst.snapshot()["BinarySequence.__init__"].calls == 1
+
+
+def test_memory_tracking() -> None:
+    assert not tracemalloc.is_tracing()
+    with Instrumentation(["random_sequence"], memory=True) as inst:
+        assert tracemalloc.is_tracing()
+        seq = bseqgen.random_sequence(100_000, seed=1)
+    assert not tracemalloc.is_tracing()
+    assert inst.snapshot()["random_sequence"].bytes_allocated >= 100_000 // 8
+    assert seq.length == 100_000
+
+
+def test_accumulates_and_resets() -> None:
+    inst = Instrumentation(["BinarySequence.inverted"])
+    seq = BinarySequence("10")
+    for _ in range(2):
+        with inst:
+            seq.inverted()
+    assert inst.snapshot()["BinarySequence.inverted"].calls == 2
+    inst.reset()
+    assert inst.snapshot() == {}
+
+
+def test_export(tmp_path: Path) -> None:
+    with Instrumentation(["bseqgen.base:BinarySequence.inverted"]) as inst:
+        ~BinarySequence("10")
+    path = tmp_path / "stats.json"
+    inst.export_json(path)
+    data = json.loads(path.read_text())
+
+    assert data == inst.as_dict()
+    assert data["operations"]["BinarySequence.inverted"]["calls"] == 1
+    assert "BinarySequence.inverted" in inst.report()
+
+
+def test_single_active_instance() -> None:
+    with Instrumentation():
+        with pytest.raises(RuntimeError):
+            Instrumentation().enable()
+    with Instrumentation():
+        pass
+
+
+def test_unknown_operation() -> None:
+    with pytest.raises(ValueError):
+        Instrumentation(["BinarySequence.nope"])
+    assert len(set(OPERATIONS)) == len(OPERATIONS)
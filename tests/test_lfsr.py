@@ -0,0 +1,73 @@
+import pytest
+
+from bseqgen.base import BinarySequence
+from bseqgen.lfsr import LFSR, m_sequence, prbs
+
+
+@pytest.mark.parametrize("config", ["fibonacci", "galois"])
+@pytest.mark.parametrize("taps", [(7, 6), (20, 3), (5, 4, 3, 2)])
+def test_next_bits_matches_step(config: str, taps: tuple[int, ...]) -> None:
+    block = LFSR(taps, seed=5, config=config)  # type: ignore[arg-type]
+    single = LFSR(taps, seed=5, config=config)  # type: ignore[arg-type]
+
+    expected = tuple(single.step() for _ in range(1500))
+    got = (
+        block.next_bits(3).bits + block.next_bits(997).bits + block.next_bits(500).bits
+    )
+
+    assert got == expected
+    assert block.state == single.state
+
+
+@pytest.mark.parametrize("config", ["fibonacci", "galois"])
+def test_jump_matches_next_bits(config: str) -> None:
+    jumped = LFSR((23, 18), config=config)  # type: ignore[arg-type]
+    stepped = LFSR((23, 18), config=config)  # type: ignore[arg-type]
+
+    jumped.jump(12345)
+    stepped.next_bits(12345)
+    assert jumped.state == stepped.state
+
+
+def test_jump_full_period_returns_to_seed() -> None:
+    lfsr = LFSR((31, 28), seed=0x1234)
+    lfsr.jump(lfsr.max_period)
+    assert lfsr.state == 0x1234
+
+
+def test_fibonacci_output_starts_with_seed() -> None:
+    assert LFSR((7, 6), seed=0b1010011).next_bits(7) == BinarySequence("1010011")
+
+
+def test_m_sequence_properties() -> None:
+    seq = m_sequence((7, 6))
+
+    assert seq.length == 127
+    assert seq.ones == 64
+    assert set(seq.autocorr()[1:]) == {-1}
+
+
+def test_galois_is_shift_of_fibonacci() -> None:
+    fibonacci = m_sequence((5, 3))
+    galois = m_sequence((5, 3), config="galois")
+    assert any(galois == fibonacci.shift(k) for k in range(31))
+
+
+def test_reset() -> None:
+    lfsr = LFSR((9, 5))
+    first = lfsr.next_bits(40)
+    lfsr.reset()
+    assert lfsr.next_bits(40) == first
+
+
+def test_prbs() -> None:
+    assert prbs(9).length == 511
+    assert prbs(31, n=1000).length == 1000
+    with pytest.raises(ValueError):
+        prbs(8)
+
+
+@pytest.mark.parametrize("seed", [0, 128])
+def test_invalid_seed(seed: int) -> None:
+    with pytest.raises(ValueError):
+        LFSR((7, 6), seed=seed)
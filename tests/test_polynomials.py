@@ -0,0 +1,156 @@
+import math
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from bseqgen.lfsr import PRBS_POLYNOMIALS, m_sequence
+from bseqgen.polynomials import (
+    PRIMITIVE_POLYNOMIALS,
+    PolynomialCache,
+    degree,
+    is_irreducible,
+    is_primitive,
+    poly_from_taps,
+    poly_gcd,
+    poly_mod,
+    poly_mul,
+    poly_mulmod,
+    poly_powmod,
+    poly_to_taps,
+    primitive_polynomials,
+    reciprocal,
+    set_cache,
+)
+
+
+def test_poly_from_taps() -> None:
+    assert poly_from_taps((7, 6)) == 0b11000001
+    assert poly_from_taps(0b1011) == 0b1011
+
+
+@pytest.mark.parametrize("taps", [(), 0b1010, 1])
+def test_poly_from_taps_invalid(taps: tuple[int, ...] | int) -> None:
+    with pytest.raises(ValueError):
+        poly_from_taps(taps)
+
+
+def test_poly_to_taps() -> None:
+    assert poly_to_taps(0b11000001) == (7, 6)
+
+
+def test_degree_and_reciprocal() -> None:
+    assert degree(0b11000001) == 7
+    assert reciprocal(0b11000001) == 0b10000011
+
+
+def test_poly_mul_and_mod() -> None:
+    # (x + 1)^2 = x^2 + 1 over GF(2)
+    assert poly_mul(0b11, 0b11) == 0b101
+    assert poly_mod(0b101, 0b11) == 0
+    assert poly_mulmod(0b10, 0b100, 0b1011) == 0b11
+
+
+def test_poly_powmod_order_of_x() -> None:
+    # x^3 + x + 1 is primitive, so x has order 7
+    assert poly_powmod(0b10, 7, 0b1011) == 1
+    assert poly_powmod(0b10, 3, 0b1011) != 1
+
+
+@pytest.fixture(autouse=True)
+def polynomial_cache(tmp_path: Path) -> Iterator[PolynomialCache]:
+    cache = PolynomialCache(tmp_path / "polynomials.json")
+    set_cache(cache)
+    yield cache
+    set_cache(None)
+
+
+def test_poly_gcd() -> None:
+    # (x + 1)(x^2 + x + 1) and (x + 1)^2 share x + 1
+    assert poly_gcd(poly_mul(0b11, 0b111), poly_mul(0b11, 0b11)) == 0b11
+    assert poly_gcd(0b1011, 0b1101) == 1
+
+
+@pytest.mark.parametrize(
+    ("poly", "irreducible", "primitive"),
+    [
+        (0b11, True, True),
+        (0b111, True, True),
+        (0b1011, True, True),
+        (0b10101, False, False),  # (x^2 + x + 1)^2
+        (0b11111, True, False),  # x^4 + ... + 1 divides x^5 - 1
+        (0b100011011, True, False),  # AES polynomial, x has order 51
+        (0b11000001, True, True),
+        (0b11000011, False, False),  # even weight
+    ],
+)
+def test_irreducible_and_primitive(
+    poly: int, irreducible: bool, primitive: bool
+) -> None:
+    assert is_irreducible(poly) is irreducible
+    assert is_primitive(poly) is primitive
+
+
+@pytest.mark.parametrize("n", range(1, 11))
+def test_primitive_polynomials_count(n: int) -> None:
+    polys = list(primitive_polynomials(n))
+    # phi(2^n - 1) / n primitive polynomials of degree n
+    order = (1 << n) - 1
+    phi = sum(1 for k in range(1, order + 1) if math.gcd(k, order) == 1)
+
+    assert len(polys) == phi // n
+    assert polys == sorted(polys)
+    assert all(degree(p) == n and is_primitive(p) for p in polys)
+    assert all(poly_powmod(0b10, order, p) == 1 for p in polys)
+
+
+def test_primitive_polynomial_table() -> None:
+    assert sorted(PRIMITIVE_POLYNOMIALS) == list(range(2, 65))
+    for n, taps in PRIMITIVE_POLYNOMIALS.items():
+        assert taps[0] == n
+        assert is_primitive(taps)
+    for taps in PRBS_POLYNOMIALS.values():
+        assert is_primitive(taps)
+
+
+def test_primitive_generates_maximal_length_lfsr() -> None:
+    seq = m_sequence(PRIMITIVE_POLYNOMIALS[10])
+    # a full period has 2^(n-1) ones and every non-zero shift differs
+    assert seq.length == 1023
+    assert seq.ones == 512
+    assert all(seq.shift(k) != seq for k in range(1, 1023))
+
+
+def test_polynomial_cache(polynomial_cache: PolynomialCache) -> None:
+    assert is_primitive((9, 5))
+    assert polynomial_cache.get(poly_from_taps((9, 5))) is True
+    polynomial_cache.flush()
+
+    reloaded = PolynomialCache(polynomial_cache.path)
+    assert reloaded.get(poly_from_taps((9, 5))) is True
+    assert reloaded.get(0b1011) is None
+
+    # a cached answer is trusted
+    polynomial_cache.put(0b1011, False)
+    assert not is_primitive(0b1011)
+
+
+def test_polynomial_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = PolynomialCache(tmp_path / "lru.json", max_entries=2)
+    cache.put(1, True)
+    cache.put(2, False)
+    assert cache.get(1) is True
+    cache.put(3, True)
+
+    assert len(cache) == 2
+    assert cache.get(2) is None
+    cache.flush()
+    assert len(PolynomialCache(cache.path, max_entries=1)) == 1
+
+
+def test_polynomial_cache_ignores_bad_files(tmp_path: Path) -> None:
+    path = tmp_path / "bad.json"
+    path.write_text("not json")
+    assert len(PolynomialCache(path)) == 0
+    with pytest.raises(ValueError):
+        PolynomialCache(path, max_entries=0)
@@ -1,7 +1,8 @@
 import pytest
 
-from bseqgen import random_sequence
+from bseqgen import random_sequence, random_stream
 from bseqgen.base import BinarySequence
+from bseqgen.stream import collect
 
 
 @pytest.fixture
@@ -46,3 +47,41 @@ def test_random_sequence_invalid_length() -> None:
 
     with pytest.raises(ValueError):
         random_sequence(0)
+
+
+def test_random_sequence_legacy_reproduces_per_bit_stream() -> None:
+    import random
+
+    rng = random.Random(42)
+    expected = tuple(rng.randint(0, 1) for _ in range(50))
+    assert random_sequence(50, seed=42, legacy=True).bits == expected
+
+
+@pytest.mark.parametrize("backend", ["pcg64", "philox"])
+def test_random_sequence_numpy_backend(backend: str) -> None:
+    pytest.importorskip("numpy")
+    seq1 = random_sequence(1001, seed=3, backend=backend)  # type: ignore[arg-type]
+    seq2 = random_sequence(1001, seed=3, backend=backend)  # type: ignore[arg-type]
+
+    assert seq1 == seq2
+    assert seq1.length == 1001
+    assert 0.4 < seq1.balance < 0.6
+
+
+def test_random_sequence_numpy_backend_rejects_str_seed() -> None:
+    pytest.importorskip("numpy")
+    with pytest.raises(TypeError):
+        random_sequence(10, seed="abc", backend="pcg64")
+
+
+def test_random_sequence_legacy_needs_python_backend() -> None:
+    with pytest.raises(ValueError):
+        random_sequence(10, backend="pcg64", legacy=True)
+
+
+@pytest.mark.parametrize("backend", ["python", "pcg64"])
+def test_random_stream_matches_sequence(backend: str) -> None:
+    pytest.importorskip("numpy")
+    chunks = random_stream(1000, chunk_bits=64, seed=9, backend=backend)  # type: ignore[arg-type]
+    expected = random_sequence(1000, seed=9, backend=backend)  # type: ignore[arg-type]
+    assert collect(chunks) == expected
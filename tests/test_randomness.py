@@ -0,0 +1,121 @@
+import pytest
+
+from bseqgen import prbs, random_sequence
+from bseqgen.base import BinarySequence
+from bseqgen.randomness import (
+    RandomnessAccumulator,
+    approximate_entropy,
+    block_frequency,
+    cumulative_sums,
+    longest_run,
+    monobit,
+    run_all,
+    runs,
+    serial,
+    spectral,
+)
+from bseqgen.stream import chunked
+
+pytest.importorskip("numpy")
+
+# worked examples from NIST SP 800-22 rev 1a, section 2
+LONGEST_RUN_EXAMPLE = (
+    "11001100000101010110110001001100111000000000001001001101010100010001001111"
+    "010110100000001101011111001100111001101101100010110010"
+)
+
+
+def test_monobit() -> None:
+    assert monobit(BinarySequence("1011010101")).p_value == pytest.approx(
+        0.527089, abs=1e-6
+    )
+
+
+def test_block_frequency() -> None:
+    result = block_frequency(BinarySequence("0110011010"), block_size=3)
+    assert result.statistic == pytest.approx(1.0)
+    assert result.p_value == pytest.approx(0.801252, abs=1e-6)
+
+
+def test_runs() -> None:
+    result = runs(BinarySequence("1001101011"))
+    assert result.statistic == 7
+    assert result.p_value == pytest.approx(0.147232, abs=1e-6)
+    assert runs(BinarySequence("1" * 90 + "0" * 10)).p_value == 0.0
+
+
+def test_longest_run() -> None:
+    result = longest_run(BinarySequence(LONGEST_RUN_EXAMPLE))
+    assert result.statistic == pytest.approx(4.882605, abs=1e-6)
+    assert result.p_value == pytest.approx(0.180598, abs=1e-6)
+    with pytest.raises(ValueError):
+        longest_run(BinarySequence("10" * 10))
+
+
+def test_serial() -> None:
+    first, second = serial(BinarySequence("0011011101"), m=3)
+    assert first.p_value == pytest.approx(0.808792, abs=1e-6)
+    assert second.p_value == pytest.approx(0.670320, abs=1e-6)
+
+
+def test_approximate_entropy() -> None:
+    result = approximate_entropy(BinarySequence("0100110101"), m=3)
+    assert result.p_value == pytest.approx(0.261961, abs=1e-6)
+
+
+def test_cumulative_sums() -> None:
+    forward, backward = cumulative_sums(BinarySequence("1011010111"))
+    assert forward.statistic == 4
+    assert forward.p_value == pytest.approx(0.4116588, abs=1e-6)
+    assert backward.statistic == 4
+
+
+def test_spectral() -> None:
+    assert spectral(random_sequence(4096, seed=1)).passed()
+    assert not spectral(BinarySequence("1101" * 1024)).passed()
+
+
+def test_random_passes_periodic_fails() -> None:
+    results = run_all(random_sequence(20_000, seed=5))
+    assert len(results) == 10
+    assert all(result.passed() for result in results)
+
+    failures = [
+        r.name for r in run_all(BinarySequence("1100" * 5000)) if not r.passed()
+    ]
+    assert "serial_1" in failures and "approximate_entropy" in failures
+
+
+def test_accumulator_matches_single_pass() -> None:
+    seq = prbs(15, n=50_000)
+    accumulator = RandomnessAccumulator(serial_m=5, apen_m=4)
+    for chunk in chunked(seq, 777):
+        accumulator.update(chunk)
+
+    assert accumulator.n == 50_000
+    streamed = accumulator.results()
+    expected = run_all(seq, serial_m=5, apen_m=4)[:-1]
+    assert [r.name for r in streamed] == [r.name for r in expected]
+    for got, want in zip(streamed, expected, strict=True):
+        assert got.statistic == pytest.approx(want.statistic)
+        assert got.p_value == pytest.approx(want.p_value)
+
+
+def test_accumulator_invalid() -> None:
+    with pytest.raises(ValueError):
+        RandomnessAccumulator().results()
+    with pytest.raises(ValueError):
+        RandomnessAccumulator(longest_run_block=64)
+    with pytest.raises(ValueError):
+        RandomnessAccumulator(serial_m=1)
+
+
+def test_tests_implement_the_state_interface() -> None:
+    from bseqgen.randomness import _Test
+
+    class Incomplete(_Test):
+        def update(self, bits: object) -> None:
+            pass
+
+    with pytest.raises(TypeError):
+        Incomplete()  # type: ignore[abstract]
@@ -0,0 +1,132 @@
+import builtins
+from itertools import groupby
+from typing import Any
+
+import pytest
+
+from bseqgen import random_sequence
+from bseqgen.base import BinarySequence
+from bseqgen.runs import (
+    RunLengthSequence,
+    _regex_run_lengths,
+    _run_bounds,
+    longest_run,
+    run_boundaries,
+    run_count,
+    run_histogram,
+    run_lengths,
+)
+
+
+def _groupby_runs(seq: BinarySequence) -> list[tuple[int, int]]:
+    return [(bit, len(list(group))) for bit, group in groupby(seq.bits)]
+
+
+@pytest.mark.parametrize("n", [1, 7, 64, 1000])
+def test_run_lengths(n: int) -> None:
+    seq = random_sequence(n, seed=n)
+    runs = _groupby_runs(seq)
+
+    assert run_lengths(seq) == runs
+    assert seq.run_lengths == runs
+    assert run_count(seq) == len(runs)
+    assert run_boundaries(seq)[0] == 0
+    assert len(run_boundaries(seq)) == len(runs)
+
+
+@pytest.mark.parametrize(
+    "seq",
+    [
+        BinarySequence("0"),
+        BinarySequence("1111"),
+        BinarySequence("1110011011110000"),
+        random_sequence(300, seed=4),
+        random_sequence(1001, seed=5),
+    ],
+)
+def test_run_analysis_without_numpy(
+    monkeypatch: pytest.MonkeyPatch, seq: BinarySequence
+) -> None:
+    runs = _groupby_runs(seq)
+    histograms = [run_histogram(seq, bit) for bit in (None, 0, 1)]
+    boundaries = run_boundaries(seq)
+    real_import = builtins.__import__
+
+    def no_numpy(name: str, *args: Any, **kwargs: Any) -> Any:
+        if name == "numpy":
+            raise ImportError
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", no_numpy)
+    assert _regex_run_lengths(seq) == [count for _, count in runs]
+    assert run_lengths(seq) == runs
+    assert [run_histogram(seq, bit) for bit in (None, 0, 1)] == histograms
+    assert run_boundaries(seq) == boundaries
+    assert _run_bounds(seq)[1][-1] == seq.length
+
+
+def test_run_histogram_and_longest_run() -> None:
+    seq = BinarySequence("1110011011110000")
+    assert run_histogram(seq) == {1: 1, 2: 2, 3: 1, 4: 2}
+    assert run_histogram(seq, bit=1) == {2: 1, 3: 1, 4: 1}
+    assert run_histogram(seq, bit=0) == {1: 1, 2: 1, 4: 1}
+    assert longest_run(seq) == 4
+    assert longest_run(seq, bit=0) == 4
+    assert longest_run(BinarySequence("0000")) == 0
+
+    for n in (50, 999):
+        seq = random_sequence(n, seed=n)
+        for bit in (0, 1):
+            expected = max((c for b, c in seq.run_lengths if b == bit), default=0)
+            assert longest_run(seq, bit) == expected
+
+
+def test_run_length_sequence() -> None:
+    seq = BinarySequence("0001111100000001")
+    rle = RunLengthSequence.from_sequence(seq)
+
+    assert rle.runs == seq.run_lengths
+    assert rle.run_count == 4
+    assert len(rle) == 16
+    assert rle.ones == seq.ones
+    assert rle.zeros == seq.zeros
+    assert rle.to_sequence() == seq
+    assert list(rle) == list(seq.bits)
+    assert [rle[i] for i in range(-16, 16)] == list(seq.bits) * 2
+    assert rle.longest_run(0) == 7
+    assert RunLengthSequence([(1, 2), (1, 3), (0, 1)]).runs == [(1, 5), (0, 1)]
+    assert hash(rle) == hash(RunLengthSequence(seq.run_lengths))
+
+
+def test_run_length_sequence_slicing() -> None:
+    seq = random_sequence(200, seed=11)
+    rle = RunLengthSequence.from_sequence(seq)
+    for start, stop in [(0, 200), (3, 4), (17, 150), (199, 200)]:
+        part = seq[start:stop]
+        assert isinstance(part, BinarySequence)
+        assert rle[start:stop].to_sequence() == part
+    assert rle[::3].to_sequence() == seq[::3]
+    with pytest.raises(ValueError):
+        rle[5:5]
+    with pytest.raises(IndexError):
+        rle[200]
+
+
+def test_run_length_sequence_bitwise() -> None:
+    a = random_sequence(300, seed=1)
+    b = BinarySequence("0" * 100 + "1" * 150 + "0" * 50)
+    rle_a = RunLengthSequence.from_sequence(a)
+    rle_b = RunLengthSequence.from_sequence(b)
+
+    assert (rle_a ^ rle_b).to_sequence() == a ^ b
+    assert (rle_a & rle_b).to_sequence() == a & b
+    assert (rle_a | b).to_sequence() == a | b
+    assert (~rle_b).to_sequence() == ~b
+    assert (rle_b ^ rle_b) == RunLengthSequence([(0, 300)])
+
+    with pytest.raises(ValueError):
+        rle_a ^ RunLengthSequence([(1, 3)])
+    with pytest.raises(ValueError):
+        RunLengthSequence([(2, 3)])
+    with pytest.raises(ValueError):
+        RunLengthSequence([])
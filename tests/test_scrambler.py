@@ -0,0 +1,108 @@
+import pytest
+
+from bseqgen import random_sequence
+from bseqgen.base import BinarySequence
+from bseqgen.scrambler import (
+    SCRAMBLER_POLYNOMIALS,
+    Descrambler,
+    Scrambler,
+    descramble,
+    scramble,
+)
+from bseqgen.stream import chunked, collect
+
+
+def _reference(
+    bits: tuple[int, ...], taps: tuple[int, ...], state: int, feedback: bool
+) -> list[int]:
+    """Bit by bit multiplicative scrambler (feedback) or descrambler."""
+    n = taps[0]
+    register = [(state >> (n - 1 - i)) & 1 for i in range(n)]
+    out = []
+    for bit in bits:
+        result = bit
+        for tap in taps:
+            result ^= register[-tap]
+        register.append(result if feedback else bit)
+        out.append(result)
+    return out
+
+
+def test_ieee_802_11_sequence() -> None:
+    scrambler = Scrambler(SCRAMBLER_POLYNOMIALS["ieee802.11"], seed=0b1111111)
+    keystream = scrambler.process(BinarySequence("0" * 127))
+
+    assert keystream.bit_string == (
+        "00001110111100101100100100000010001001100010111010110110000011001101"
+        "01001110011110110100001010101111101001010001101110001111111"
+    )
+    assert scrambler.state == 0b1111111
+
+
+@pytest.mark.parametrize("taps", [(7, 4), (58, 39), (3, 2), (2, 1), (8, 6, 5, 4)])
+@pytest.mark.parametrize("seed", [None, 0, 3])
+def test_multiplicative_matches_reference(
+    taps: tuple[int, ...], seed: int | None
+) -> None:
+    data = random_sequence(20_000, seed=3)
+    state = (1 << taps[0]) - 1 if seed is None else seed
+    scrambled = scramble(data, taps, "multiplicative", seed=seed)
+
+    assert list(scrambled.bits) == _reference(data.bits, taps, state, True)
+    assert list(descramble(scrambled, taps, "multiplicative", seed=seed).bits) == (
+        _reference(scrambled.bits, taps, state, False)
+    )
+    assert descramble(scrambled, taps, "multiplicative", seed=seed) == data
+
+
+@pytest.mark.parametrize("mode", ["additive", "multiplicative"])
+@pytest.mark.parametrize("chunk_bits", [1, 100, 4099, 300_000])
+def test_state_carries_across_chunks(mode: str, chunk_bits: int) -> None:
+    data = random_sequence(20_000 if chunk_bits == 1 else 200_000, seed=4)
+    whole = Scrambler((58, 39), mode, seed=12345)  # type: ignore[arg-type]
+    scrambler = Scrambler((58, 39), mode, seed=12345)  # type: ignore[arg-type]
+    descrambler = Descrambler((58, 39), mode, seed=12345)  # type: ignore[arg-type]
+
+    scrambled = collect(scrambler.stream(chunked(data, chunk_bits)))
+    assert scrambled == whole.process(data)
+    assert scrambler.state == whole.state
+    assert collect(descrambler.stream(chunked(scrambled, chunk_bits))) == data
+
+
+def test_descrambler_self_synchronizes() -> None:
+    data = random_sequence(10_000, seed=5)
+    scrambled = scramble(data, (7, 4), "multiplicative", seed=0b1010101)
+    recovered = Descrambler((7, 4), "multiplicative", seed=0).process(scrambled)
+
+    assert recovered[:7] != data[:7]
+    assert recovered[7:] == data[7:]
+
+
+def test_additive_needs_matching_seed() -> None:
+    data = random_sequence(1000, seed=6)
+    scrambled = scramble(data, (15, 14), seed=99)
+
+    assert descramble(scrambled, (15, 14), seed=99) == data
+    assert descramble(scrambled, (15, 14), seed=98) != data
+
+
+def test_reset() -> None:
+    data = random_sequence(500, seed=7)
+    scrambler = Scrambler((7, 4), "multiplicative", seed=3)
+    first = scrambler.process(data)
+    scrambler.process(data)
+    scrambler.reset()
+
+    assert scrambler.process(data) == first
+    assert repr(scrambler).startswith("Scrambler(poly=(7, 4), mode='multiplicative'")
+
+
+def test_invalid_arguments() -> None:
+    with pytest.raises(ValueError):
+        Scrambler((7, 4), seed=0)
+    with pytest.raises(ValueError):
+        Scrambler((7, 4), "multiplicative", seed=1 << 7)
+    with pytest.raises(ValueError):
+        Scrambler((7, 4), "convolutional")  # type: ignore[arg-type]
+    with pytest.raises(TypeError):
+        Scrambler((7, 4)).process("0101")  # type: ignore[arg-type]
@@ -0,0 +1,116 @@
+import mmap
+from pathlib import Path
+
+import pytest
+
+from bseqgen import prbs, random_sequence, storage
+from bseqgen.base import BinarySequence
+from bseqgen.lfsr import LFSR
+from bseqgen.storage import MappedSequence, SequenceLibrary, load, save
+
+
+@pytest.fixture
+def seq() -> BinarySequence:
+    return random_sequence(1001, seed=3)
+
+
+def test_save_load(tmp_path: Path, seq: BinarySequence) -> None:
+    path = tmp_path / "seq.bseq"
+    save(path, seq)
+    assert load(path) == seq
+
+    data = path.read_bytes()
+    assert data[:4] == b"BSEQ"
+    assert len(data) == 16 + 16 + (1001 + 7) // 8
+
+
+def test_library(tmp_path: Path, seq: BinarySequence) -> None:
+    path = tmp_path / "lib.bseq"
+    stored = [seq, BinarySequence("101"), prbs(7)]
+    save(path, stored)
+
+    with SequenceLibrary(path) as library:
+        assert len(library) == 3
+        assert library.lengths == [1001, 3, 127]
+        assert [m.to_sequence() for m in library] == stored
+        with pytest.raises(IndexError):
+            library[3]
+    assert load(path, index=2) == prbs(7)
+
+
+def test_save_stream(tmp_path: Path) -> None:
+    path = tmp_path / "stream.bseq"
+    save(path, [LFSR(0b10000011, seed=1).stream(5000, chunk_bits=333)])
+    assert load(path) == LFSR(0b10000011, seed=1).next_bits(5000)
+
+
+def test_mapped_sequence(tmp_path: Path, seq: BinarySequence) -> None:
+    path = tmp_path / "seq.bseq"
+    save(path, seq)
+    mapped = load(path, mapped=True)
+
+    assert isinstance(mapped, MappedSequence)
+    assert len(mapped) == 1001
+    assert mapped.ones == seq.ones
+    assert mapped[5] == seq[5]
+    assert mapped[-1] == seq[-1]
+    assert mapped[3:700] == seq[3:700]
+    assert mapped[900:3:-7] == seq[900:3:-7]
+    assert mapped[::5] == seq[::5]
+    with pytest.raises(ValueError):
+        mapped[5:5]
+
+    part = seq[13:613]
+    assert isinstance(part, BinarySequence)
+    window = mapped.window(13, 613)
+    assert window.to_sequence() == part
+    assert window.ones == part.ones
+    assert window.window(7, 20)[:] == seq[20:33]
+    assert list(window.stream(chunk_bits=64)) == [
+        seq[13 + i : min(13 + i + 64, 613)] for i in range(0, 600, 64)
+    ]
+
+    other = random_sequence(600, seed=9)
+    assert window.xor(other) == part ^ other
+    assert window.bitwise_and(other) == part & other
+    assert window.bitwise_or(other) == part | other
+    assert window.hamming_distance(other, chunk_bits=100) == other.hamming_distance(
+        part
+    )
+    assert window.hamming_distance(mapped.window(0, 600)) == part.hamming_distance(
+        mapped[:600]
+    )
+
+
+def test_invalid_file(tmp_path: Path) -> None:
+    path = tmp_path / "bad.bseq"
+    path.write_bytes(b"NOPE" + bytes(40))
+    with pytest.raises(ValueError):
+        load(path)
+    with pytest.raises(ValueError):
+        save(path, [])
+
+
+def test_invalid_file_releases_mapping(
+    tmp_path: Path, seq: BinarySequence, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    maps: list[mmap.mmap] = []
+
+    class RecordingMap(mmap.mmap):
+        def __init__(self, *args: object, **kwargs: object) -> None:
+            maps.append(self)
+
+    monkeypatch.setattr(storage.mmap, "mmap", RecordingMap)
+    path = tmp_path / "seq.bseq"
+    save(path, seq)
+    data = path.read_bytes()
+    for bad in (b"NOPE" + data[4:], data[:4] + b"\xff" + data[5:], data[:-1]):
+        path.write_bytes(bad)
+        with pytest.raises(ValueError):
+            SequenceLibrary(path)
+    path.write_bytes(data)
+    with pytest.raises(IndexError):
+        load(path, 1, mapped=True)
+
+    assert len(maps) == 4
+    assert all(m.closed for m in maps)
@@ -0,0 +1,89 @@
+import pytest
+
+from bseqgen import LFSR, random_sequence, random_stream
+from bseqgen.base import BinarySequence
+from bseqgen.stream import (
+    and_streams,
+    chunked,
+    collect,
+    count_ones,
+    from_packed,
+    invert_stream,
+    iter_packed,
+    or_streams,
+    rechunk,
+    xor_streams,
+)
+
+
+@pytest.fixture
+def seq() -> BinarySequence:
+    return random_sequence(1000, seed=1)
+
+
+def test_chunked_and_collect(seq: BinarySequence) -> None:
+    chunks = list(chunked(seq, 64))
+
+    assert [c.length for c in chunks] == [64] * 15 + [40]
+    assert collect(chunks) == seq
+
+
+def test_rechunk(seq: BinarySequence) -> None:
+    chunks = list(rechunk(chunked(seq, 7), 100))
+
+    assert [c.length for c in chunks] == [100] * 10
+    assert collect(chunks) == seq
+
+
+def test_collect_empty() -> None:
+    with pytest.raises(ValueError):
+        collect([])
+
+
+def test_count_ones(seq: BinarySequence) -> None:
+    assert count_ones(chunked(seq, 33)) == seq.ones
+
+
+def test_bitwise_streams(seq: BinarySequence) -> None:
+    other = random_sequence(1000, seed=2)
+
+    assert (
+        collect(xor_streams(chunked(seq, 10), chunked(other, 64), 128)) == seq ^ other
+    )
+    assert collect(and_streams(chunked(seq, 10), chunked(other, 3))) == seq & other
+    assert collect(or_streams(chunked(seq, 999), chunked(other, 1))) == seq | other
+    assert collect(invert_stream(chunked(seq, 64))) == ~seq
+
+
+def test_bitwise_streams_length_mismatch(seq: BinarySequence) -> None:
+    with pytest.raises(ValueError):
+        list(xor_streams(chunked(seq), chunked(seq[:999])))  # type: ignore[arg-type]
+
+
+def test_packed_round_trip(seq: BinarySequence) -> None:
+    packed = list(iter_packed(chunked(seq, 256)))
+
+    assert [len(p) for p in packed] == [32, 32, 32, 29]
+    assert collect(from_packed(packed, n_bits=1000)) == seq
+
+
+def test_iter_packed_rejects_partial_bytes(seq: BinarySequence) -> None:
+    with pytest.raises(ValueError):
+        list(iter_packed(chunked(seq, 12)))
+
+
+def test_random_stream_matches_random_sequence() -> None:
+    chunks = list(random_stream(1000, chunk_bits=96, seed=7))
+
+    assert chunks[-1].length == 1000 % 96
+    assert collect(chunks) == random_sequence(1000, seed=7)
+
+
+def test_random_stream_endless() -> None:
+    stream = random_stream(None, chunk_bits=8)
+    assert all(next(stream).length == 8 for _ in range(5))
+
+
+def test_lfsr_stream() -> None:
+    expected = LFSR((9, 5)).next_bits(2000)
+    assert collect(LFSR((9, 5)).stream(2000, chunk_bits=300)) == expected
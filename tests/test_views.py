@@ -0,0 +1,157 @@
+from pathlib import Path
+
+import pytest
+
+from bseqgen import m_sequence, random_sequence
+from bseqgen.base import BinarySequence
+from bseqgen.storage import load, save
+from bseqgen.stream import collect
+from bseqgen.views import (
+    BitOpView,
+    InvertView,
+    PeriodicView,
+    RotatedView,
+    SequenceView,
+    SliceView,
+    SourceView,
+    lazy,
+)
+
+
+@pytest.fixture
+def seq() -> BinarySequence:
+    return random_sequence(1000, seed=1)
+
+
+def test_source_view(seq: BinarySequence) -> None:
+    view = seq.lazy()
+
+    assert isinstance(view, SourceView)
+    assert view.source is seq
+    assert len(view) == view.length == 1000
+    assert view.to_sequence() == seq
+    assert view.ones == seq.ones
+    assert [view[i] for i in (0, 1, -1)] == [seq[0], seq[1], seq[-1]]
+    with pytest.raises(IndexError):
+        view[1000]
+
+
+@pytest.mark.parametrize("n", [1, 999, 1000, 1001, 12345])
+def test_periodic_view(seq: BinarySequence, n: int) -> None:
+    view = seq.lazy().to_length(n)
+
+    assert isinstance(view, PeriodicView)
+    assert view.to_sequence() == seq.to_length(n)
+    assert view.ones == seq.to_length(n).ones
+    assert collect(view.stream(64)) == seq.to_length(n)
+
+
+@pytest.mark.parametrize("k", [0, 1, 500, 999, -3, 2001])
+@pytest.mark.parametrize("direction", ["left", "right"])
+def test_rotated_view(seq: BinarySequence, k: int, direction: str) -> None:
+    view = seq.lazy().shift(k, direction)  # type: ignore[arg-type]
+    expected = seq.shift(k, direction)  # type: ignore[arg-type]
+
+    assert view.to_sequence() == expected
+    assert view.ones == expected.ones
+    assert view.shift(7).to_sequence() == expected.shift(7)
+
+
+def test_slice_view(seq: BinarySequence) -> None:
+    view = seq.lazy()[100:900]
+    assert isinstance(view, SliceView)
+    inner = view[50:60]
+
+    assert view.to_sequence() == seq[100:900]
+    assert inner.to_sequence() == seq[150:160]  # type: ignore[union-attr]
+    assert view[::7] == seq[100:900:7]  # type: ignore[index]
+    assert seq.lazy()[::-3] == seq[::-3]
+    with pytest.raises(ValueError):
+        seq.lazy()[5:5]
+
+
+def test_bitwise_expressions(seq: BinarySequence) -> None:
+    other = random_sequence(1000, seed=2)
+    view = (seq.lazy() ^ other) & ~other.lazy().shift(3) | seq
+
+    assert isinstance(view, BitOpView)
+    assert view.to_sequence() == ((seq ^ other) & ~other.shift(3)) | seq
+    mixed: object = other ^ seq.lazy()
+    assert isinstance(mixed, BitOpView)
+    assert mixed.to_sequence() == seq ^ other
+    assert seq.lazy().hamming_distance(other) == seq.hamming_distance(other)
+    with pytest.raises(ValueError):
+        seq.lazy() ^ random_sequence(10)
+    with pytest.raises(TypeError):
+        seq.lazy() ^ "1010"  # type: ignore[operator]
+
+
+def test_inverted(seq: BinarySequence) -> None:
+    view = ~seq.lazy()
+
+    assert isinstance(view, InvertView)
+    assert view.to_sequence() == ~seq
+    assert view.ones == seq.zeros
+    assert view.zeros == seq.ones
+    assert isinstance(~view, SourceView)
+
+
+def test_chain_matches_eager() -> None:
+    code = m_sequence((7, 6))
+    other = random_sequence(5000, seed=3)
+    view = code.lazy().to_length(5000).shift(41) ^ other
+    eager = code.to_length(5000).shift(41) ^ other
+
+    assert view.to_sequence() == eager
+    assert view.ones == eager.ones
+    assert view[1234:4321].to_sequence() == eager[1234:4321]  # type: ignore[union-attr]
+
+
+def test_to_numpy(seq: BinarySequence) -> None:
+    np = pytest.importorskip("numpy")
+    view = seq.lazy().to_length(3001) ^ random_sequence(3001, seed=5)
+    eager = view.to_sequence()
+
+    assert np.array_equal(view.to_numpy(), eager.to_numpy())
+    assert view.to_numpy(packed=True).tobytes() == eager.packed_bytes
+
+
+def test_long_periodic_extension_is_lazy() -> None:
+    code = m_sequence((15, 14))
+    view = code.lazy().to_length(10**9)
+
+    # 2^14 ones per period, then the leading bits of the last partial period
+    full, rest = divmod(10**9, code.length)
+    assert view.ones == full * code.ones + code[:rest].ones  # type: ignore[union-attr]
+    assert view[10**9 - 1] == code[(10**9 - 1) % code.length]
+    tail = view[-5:]
+    assert isinstance(tail, SliceView)
+    assert tail.to_sequence().bits == tuple(
+        code[i % code.length] for i in range(10**9 - 5, 10**9)
+    )
+
+
+def test_mapped_source(tmp_path: Path, seq: BinarySequence) -> None:
+    path = tmp_path / "seq.bseq"
+    save(path, seq)
+    mapped = load(path, mapped=True)
+    view = lazy(mapped).shift(10) ^ seq
+
+    assert view.to_sequence() == seq.shift(10) ^ seq
+    assert lazy(view) is view
+    with pytest.raises(TypeError):
+        lazy("1010")  # type: ignore[arg-type]
+
+
+def test_invalid_length(seq: BinarySequence) -> None:
+    with pytest.raises(ValueError):
+        seq.lazy().to_length(0)
+    assert isinstance(RotatedView(seq.lazy(), 1001), RotatedView)
+
+
+def test_views_must_implement_read() -> None:
+    class Unreadable(SequenceView):
+        __slots__ = ()
+
+    with pytest.raises(TypeError):
+        Unreadable()  # type: ignore[abstract]
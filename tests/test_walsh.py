@@ -0,0 +1,73 @@
+import pytest
+
+from bseqgen.base import BinarySequence
+from bseqgen.walsh import fwht, walsh_code, walsh_spectrum
+
+
+def _hadamard_entry(i: int, j: int) -> int:
+    return -1 if (i & j).bit_count() % 2 else 1
+
+
+def test_walsh_code_sylvester_matches_hadamard() -> None:
+    for i in range(16):
+        row = walsh_code(i, 16)
+        assert row.signed == tuple(_hadamard_entry(i, j) for j in range(16))
+
+
+def test_walsh_code_sequency_order() -> None:
+    for k in range(32):
+        code = walsh_code(k, 32, "sequency")
+        assert len(code.run_lengths) - 1 == k
+
+
+def test_walsh_codes_orthogonal() -> None:
+    a, b = walsh_code(3, 64), walsh_code(17, 64)
+    assert a.crosscorr(b)[0] == 0
+
+
+def test_walsh_code_invalid() -> None:
+    with pytest.raises(ValueError):
+        walsh_code(0, 12)
+    with pytest.raises(ValueError):
+        walsh_code(8, 8)
+
+
+def test_fwht_list_in_place() -> None:
+    values = [1, 0, 1, 0, 0, 1, 1, 0]
+    expected = [
+        sum(_hadamard_entry(i, j) * v for j, v in enumerate(values)) for i in range(8)
+    ]
+    result = fwht(values)
+
+    assert result is values
+    assert values == expected
+
+
+def test_fwht_numpy_matches_list() -> None:
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(1)
+    data = rng.normal(size=(3, 64))
+    expected = [fwht(row.tolist()) for row in data]
+
+    result = fwht(data)
+    assert result is data
+    assert np.allclose(data, expected)
+
+
+def test_fwht_numpy_requires_contiguous() -> None:
+    np = pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        fwht(np.zeros((8, 8))[:, ::2])
+
+
+def test_walsh_spectrum_despreads() -> None:
+    code = walsh_code(5, 32)
+    spectrum = walsh_spectrum(code)
+    assert spectrum[5] == 32
+    assert all(value == 0 for k, value in enumerate(spectrum) if k != 5)
+
+
+def test_walsh_spectrum_inverted_code() -> None:
+    spectrum = walsh_spectrum(~walsh_code(9, 16))
+    assert spectrum[9] == -16
+    assert isinstance(walsh_code(9, 16), BinarySequence)